@@ -0,0 +1,104 @@
+"""
+Measure the per-call cost of turning tool arguments into a request: the previous per-call routing
+(regex over the path, string replaces, name-based special cases) against the plans compiled at startup.
+
+Usage:
+    uv run python benchmarks/bench_plans.py [--calls 100000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.tools.definitions import TOOLS_DEFINITION  # noqa: E402
+from src.tools.plans import compile_plan  # noqa: E402
+
+CALLS = [
+    ("get_agent", {"id": "agent_1"}),
+    ("query_agent", {"id": "agent_1", "query": "Hello", "conversationId": "c1", "streaming": False}),
+    ("toggle_webhook", {"id": "agent_1", "type": "zapi", "enabled": True}),
+    ("search_artifacts", {"q": "shoes", "ids": ["1", "2", "3"], "mediaTypes": ["IMAGE"]}),
+    ("get_conversation_messages", {"conversationId": "c1", "count": 50}),
+    ("get_models", {}),
+]
+
+
+def legacy_request(name: str, arguments: dict, token: str) -> tuple:
+    """Request building as call_tool did it before plans, kept here as the baseline."""
+    tool_info = TOOLS_DEFINITION[name]
+    method = tool_info["method"]
+    path = tool_info["path"]
+    args_copy = arguments.copy()
+    for var in re.findall(r"\{(\w+)\}", path):
+        if var in args_copy:
+            path = path.replace(f"{{{var}}}", str(args_copy.pop(var)))
+    query_params = {}
+    json_body = {}
+    if name == "toggle_webhook":
+        if "type" in args_copy:
+            query_params["type"] = args_copy.pop("type")
+        if "enabled" in args_copy:
+            query_params["enabled"] = str(args_copy.pop("enabled")).lower()
+    if name == "search_artifacts":
+        for key in ["ids", "categoryIds", "mediaTypes"]:
+            if key in args_copy and isinstance(args_copy[key], list):
+                args_copy[key] = ",".join(map(str, args_copy[key]))
+    if method == "GET":
+        query_params.update(args_copy)
+    else:
+        json_body.update(args_copy)
+    headers = {"Content-Type": "application/json"}
+    if name != "get_models":
+        headers["Authorization"] = f"Bearer {token}"
+    upload = name == "upload_artifact_media" or (name == "create_datasource" and arguments.get("type") == "file")
+    return method, path, query_params, json_body, headers, upload
+
+
+def planned_request(plans: dict, name: str, arguments: dict, token: str) -> tuple:
+    plan = plans[name]
+    path, query_params, json_body = plan.fill(arguments)
+    headers = {"Content-Type": "application/json"}
+    if plan.auth:
+        headers["Authorization"] = f"Bearer {token}"
+    return plan.method, path, query_params, json_body, headers, plan.is_upload(arguments)
+
+
+def timed(fn, calls: int, repeat: int = 5) -> float:
+    """Best of `repeat` runs, in nanoseconds per call."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for i in range(calls):
+            name, arguments = CALLS[i % len(CALLS)]
+            fn(name, arguments, "token")
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e9
+
+
+def main(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    plans = {name: compile_plan(info) for name, info in TOOLS_DEFINITION.items()}
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    for name, arguments in CALLS:
+        # Both paths must build the same request
+        assert legacy_request(name, arguments, "t") == planned_request(plans, name, arguments, "t"), name
+
+    legacy = timed(legacy_request, args.calls)
+    planned = timed(lambda name, arguments, token: planned_request(plans, name, arguments, token), args.calls)
+
+    print(f"Compiled {len(plans)} plans in {compile_ms:.2f} ms; {args.calls} calls over {len(CALLS)} tools")
+    print(f"{'routing':<10}{'ns/call':>10}")
+    print(f"{'legacy':<10}{legacy:>10.0f}")
+    print(f"{'plans':<10}{planned:>10.0f}")
+    print(f"per-call overhead reduced by {(1 - planned / legacy) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000)
+    main(parser.parse_args())
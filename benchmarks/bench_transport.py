@@ -0,0 +1,151 @@
+"""
+Compare HTTP/1.1 and HTTP/2 upstream transports against a local mock Chatvolt API.
+
+Usage:
+    uv run --with hypercorn --with h2 python benchmarks/bench_transport.py [--requests 2000] [--concurrency 200]
+
+The mock upstream is served by hypercorn over cleartext, so the HTTP/2 mode uses prior knowledge (h2c).
+The response cache is disabled and every call asks for a different agent, so each call is one upstream request.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hypercorn.asyncio import serve  # noqa: E402
+from hypercorn.config import Config  # noqa: E402
+
+from src.tools import loader  # noqa: E402
+from src.tools.cache import ResponseCache  # noqa: E402
+from src.tools.http_client import UpstreamClient  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_mock_upstream(latency: float, requests):
+    body = json.dumps({"id": "agent", "name": "Benchmark Agent"}).encode()
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        with requests.get_lock():
+            requests.value += 1
+        await asyncio.sleep(latency)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def run_mock_upstream(port: int, latency: float, requests) -> None:
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.loglevel = "ERROR"
+    asyncio.run(serve(make_mock_upstream(latency, requests), config))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_mode(name: str, upstream: UpstreamClient, total: int, concurrency: int, requests) -> dict:
+    registry = loader.ToolRegistry()
+    registry.http = upstream
+    # Measure the transport, not cache hits or coalesced requests
+    registry.cache = ResponseCache(0)
+    calls = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+    peak_connections = 0
+
+    async def one_call():
+        nonlocal calls, errors, peak_connections
+        calls += 1
+        agent_id = f"agent_{calls}"
+        async with semaphore:
+            started = time.perf_counter()
+            result = await registry.call_tool("get_agent", {"id": agent_id})
+            errors += '"error": true' in result[0].text
+            latencies.append(time.perf_counter() - started)
+            peak_connections = max(peak_connections, upstream.stats()["connections"])
+
+    async with upstream:
+        # Warm up the pool so both modes start from established connections
+        await asyncio.gather(*(one_call() for _ in range(concurrency)))
+        latencies.clear()
+        errors = 0
+        sent_before = requests.value
+        started = time.perf_counter()
+        await asyncio.gather(*(one_call() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+        sent = requests.value - sent_before
+    assert sent == total, f"{name}: {sent} upstream requests for {total} calls"
+
+    return {
+        "mode": name,
+        "throughput": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "connections": peak_connections,
+        "errors": errors,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    # The mock upstream runs in its own process so it does not compete with the client for the event loop
+    port = _free_port()
+    requests = multiprocessing.Value("q", 0)
+    server = multiprocessing.Process(target=run_mock_upstream, args=(port, args.latency, requests), daemon=True)
+    server.start()
+    await asyncio.sleep(1.0)
+
+    loader.CHATVOLT_BASE_URL = f"http://127.0.0.1:{port}"
+    modes = [
+        ("http/1.1", UpstreamClient(max_connections=args.max_connections)),
+        ("http/2", UpstreamClient(max_connections=args.max_connections, http2=True, http1=False)),
+    ]
+    results = [await run_mode(name, upstream, args.requests, args.concurrency, requests) for name, upstream in modes]
+
+    server.terminate()
+    server.join()
+
+    print(
+        f"{args.requests} get_agent calls, concurrency {args.concurrency}, upstream latency {args.latency * 1000:.0f} ms"
+    )
+    print(f"{'mode':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'conns':>8}{'errors':>8}")
+    for r in results:
+        print(
+            f"{r['mode']:<10}{r['throughput']:>10.0f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+            f"{r['max_ms']:>10.1f}{r['connections']:>8}{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock upstream latency in seconds")
+    parser.add_argument("--max-connections", type=int, default=100)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,92 @@
+"""
+Microbenchmark of argument validation: the previous top-level type checks against the schema validators
+compiled at startup, which also check enums, nested objects, array items and fill defaults.
+
+Usage:
+    uv run python benchmarks/bench_validation.py [--calls 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.tools.definitions import TOOLS_DEFINITION  # noqa: E402
+from src.tools.validation import SchemaValidator  # noqa: E402
+
+CASES = [
+    ("valid flat", "get_agent", {"id": "agent_1"}),
+    (
+        "valid nested",
+        "query_agent",
+        {
+            "id": "agent_1",
+            "query": "Where is my order?",
+            "contact": {"email": "ana@example.com", "firstName": "Ana"},
+            "filters": {"custom_ids": ["a", "b", "c"], "datasource_ids": ["d"]},
+            "temperature": 0.2,
+        },
+    ),
+    ("bad enum", "toggle_webhook", {"id": "agent_1", "type": "sms", "enabled": True}),
+    ("bad nested", "query_agent", {"id": "agent_1", "query": "hi", "filters": {"custom_ids": "a"}}),
+]
+
+
+def legacy_validate(schema: dict, arguments: dict) -> list[str] | None:
+    """Top-level type checks as the loader did them before compiled validators, kept as the baseline."""
+    errors = []
+    properties = schema.get("properties", {})
+    for req_field in schema.get("required", []):
+        if req_field not in arguments:
+            errors.append(f"Missing required field: {req_field}")
+    for field, value in arguments.items():
+        if field not in properties:
+            continue
+        field_type = properties[field].get("type")
+        if field_type == "string" and not isinstance(value, str):
+            errors.append(f"Field '{field}' must be a string")
+        elif field_type == "integer" and not isinstance(value, int):
+            errors.append(f"Field '{field}' must be an integer")
+        elif field_type == "number" and not isinstance(value, (int, float)):
+            errors.append(f"Field '{field}' must be a number")
+        elif field_type == "boolean" and not isinstance(value, bool):
+            errors.append(f"Field '{field}' must be a boolean")
+        elif field_type == "array" and not isinstance(value, list):
+            errors.append(f"Field '{field}' must be an array")
+    return errors if errors else None
+
+
+def timed(fn, calls: int, repeat: int = 5) -> float:
+    """Best of `repeat` runs, in nanoseconds per call."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1e9
+
+
+def main(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    validators = {name: SchemaValidator(info["input_schema"]) for name, info in TOOLS_DEFINITION.items()}
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    print(f"Compiled {len(validators)} validators in {compile_ms:.2f} ms; {args.calls} calls per case")
+    print(f"{'case':<14}{'legacy ns':>11}{'compiled ns':>13}  {'legacy':<10}{'compiled'}")
+    for label, name, arguments in CASES:
+        schema = TOOLS_DEFINITION[name]["input_schema"]
+        validator = validators[name]
+        legacy = timed(lambda schema=schema, arguments=arguments: legacy_validate(schema, arguments), args.calls)
+        compiled = timed(lambda validator=validator, arguments=arguments: validator.errors(arguments), args.calls)
+        legacy_verdict = "rejects" if legacy_validate(schema, arguments) else "accepts"
+        compiled_verdict = "rejects" if validator.errors(arguments) else "accepts"
+        print(f"{label:<14}{legacy:>11.0f}{compiled:>13.0f}  {legacy_verdict:<10}{compiled_verdict}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100000)
+    main(parser.parse_args())
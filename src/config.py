@@ -1,4 +1,5 @@
 import os
+import tempfile
 from contextvars import ContextVar
 
 from dotenv import load_dotenv
@@ -8,7 +9,70 @@ load_dotenv()
 CHATVOLT_API_KEY = os.getenv("CHATVOLT_API_KEY")
 CHATVOLT_BASE_URL = os.getenv("CHATVOLT_BASE_URL", "https://api.chatvolt.ai")
 
+# Upstream connection pool shared by every tool call
+HTTP_MAX_CONNECTIONS = int(os.getenv("CHATVOLT_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("CHATVOLT_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("CHATVOLT_HTTP_KEEPALIVE_EXPIRY", "30.0"))
+# Seconds an attempt may wait for a free pooled connection (separate from the connect timeout)
+HTTP_POOL_TIMEOUT = float(os.getenv("CHATVOLT_HTTP_POOL_TIMEOUT", "30.0"))
+# Opt-in HTTP/2 multiplexing (requires the `h2` package, falls back to HTTP/1.1 otherwise)
+HTTP2_ENABLED = os.getenv("CHATVOLT_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Read-through cache for read-only tools (set CHATVOLT_CACHE_MAX_BYTES=0 to disable)
+CACHE_MAX_BYTES = int(os.getenv("CHATVOLT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+CACHE_DEFAULT_TTL = float(os.getenv("CHATVOLT_CACHE_TTL", "60.0"))
+
+# Adaptive (AIMD) concurrency limit in front of the Chatvolt API; over HTTP/1.1 the maximum is capped at
+# CHATVOLT_HTTP_MAX_CONNECTIONS so admitted requests do not queue for a pooled connection
+CONCURRENCY_INITIAL_LIMIT = int(os.getenv("CHATVOLT_CONCURRENCY_INITIAL_LIMIT", "20"))
+CONCURRENCY_MIN_LIMIT = int(os.getenv("CHATVOLT_CONCURRENCY_MIN_LIMIT", "2"))
+CONCURRENCY_MAX_LIMIT = int(os.getenv("CHATVOLT_CONCURRENCY_MAX_LIMIT", "100"))
+CONCURRENCY_QUEUE_TIMEOUT = float(os.getenv("CHATVOLT_CONCURRENCY_QUEUE_TIMEOUT", "30.0"))
+
+# Per-token request rate (requests/second, 0 = unlimited); a 429 pauses the token's bucket either way
+RATE_LIMIT_PER_TOKEN = float(os.getenv("CHATVOLT_RATE_LIMIT", "0"))
+RATE_LIMIT_BURST = int(os.getenv("CHATVOLT_RATE_LIMIT_BURST", "10"))
+
+# Messages/second per Z-API instance for zapi_bulk_send (0 = unlimited)
+ZAPI_SEND_RATE = float(os.getenv("CHATVOLT_ZAPI_SEND_RATE", "5"))
+
+# Circuit breakers per upstream path family
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("CHATVOLT_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RECOVERY_TIMEOUT = float(os.getenv("CHATVOLT_BREAKER_RECOVERY_TIMEOUT", "30.0"))
+
+# Hedged requests for read-only tools: fire a second request after the given latency percentile
+HEDGING_ENABLED = os.getenv("CHATVOLT_HEDGING", "false").lower() in ("1", "true", "yes")
+HEDGE_PERCENTILE = float(os.getenv("CHATVOLT_HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_DELAY = float(os.getenv("CHATVOLT_HEDGE_MIN_DELAY", "0.05"))
+
+# File uploads are streamed from disk in chunks of this many bytes
+UPLOAD_CHUNK_SIZE = int(os.getenv("CHATVOLT_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+# Resumable datasource uploads: directory of the local transfer journal (empty = disabled)
+UPLOAD_JOURNAL_DIR = os.getenv("CHATVOLT_UPLOAD_JOURNAL_DIR", "")
+# Seconds a journal entry is kept after its last update; older entries are ignored and pruned
+UPLOAD_JOURNAL_TTL = float(os.getenv("CHATVOLT_UPLOAD_JOURNAL_TTL", "3600"))
+# Skip re-uploading identical artifact media; the hash -> media ID index is persisted if a file is set
+MEDIA_DEDUP_ENABLED = os.getenv("CHATVOLT_MEDIA_DEDUP", "true").lower() in ("1", "true", "yes")
+MEDIA_INDEX_FILE = os.getenv("CHATVOLT_MEDIA_INDEX_FILE", "")
+
+# Default directory for files written by export tools
+EXPORT_DIR = os.getenv("CHATVOLT_EXPORT_DIR", os.path.join(tempfile.gettempdir(), "chatvolt-exports"))
+# Directory for the per-row result logs of import_contacts
+IMPORT_LOG_DIR = os.getenv("CHATVOLT_IMPORT_LOG_DIR", os.path.join(tempfile.gettempdir(), "chatvolt-imports"))
+
+# Answer MCP requests with a single JSON body; set to false to reply over SSE so progress
+# notifications (e.g. streamed query_agent chunks) reach the client while the call runs
+JSON_RESPONSE = os.getenv("CHATVOLT_JSON_RESPONSE", "true").lower() in ("1", "true", "yes")
+
+# Tool profile this process loads: a name from src/tools/profiles.py or a comma-separated list of
+# profiles and definition modules (e.g. "crm,zapi"); requests may narrow it further
+TOOL_PROFILE = os.getenv("CHATVOLT_TOOL_PROFILE", "full")
+
+# List only a small core set plus search_tools in tools/list; every other tool is found through search_tools
+TOOL_SEARCH = os.getenv("CHATVOLT_TOOL_SEARCH", "false").lower() in ("1", "true", "yes")
+
 _request_auth_token: ContextVar[str | None] = ContextVar("request_auth_token", default=None)
+_request_tool_profile: ContextVar[str | None] = ContextVar("request_tool_profile", default=None)
 
 
 def set_request_auth_token(token: str | None) -> None:
@@ -16,6 +80,15 @@ def set_request_auth_token(token: str | None) -> None:
     _request_auth_token.set(token)
 
 
+def set_request_tool_profile(profile: str | None) -> None:
+    """Set the tool profile selected by the current HTTP request (header or URL path)."""
+    _request_tool_profile.set(profile)
+
+
+def get_request_tool_profile() -> str | None:
+    return _request_tool_profile.get()
+
+
 def get_auth_token() -> str | None:
     """Get the bearer token. Priority: HTTP request token > CHATVOLT_API_KEY from env."""
     request_token = _request_auth_token.get()
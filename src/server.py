@@ -1,19 +1,25 @@
+import asyncio
 import contextlib
+import json
 import logging
 from collections.abc import AsyncIterator
 
 import mcp.types as types
 from mcp.server import Server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
-from src.config import set_request_auth_token
+from src.config import JSON_RESPONSE, get_request_tool_profile, set_request_auth_token, set_request_tool_profile
 from src.prompts.workflows import PROMPTS, get_prompt_message
-from src.tools.definitions import TOOLS_DEFINITION
+from src.tools.export import EXPORT_URI_PREFIX, export_path
 from src.tools.loader import registry
+from src.tools.streaming import ProgressCallback
 
 logger = logging.getLogger("chatvolt-mcp")
 
@@ -106,7 +112,10 @@ async def handle_read_resource(uri: str) -> str | bytes:
         return json.dumps({"note": "Use the get_models tool to retrieve available models and pricing"})
     elif uri == "chatvolt://tools":
         tools_info = {}
-        for name, info in TOOLS_DEFINITION.items():
+        view = registry.visible_tools(get_request_tool_profile())
+        for name, info in registry.tools.items():
+            if view is not None and name not in view:
+                continue
             tools_info[name] = {
                 "method": info["method"],
                 "path": info["path"],
@@ -125,10 +134,21 @@ async def handle_read_resource(uri: str) -> str | bytes:
                 ],
             }
         return json.dumps(prompts_info, indent=2)
+    elif uri.startswith(EXPORT_URI_PREFIX):
+        try:
+            path = export_path(uri.removeprefix(EXPORT_URI_PREFIX))
+            return await asyncio.to_thread(_read_text, path)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Unknown resource: {uri}") from e
     else:
         raise ValueError(f"Unknown resource: {uri}")
 
 
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
 @app.list_resource_templates()
 async def handle_list_resource_templates() -> list[types.ResourceTemplate]:
     """List resource templates."""
@@ -163,6 +183,12 @@ async def handle_list_resource_templates() -> list[types.ResourceTemplate]:
             description="Get detailed information about a specific datastore",
             mimeType="application/json",
         ),
+        types.ResourceTemplate(
+            uriTemplate=EXPORT_URI_PREFIX + "{name}",
+            name="Conversation Export",
+            description="Read a JSONL file written by export_conversations",
+            mimeType="application/jsonl",
+        ),
     ]
 
 
@@ -348,7 +374,37 @@ async def handle_call_tool(
     name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution requests."""
-    return await registry.call_tool(name, arguments or {})
+    return await registry.call_tool(name, arguments or {}, progress=_progress_notifier(name))
+
+
+def _progress_notifier(tool_name: str) -> ProgressCallback | None:
+    """
+    Relay intermediate tool output to the client: as progress notifications when the request
+    carries a progressToken, otherwise as log messages tied to the request.
+    """
+    try:
+        ctx = app.request_context
+    except LookupError:
+        return None
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+
+    async def notify(message: str, progress: float, total: float | None) -> None:
+        try:
+            if progress_token is not None:
+                await ctx.session.send_progress_notification(
+                    progress_token, progress, total=total, message=message, related_request_id=ctx.request_id
+                )
+            else:
+                await ctx.session.send_log_message(
+                    "info",
+                    {"tool": tool_name, "chunk": message},
+                    logger="chatvolt-mcp",
+                    related_request_id=ctx.request_id,
+                )
+        except Exception:
+            pass
+
+    return notify
 
 
 # --- Prompts ---
@@ -370,30 +426,120 @@ async def handle_get_prompt(name: str, arguments: dict[str, str] | None) -> type
 # - stateless: no session tracking, each request is independent
 # - json_response: returns JSON body directly (not SSE stream)
 # This is what Gemini CLI (antigravity-client) expects.
+# With CHATVOLT_JSON_RESPONSE=false responses are sent as SSE, which also carries progress notifications.
 session_manager = StreamableHTTPSessionManager(
     app=app,
-    json_response=True,
+    json_response=JSON_RESPONSE,
     stateless=True,
 )
 
 
 @contextlib.asynccontextmanager
 async def lifespan(starlette_app: Starlette) -> AsyncIterator[None]:
-    async with session_manager.run():
+    async with registry.http, session_manager.run():
         yield
 
 
+async def handle_metrics(request: Request) -> JSONResponse:
+    """Expose upstream transport metrics (connection pool usage, etc.)."""
+    return JSONResponse(registry.stats())
+
+
+def _tool_list_request_id(body: bytes) -> str | int | None:
+    """The ID of a plain tools/list JSON-RPC request (no cursor), or None for anything else."""
+    if b'"tools/list"' not in body:
+        return None
+    try:
+        message = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or message.get("method") != "tools/list":
+        return None
+    params = message.get("params")
+    if params is not None and (not isinstance(params, dict) or params.get("cursor") is not None):
+        return None
+    request_id = message.get("id")
+    return request_id if isinstance(request_id, str | int) and not isinstance(request_id, bool) else None
+
+
+def _is_tool_list_candidate(headers: list[tuple[bytes, bytes]]) -> bool:
+    """A JSON POST whose protocol version, if given, is one the MCP transport would accept."""
+    content_type = next((v for k, v in headers if k.lower() == b"content-type"), b"")
+    version = next((v for k, v in headers if k.lower() == b"mcp-protocol-version"), None)
+    return content_type.startswith(b"application/json") and (
+        version is None or version.decode("latin-1") in SUPPORTED_PROTOCOL_VERSIONS
+    )
+
+
+def _tool_profile(scope, headers: list[tuple[bytes, bytes]]) -> tuple[str | None, int]:
+    """
+    The tool profile a request selects, with the status to answer if it is unknown: the URL path
+    (/mcp/<profile>, /sse/<profile>) wins over the X-Chatvolt-Profile header.
+    """
+    _, _, profile = scope.get("path", "").strip("/").partition("/")
+    if profile:
+        return profile, 404
+    header = next((v for k, v in headers if k.lower() == b"x-chatvolt-profile"), b"").decode("latin-1").strip()
+    return header or None, 400
+
+
+async def _serve_tool_list(scope, receive, send):
+    """
+    Answer a plain tools/list POST with the pre-encoded response, skipping the MCP session entirely.
+    Returns a receive callable that replays the consumed body when the request is something else.
+    """
+    messages = []
+    body = b""
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        body += message.get("body", b"")
+        if not message.get("more_body", False):
+            break
+
+    request_id = _tool_list_request_id(body)
+    if request_id is not None:
+        catalog = registry.tool_catalog()
+        response = Response(
+            catalog.response(request_id), media_type="application/json", headers={"ETag": f'"{catalog.hash}"'}
+        )
+        await response(scope, receive, send)
+        return None
+
+    async def replay():
+        return messages.pop(0) if messages else await receive()
+
+    return replay
+
+
 class MCPApp:
     """
     Raw ASGI app for the /sse endpoint.
     Injects Accept header before delegating to StreamableHTTPSessionManager.
     Extracts and stores Authorization header for request-scoped access.
+    A tool profile from the URL path or X-Chatvolt-Profile header narrows the tools the request sees.
+    In JSON response mode, plain tools/list requests are answered from the pre-encoded tool catalog.
     """
 
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
             headers = list(scope.get("headers", []))
 
+            profile, unknown_status = _tool_profile(scope, headers)
+            try:
+                registry.visible_tools(profile)
+            except ValueError as exc:
+                await JSONResponse({"error": str(exc)}, status_code=unknown_status)(scope, receive, send)
+                return
+            set_request_tool_profile(profile)
+
+            if JSON_RESPONSE and scope.get("method") == "POST" and _is_tool_list_candidate(headers):
+                receive = await _serve_tool_list(scope, receive, send)
+                if receive is None:
+                    return
+
             auth_values = [v for k, v in headers if k.lower() == b"authorization"]
             if auth_values:
                 auth_header = auth_values[0].decode("utf-8")
@@ -426,6 +572,7 @@ starlette_app = Starlette(
         # We strip trailing slashes manually in MCPApp so no 307 redirect occurs.
         # The MCP SDK's handle_request doesn't care about path.
         Route("/sse", endpoint=lambda req: None),  # placeholder for OpenAPI
+        Route("/metrics", endpoint=handle_metrics, methods=["GET"]),
     ],
     middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
 )
@@ -434,13 +581,17 @@ starlette_app = Starlette(
 _inner = starlette_app
 
 _MCP_PATHS = {"/sse", "/mcp", "/", ""}
+# /mcp/<profile> and /sse/<profile> serve the same endpoint with a tool profile selected
+_MCP_PROFILE_PREFIXES = ("/sse/", "/mcp/")
+
 
 class RootApp:
-    """Routes /sse, /mcp and / (root) to MCPApp, everything else to Starlette."""
+    """Routes /sse, /mcp (optionally /<profile>) and / (root) to MCPApp, everything else to Starlette."""
+
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
             path = scope.get("path", "").rstrip("/")
-            if path in _MCP_PATHS:
+            if path in _MCP_PATHS or path.startswith(_MCP_PROFILE_PREFIXES):
                 await mcp_app(scope, receive, send)
                 return
         elif scope["type"] == "lifespan":
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+MAX_BATCH_CALLS = 100
+DEFAULT_BATCH_CONCURRENCY = 10
+
+
+async def batch_call(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Run several tool calls with bounded concurrency. Each call goes through the registry as usual
+    (pooled client, cache, limiter, breakers); results come back in request order.
+    """
+    calls = arguments["calls"]
+    if len(calls) > MAX_BATCH_CALLS:
+        return False, error_text(400, f"batch_call accepts at most {MAX_BATCH_CALLS} calls, got {len(calls)}")
+    semaphore = asyncio.Semaphore(max(1, arguments.get("max_concurrency", DEFAULT_BATCH_CONCURRENCY)))
+    done = 0
+
+    async def run(call: Any) -> dict[str, Any]:
+        nonlocal done
+        name = call.get("name") if isinstance(call, dict) else None
+        call_args = call.get("arguments", {}) if isinstance(call, dict) else None
+        if not isinstance(name, str) or not isinstance(call_args, dict):
+            text = error_text(400, "Each call needs a 'name' string and an optional 'arguments' object")
+        elif name in registry.local_tools:
+            text = error_text(400, f"{name} cannot be called from batch_call")
+        else:
+            async with semaphore:
+                result = await registry.call_tool(name, call_args)
+            text = result[0].text
+        done += 1
+        if progress is not None:
+            await progress(f"{done}/{len(calls)} calls finished", done, len(calls))
+        return {"name": name, "ok": not is_error(text), "result": parse_text(text)}
+
+    results = await asyncio.gather(*(run(call) for call in calls))
+    failed = sum(1 for item in results if not item["ok"])
+    return True, json.dumps({"results": results, "succeeded": len(results) - failed, "failed": failed})
+
+
+TOOLS = {
+    "batch_call": {
+        "handler": batch_call,
+        "description": (
+            "Run up to 100 tool calls in one request, e.g. fetching many conversations at once. "
+            "Calls run concurrently and results are returned in the same order; a failed call yields "
+            "its structured error without affecting the others."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    # No "required" here: a malformed call gets its own error instead of failing the batch
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Name of the tool"},
+                            "arguments": {"type": "object", "description": "Arguments for the tool"},
+                        },
+                    },
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "default": DEFAULT_BATCH_CONCURRENCY,
+                    "description": "Maximum number of calls running at the same time",
+                },
+            },
+            "required": ["calls"],
+        },
+    },
+}
@@ -0,0 +1,90 @@
+import re
+import time
+from typing import Any
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def breaker_key(tool_info: dict[str, Any]) -> str:
+    """
+    Group a tool into an upstream family by its path prefix, e.g. `/zapi/{instanceId}/send-text` -> `/zapi`.
+    Definitions can override the family with a "circuit_breaker" entry.
+    """
+    if "circuit_breaker" in tool_info:
+        return tool_info["circuit_breaker"]
+    segments = [s for s in re.sub(r"\{\w+\}", "*", tool_info["path"]).split("/") if s]
+    # "/api/..." is a shared namespace, so keep the next segment as well
+    prefix = segments[:2] if segments and segments[0] == "api" else segments[:1]
+    return "/" + "/".join(prefix)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream family.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls fail fast. Once
+    `recovery_timeout` has passed it turns half-open and lets a single probe through: a success closes
+    it again, a failure re-opens it. A probe that never reports back is replaced after another timeout.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probe_started: float | None = None
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if self.state == OPEN and now - self.opened_at >= self.recovery_timeout:
+            self.state = HALF_OPEN
+            self._probe_started = None
+        if self.state == HALF_OPEN and (
+            self._probe_started is None or now - self._probe_started >= self.recovery_timeout
+        ):
+            self._probe_started = now
+            return True
+        if self.state == CLOSED:
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_in(self) -> float:
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self._probe_started = None
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+class CircuitBreakers:
+    """Lazily created circuit breakers, one per upstream family."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+        return breaker
+
+    def stats(self) -> dict[str, Any]:
+        return {key: breaker.stats() for key, breaker in sorted(self._breakers.items())}
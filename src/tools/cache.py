@@ -0,0 +1,123 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+CacheKey = tuple[str, str, str]
+
+
+def make_cache_key(token: str | None, name: str, arguments: dict[str, Any]) -> CacheKey:
+    """Build a cache key from the auth token (hashed), tool name and normalized arguments."""
+    token_hash = hashlib.sha256((token or "").encode()).hexdigest()[:16]
+    normalized = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return (token_hash, name, normalized)
+
+
+class ResponseCache:
+    """
+    In-process read-through cache for read-only tool results.
+    Entries expire after their TTL and the least recently used ones are evicted once `max_bytes` is exceeded.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, str, int]] = OrderedDict()
+        # tool name -> {cache key: arguments}, used to invalidate entries by resource ID
+        self._by_tool: dict[str, dict[CacheKey, dict[str, Any]]] = {}
+        # tool name -> number of invalidations, so a read that started before one is not cached after it
+        self._generations: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: CacheKey) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self, name: str) -> int:
+        """The invalidation generation of tool `name`; capture it before a read and pass it to `set`."""
+        return self._generations.get(name, 0)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: str,
+        ttl: float,
+        arguments: dict[str, Any] | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a result. With `generation`, the result is dropped if the tool was invalidated since that
+        generation was captured: the read was in flight while a mutation completed, so it may be stale.
+        """
+        size = len(value.encode())
+        if not self.enabled or ttl <= 0 or size > self.max_bytes:
+            return
+        if generation is not None and generation != self.generation(key[1]):
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value, size)
+        self._by_tool.setdefault(key[1], {})[key] = arguments or {}
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, name: str, match: dict[str, Any] | None = None) -> int:
+        """
+        Evict cached results of tool `name` for every auth token.
+        With `match`, only entries whose arguments equal all the given values are evicted.
+        """
+        self._generations[name] = self.generation(name) + 1
+        candidates = self._by_tool.get(name, {})
+        keys = [key for key, args in candidates.items() if all(args.get(k) == v for k, v in (match or {}).items())]
+        for key in keys:
+            self._remove(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_tool.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        _, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+        tool_entries = self._by_tool.get(key[1])
+        if tool_entries is not None:
+            tool_entries.pop(key, None)
+            if not tool_entries:
+                del self._by_tool[key[1]]
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,30 @@
+import hashlib
+import json
+from typing import Any
+
+from mcp import types
+
+HASH_META_KEY = "chatvolt/toolsHash"
+
+
+class ToolCatalog:
+    """
+    The tools/list answer built once: the Tool objects, the JSON-encoded result and a content hash.
+    A JSON-RPC response only needs the request ID spliced in front of the encoded result.
+    """
+
+    def __init__(self, tools: list[types.Tool]):
+        self.tools = tools
+        encoded_tools = types.ListToolsResult(tools=tools).model_dump_json(by_alias=True, exclude_none=True)
+        self.hash = hashlib.sha256(encoded_tools.encode()).hexdigest()
+        self.result = types.ListToolsResult(tools=tools, _meta={HASH_META_KEY: self.hash})
+        self.encoded_result = self.result.model_dump_json(by_alias=True, exclude_none=True).encode()
+        self.served = 0
+
+    def response(self, request_id: str | int) -> bytes:
+        """The encoded JSON-RPC response to a tools/list request."""
+        self.served += 1
+        return b'{"jsonrpc":"2.0","id":%b,"result":%b}' % (json.dumps(request_id).encode(), self.encoded_result)
+
+    def stats(self) -> dict[str, Any]:
+        return {"tools": len(self.tools), "bytes": len(self.encoded_result), "hash": self.hash, "served": self.served}
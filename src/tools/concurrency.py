@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from typing import Any
+
+
+class LimiterTimeout(Exception):
+    """Raised when a call waited longer than the queue deadline for an upstream slot."""
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for upstream requests.
+
+    The limit grows additively (about +1 per window of successful requests) and shrinks
+    multiplicatively when the upstream answers with an overload status, times out, or a tool's
+    latency rises well above its own moving average. Calls beyond the limit wait in a FIFO queue
+    until a slot frees up or their deadline passes.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        decrease_factor: float = 0.7,
+        latency_tolerance: float = 2.0,
+        queue_timeout: float = 30.0,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latency: dict[str, tuple[float, int]] = {}  # key -> (moving average, samples)
+        self._last_decrease = 0.0
+
+    async def acquire(self, timeout: float | None = None) -> None:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout if timeout is None else timeout)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as we gave up; hand it to the next caller
+                self._release_slot()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                self.rejected += 1
+                raise LimiterTimeout(f"Timed out waiting for an upstream slot (limit {int(self.limit)})") from None
+            raise
+
+    def release(self, latency: float, overloaded: bool = False, key: str = "") -> None:
+        """Free a slot and adapt the limit from the outcome of the request."""
+        if overloaded or self._latency_rising(key, latency):
+            now = time.monotonic()
+            # Shrink at most once per average round trip so a single burst does not collapse the limit
+            if now - self._last_decrease >= self._latency.get(key, (0.0, 0))[0]:
+                self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                self._last_decrease = now
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._record_latency(key, latency)
+        self._release_slot()
+
+    def abandon(self) -> None:
+        """Free the slot of a request that was cancelled: its outcome says nothing about the upstream."""
+        self.cancelled += 1
+        self._release_slot()
+
+    def _latency_rising(self, key: str, latency: float) -> bool:
+        average, samples = self._latency.get(key, (0.0, 0))
+        return samples >= 10 and latency > average * self.latency_tolerance
+
+    def _record_latency(self, key: str, latency: float) -> None:
+        average, samples = self._latency.get(key, (latency, 0))
+        self._latency[key] = (average * 0.9 + latency * 0.1, samples + 1)
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "rejected": self.rejected,
+            "cancelled": self.cancelled,
+        }
@@ -0,0 +1,250 @@
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from src.config import IMPORT_LOG_DIR, get_auth_token
+from src.tools.local_files import resolve_file, safe_name, token_directory
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+DEFAULT_IMPORT_CONCURRENCY = 8
+DEFAULT_MAX_ERRORS = 100
+READ_BATCH = 500
+PROGRESS_EVERY = 100
+CUSTOM_FIELD_PREFIX = "customFields."
+
+
+def _csv_rows(path: str) -> Iterator[dict[str, Any]]:
+    """CSV rows as create_contact arguments: `tags` is split on ';' and `customFields.<name>` columns are nested."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for record in csv.DictReader(f):
+            row: dict[str, Any] = {}
+            for column, value in record.items():
+                if column is None or value is None or value == "":
+                    continue
+                if column.startswith(CUSTOM_FIELD_PREFIX):
+                    row.setdefault("customFields", {})[column[len(CUSTOM_FIELD_PREFIX) :]] = value
+                elif column == "tags":
+                    row["tags"] = [tag.strip() for tag in value.split(";") if tag.strip()]
+                else:
+                    row[column] = value
+            yield row
+
+
+def _jsonl_rows(path: str) -> Iterator[Any]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    yield e
+
+
+def _completed_rows(log_path: str) -> set[int]:
+    """Rows recorded as created in an existing result log."""
+    done = set()
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("ok"):
+                    done.add(entry["row"])
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def default_log_name(path: str, size: int, mtime_ns: int) -> str:
+    """
+    Result log name for a source file: its base name plus a hash of its identity (path, size, mtime),
+    so a different file written to the same path starts a new log instead of resuming the old one.
+    """
+    digest = hashlib.sha256(json.dumps([path, size, mtime_ns]).encode()).hexdigest()[:12]
+    return f"{safe_name(os.path.basename(path))}-{digest}.results.jsonl"
+
+
+def _stat(path: str) -> os.stat_result | None:
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info if os.path.isfile(path) else None
+
+
+def _open_log(log_path: str):
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    return open(log_path, "a", encoding="utf-8")
+
+
+def _append(f, line: str) -> None:
+    f.write(line + "\n")
+    f.flush()
+
+
+async def import_contacts(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Create contacts from a local CSV or JSONL file.
+
+    Rows are read in batches on a worker thread and validated against the create_contact schema, then
+    created by a fixed pool of workers whose calls go through the registry (rate limit, concurrency limit,
+    breakers). Every row's outcome is appended to a JSONL result log; with `resume`, rows the log already
+    records as created are skipped, so a failed import continues where it stopped.
+    """
+    path = os.path.abspath(os.path.expanduser(arguments["file_path"]))
+    file_format = arguments.get("format") or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    concurrency = max(1, arguments.get("max_concurrency", DEFAULT_IMPORT_CONCURRENCY))
+    max_errors = arguments.get("max_errors", DEFAULT_MAX_ERRORS)
+    if file_format not in ("csv", "jsonl"):
+        return False, error_text(400, f"Unsupported format: {file_format}")
+    file_info = await asyncio.to_thread(_stat, path)
+    if file_info is None:
+        return False, error_text(400, f"File not found: {path}")
+    log_name = arguments.get("result_log") or default_log_name(path, file_info.st_size, file_info.st_mtime_ns)
+    try:
+        # Each auth token has its own log directory, so one caller never resumes (or appends to) another's log
+        log_path = resolve_file(token_directory(IMPORT_LOG_DIR, get_auth_token()), log_name)
+    except ValueError as e:
+        return False, error_text(400, f"Invalid result log name: {e}")
+
+    done = await asyncio.to_thread(_completed_rows, log_path) if arguments.get("resume", True) else set()
+    known_fields = set(registry.tools["create_contact"]["input_schema"]["properties"])
+    rows = _csv_rows(path) if file_format == "csv" else _jsonl_rows(path)
+    try:
+        log = await asyncio.to_thread(_open_log, log_path)
+    except OSError as e:
+        return False, error_text(400, f"Cannot write result log {log_name}: {e}")
+    queue: asyncio.Queue[tuple[int, dict[str, Any]] | None] = asyncio.Queue(maxsize=concurrency * 2)
+    counts = {"rows": 0, "created": 0, "failed": 0, "invalid": 0, "skipped": 0}
+    started = time.monotonic()
+    aborted = False
+    read_error = None
+
+    async def record(row_number: int, ok: bool, result: Any) -> None:
+        entry = {"row": row_number, "ok": ok, "result" if ok else "error": result}
+        await asyncio.to_thread(_append, log, json.dumps(entry))
+        finished = counts["created"] + counts["failed"] + counts["invalid"]
+        if progress is not None and finished % PROGRESS_EVERY == 0:
+            await progress(f"Imported {counts['created']} contacts, {finished} rows processed", finished, None)
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not None:
+            row_number, row = item
+            text = (await registry.call_tool("create_contact", row))[0].text
+            ok = not is_error(text)
+            counts["created" if ok else "failed"] += 1
+            await record(row_number, ok, parse_text(text))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    try:
+        row_number = 0
+        while not aborted:
+            try:
+                batch = await asyncio.to_thread(lambda: list(islice(rows, READ_BATCH)))
+            except (ValueError, csv.Error) as e:
+                read_error = f"Cannot read row {row_number + 1}: {e}"
+                break
+            if not batch:
+                break
+            for row in batch:
+                row_number += 1
+                counts["rows"] += 1
+                if row_number in done:
+                    counts["skipped"] += 1
+                    continue
+                if isinstance(row, ValueError):
+                    errors = [f"Invalid JSON: {row}"]
+                elif not isinstance(row, dict):
+                    errors = ["Row is not a JSON object"]
+                else:
+                    errors = [f"Unknown field: {field}" for field in row if field not in known_fields]
+                    errors += registry.validate("create_contact", row) or []
+                    if not row:
+                        errors.append("Row is empty")
+                if errors:
+                    counts["invalid"] += 1
+                    await record(row_number, False, {"error": True, "status": 400, "message": errors})
+                else:
+                    await queue.put((row_number, row))
+                if counts["failed"] + counts["invalid"] >= max_errors:
+                    aborted = True
+                    break
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        rows.close()
+        await asyncio.to_thread(log.close)
+
+    summary = {
+        "result_log": log_name,
+        **counts,
+        "aborted": aborted,
+        "seconds": round(time.monotonic() - started, 3),
+    }
+    if read_error is not None:
+        summary["error"] = read_error
+    return True, json.dumps(summary)
+
+
+TOOLS = {
+    "import_contacts": {
+        "handler": import_contacts,
+        "requires": ["create_contact"],
+        "description": (
+            "Create contacts in bulk from a local CSV or JSONL file. Each row is validated against the "
+            "create_contact fields (CSV: 'tags' separated by ';', 'customFields.<name>' columns). Outcomes are "
+            "appended to a JSONL result log, and re-running the same import skips rows already created."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Absolute path to the CSV or JSONL file"},
+                "format": {
+                    "type": "string",
+                    "enum": ["csv", "jsonl"],
+                    "description": "File format; inferred from the extension by default",
+                },
+                "result_log": {
+                    "type": "string",
+                    "description": (
+                        "File name of the per-row result log (JSONL) in the server's import log directory "
+                        "(no directories); defaults to a name derived from file_path"
+                    ),
+                },
+                "resume": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Skip rows the result log already records as created",
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "default": DEFAULT_IMPORT_CONCURRENCY,
+                    "description": "Contacts created at the same time",
+                },
+                "max_errors": {
+                    "type": "integer",
+                    "default": DEFAULT_MAX_ERRORS,
+                    "description": "Stop reading new rows after this many failed or invalid rows",
+                },
+            },
+            "required": ["file_path"],
+        },
+    },
+}
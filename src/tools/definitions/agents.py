@@ -4,6 +4,15 @@ TOOLS: dict[str, dict[str, Any]] = {
     "query_agent": {
         "method": "POST",
         "path": "/agents/{id}/query",
+        "invalidates": {
+            "get_conversation": {"conversationId": "conversationId"},
+            "get_conversation_messages": {"conversationId": "conversationId"},
+            "list_conversations": {},
+        },
+        "timeout": {"connect": 10, "read": 300, "total": 600},
+        "max_retries": 1,
+        "retry_statuses": [429, 503],
+        "stream_argument": "streaming",
         "description": "Send a query to a specific agent and receive a response. The ID can be the agent's UUID or its handle (prefixed with '@', e.g., '@my-agent').",
         "input_schema": {
             "type": "object",
@@ -73,6 +82,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_agent": {
         "method": "POST",
         "path": "/agents",
+        "invalidates": {"list_agents": {}},
         "description": "Create a new AI agent with customizable settings including visibility, handle, interface configuration, and external URL integrations.",
         "input_schema": {
             "type": "object",
@@ -140,6 +150,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_agent": {
         "method": "PATCH",
         "path": "/agents/{id}",
+        "invalidates": {"get_agent": {"id": "id"}, "list_agents": {}},
         "description": "Update an existing agent's configuration including name, description, model, temperature, system prompt, visibility, handle, interface settings, and inactive hours. The ID can be the agent's UUID or its handle.",
         "input_schema": {
             "type": "object",
@@ -192,6 +203,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_agent": {
         "method": "DELETE",
         "path": "/agents/{id}",
+        "invalidates": {"get_agent": {"id": "id"}, "list_agents": {}, "get_agent_tools": {"agentId": "id"}},
         "description": "Delete an AI agent. This action is irreversible. The ID can be the agent's UUID or its handle.",
         "input_schema": {
             "type": "object",
@@ -207,12 +219,18 @@ TOOLS: dict[str, dict[str, Any]] = {
     "get_models": {
         "method": "GET",
         "path": "/agents/models",
+        "auth": False,
+        "cache_ttl": 3600,
+        "timeout": {"connect": 2, "read": 2, "total": 2},
+        "max_retries": 0,
         "description": "Get available AI models and their pricing.",
         "input_schema": {"type": "object", "properties": {}},
     },
     "toggle_webhook": {
         "method": "PATCH",
         "path": "/agents/{id}/webhook",
+        "query_args": ["type", "enabled"],
+        "invalidates": {"get_agent": {"id": "id"}, "list_agents": {}},
         "description": "Enable or disable a specific webhook for an agent. The ID can be the agent's UUID or its handle.",
         "input_schema": {
             "type": "object",
@@ -237,6 +255,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_agent_tool": {
         "method": "POST",
         "path": "/api/agents/{agentId}/tools",
+        "invalidates": {"get_agent_tools": {"agentId": "agentId"}, "get_agent": {"id": "agentId"}},
         "description": "Create a new tool for a specific agent. IMPORTANT: For GET tools with query parameters, define them both in the 'url' and the 'queryParameters' array.",
         "input_schema": {
             "type": "object",
@@ -335,6 +354,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_agent_tool": {
         "method": "PATCH",
         "path": "/api/agents/{agentId}/tools/{toolId}",
+        "invalidates": {"get_agent_tools": {"agentId": "agentId"}, "get_agent": {"id": "agentId"}},
         "description": "Update an existing tool for a specific agent. IMPORTANT: For GET tools with query parameters, define them both in the 'url' and the 'queryParameters' array.",
         "input_schema": {
             "type": "object",
@@ -434,6 +454,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_agent_tool": {
         "method": "DELETE",
         "path": "/api/agents/{agentId}/tools/{toolId}",
+        "invalidates": {"get_agent_tools": {"agentId": "agentId"}, "get_agent": {"id": "agentId"}},
         "description": "Delete a specific tool from an agent.",
         "input_schema": {
             "type": "object",
@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "search_artifacts": {
         "method": "GET",
         "path": "/artifacts/search",
+        "csv_args": ["ids", "categoryIds", "mediaTypes"],
         "description": "Search for artifacts with advanced filters (name, description, price, categories, media types).",
         "input_schema": {
             "type": "object",
@@ -51,6 +52,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_artifact": {
         "method": "POST",
         "path": "/artifacts",
+        "invalidates": {"list_artifacts": {}, "search_artifacts": {}},
         "description": "Create a new artifact (product or service).",
         "input_schema": {
             "type": "object",
@@ -79,6 +81,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_artifact": {
         "method": "PUT",
         "path": "/artifacts/{id}",
+        "invalidates": {"get_artifact": {"id": "id"}, "list_artifacts": {}, "search_artifacts": {}},
         "description": "Update an existing artifact.",
         "input_schema": {
             "type": "object",
@@ -118,6 +121,9 @@ TOOLS: dict[str, dict[str, Any]] = {
     "upload_artifact_media": {
         "method": "POST",
         "path": "/artifacts/media/upload",
+        "file_upload": True,
+        "invalidates": {"list_artifact_media": {"artifact_id": "artifact_id"}, "get_artifact": {"id": "artifact_id"}},
+        "timeout": {"read": 60},
         "description": "Upload a media file (image, video, etc.) for a specific artifact.",
         "input_schema": {
             "type": "object",
@@ -133,6 +139,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_artifact_media": {
         "method": "PATCH",
         "path": "/artifacts/media/{id}",
+        "invalidates": {"list_artifact_media": {}},
         "description": "Update details of an existing media item.",
         "input_schema": {
             "type": "object",
@@ -148,6 +155,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_artifact_media": {
         "method": "DELETE",
         "path": "/artifacts/media/{id}",
+        "invalidates": {"list_artifact_media": {}},
         "description": "Delete a specific media item from an artifact.",
         "input_schema": {
             "type": "object",
@@ -164,6 +172,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_artifact_category": {
         "method": "POST",
         "path": "/artifact-categories",
+        "invalidates": {"list_artifact_categories": {}},
         "description": "Create a new category for artifacts.",
         "input_schema": {
             "type": "object",
@@ -188,6 +197,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_artifact_category": {
         "method": "PUT",
         "path": "/artifact-categories/{id}",
+        "invalidates": {"get_artifact_category": {"id": "id"}, "list_artifact_categories": {}},
         "description": "Update an existing artifact category.",
         "input_schema": {
             "type": "object",
@@ -204,6 +214,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_artifact": {
         "method": "DELETE",
         "path": "/artifacts/{id}",
+        "invalidates": {"get_artifact": {"id": "id"}, "list_artifacts": {}, "search_artifacts": {}},
         "description": "Delete a specific artifact (product or service).",
         "input_schema": {
             "type": "object",
@@ -214,6 +225,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_artifact_category": {
         "method": "DELETE",
         "path": "/artifact-categories/{id}",
+        "invalidates": {"get_artifact_category": {"id": "id"}, "list_artifact_categories": {}},
         "description": "Delete a specific artifact category.",
         "input_schema": {
             "type": "object",
@@ -18,6 +18,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "add_to_blacklist": {
         "method": "POST",
         "path": "/agents/{agentId}/blacklist",
+        "invalidates": {"list_blacklist": {"agentId": "agentId"}},
         "description": "Add a user to the agent's blacklist. Blacklisted users will not be able to interact with the agent.",
         "input_schema": {
             "type": "object",
@@ -33,6 +34,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "remove_from_blacklist": {
         "method": "DELETE",
         "path": "/agents/{agentId}/blacklist/{blacklistId}",
+        "invalidates": {"list_blacklist": {"agentId": "agentId"}},
         "description": "Remove a user from the agent's blacklist.",
         "input_schema": {
             "type": "object",
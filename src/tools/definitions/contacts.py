@@ -34,6 +34,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_contact": {
         "method": "POST",
         "path": "/contacts",
+        "invalidates": {"list_contacts": {}},
         "description": "Create a new contact in the system.",
         "input_schema": {
             "type": "object",
@@ -59,6 +60,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_contact": {
         "method": "PATCH",
         "path": "/contacts/{id}",
+        "invalidates": {"get_contact": {"id": "id"}, "list_contacts": {}},
         "description": "Update an existing contact's information.",
         "input_schema": {
             "type": "object",
@@ -84,6 +86,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_contact": {
         "method": "DELETE",
         "path": "/contacts/{id}",
+        "invalidates": {"get_contact": {"id": "id"}, "list_contacts": {}, "get_contact_conversations": {"id": "id"}},
         "description": "Delete a contact. This action is irreversible.",
         "input_schema": {
             "type": "object",
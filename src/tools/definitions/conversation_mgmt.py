@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_conversation": {
         "method": "POST",
         "path": "/conversation",
+        "invalidates": {"list_conversations": {}, "get_contact_conversations": {}},
         "description": "Create a new conversation.",
         "input_schema": {
             "type": "object",
@@ -26,6 +27,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "resolve_conversation": {
         "method": "POST",
         "path": "/conversation/{conversationId}/resolve",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Mark a conversation as resolved.",
         "input_schema": {
             "type": "object",
@@ -38,6 +40,12 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_conversation": {
         "method": "DELETE",
         "path": "/conversation/{conversationId}",
+        "invalidates": {
+            "get_conversation": {"conversationId": "conversationId"},
+            "get_conversation_messages": {"conversationId": "conversationId"},
+            "list_conversations": {},
+            "get_contact_conversations": {},
+        },
         "description": "Delete a conversation. This action is irreversible.",
         "input_schema": {
             "type": "object",
@@ -50,6 +58,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "request_human_intervention": {
         "method": "POST",
         "path": "/conversation/{conversationId}/request-human",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Request human intervention for a conversation.",
         "input_schema": {
             "type": "object",
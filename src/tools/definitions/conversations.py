@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "get_conversation_messages": {
         "method": "GET",
         "path": "/conversation/{conversationId}/messages/{count}",
+        "cache_ttl": 5,
         "description": "Retrieves the last ‘N’ messages from a conversation.",
         "input_schema": {
             "type": "object",
@@ -68,6 +69,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "set_conversation_ai": {
         "method": "POST",
         "path": "/conversations/{conversationId}/set-ai-enabled",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Enable or disable AI for a specific conversation.",
         "input_schema": {
             "type": "object",
@@ -81,6 +83,10 @@ TOOLS: dict[str, dict[str, Any]] = {
     "register_message_in_context": {
         "method": "POST",
         "path": "/conversations/{conversationId}/message-register",
+        "invalidates": {
+            "get_conversation_messages": {"conversationId": "conversationId"},
+            "get_conversation": {"conversationId": "conversationId"},
+        },
         "description": "Register a message in the context of a conversation without sending it to the participant.",
         "input_schema": {
             "type": "object",
@@ -100,6 +106,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_message_by_channel": {
         "method": "POST",
         "path": "/conversation/message/{type}/{value}",
+        "invalidates": {"get_conversation_messages": {}, "list_conversations": {}},
         "description": "Send a message to a conversation identified by conversationId, phone, or email.",
         "input_schema": {
             "type": "object",
@@ -131,6 +138,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "assign_conversation": {
         "method": "POST",
         "path": "/conversation/{conversationId}/assign",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Assign a conversation to a user.",
         "input_schema": {
             "type": "object",
@@ -144,6 +152,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "set_conversation_priority": {
         "method": "POST",
         "path": "/conversation/{conversationId}/set-priority",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Set the priority of a conversation.",
         "input_schema": {
             "type": "object",
@@ -161,6 +170,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_conversation_status": {
         "method": "POST",
         "path": "/conversation/{conversationId}/update-status",
+        "invalidates": {"get_conversation": {"conversationId": "conversationId"}, "list_conversations": {}},
         "description": "Update the status of a conversation.",
         "input_schema": {
             "type": "object",
@@ -203,6 +213,10 @@ TOOLS: dict[str, dict[str, Any]] = {
     "upsert_conversation_variable": {
         "method": "POST",
         "path": "/conversation/{conversationId}/variables",
+        "invalidates": {
+            "get_conversation_variables": {"conversationId": "conversationId"},
+            "get_conversation_variable": {"conversationId": "conversationId"},
+        },
         "description": "Create or update a custom variable for a conversation.",
         "input_schema": {
             "type": "object",
@@ -217,6 +231,10 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_conversation_variable": {
         "method": "DELETE",
         "path": "/conversation/{conversationId}/variables/{variableId}",
+        "invalidates": {
+            "get_conversation_variables": {"conversationId": "conversationId"},
+            "get_conversation_variable": {"conversationId": "conversationId", "variableId": "variableId"},
+        },
         "description": "Delete a custom variable from a conversation.",
         "input_schema": {
             "type": "object",
@@ -242,6 +260,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_conversation_note": {
         "method": "POST",
         "path": "/conversation/{conversationId}/notes",
+        "invalidates": {"get_conversation_notes": {"conversationId": "conversationId"}},
         "description": "Create a note for a conversation.",
         "input_schema": {
             "type": "object",
@@ -255,6 +274,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_conversation_note": {
         "method": "PUT",
         "path": "/conversation/{conversationId}/notes/{noteId}",
+        "invalidates": {"get_conversation_notes": {"conversationId": "conversationId"}},
         "description": "Update a note for a conversation.",
         "input_schema": {
             "type": "object",
@@ -269,6 +289,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_conversation_note": {
         "method": "DELETE",
         "path": "/conversation/{conversationId}/notes/{noteId}",
+        "invalidates": {"get_conversation_notes": {"conversationId": "conversationId"}},
         "description": "Delete a note from a conversation.",
         "input_schema": {
             "type": "object",
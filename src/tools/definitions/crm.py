@@ -32,6 +32,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_crm_step": {
         "method": "POST",
         "path": "/crm/step",
+        "invalidates": {"list_crm_steps": {"scenarioId": "scenarioId"}},
         "description": "Create a new CRM step in a scenario.",
         "input_schema": {
             "type": "object",
@@ -81,6 +82,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_crm_step": {
         "method": "PUT",
         "path": "/crm/step",
+        "invalidates": {"list_crm_steps": {}},
         "description": "Update an existing CRM step. IMPORTANT: ID must be passed in the body.",
         "input_schema": {
             "type": "object",
@@ -129,6 +131,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_crm_step": {
         "method": "DELETE",
         "path": "/crm/step",
+        "invalidates": {"list_crm_steps": {}},
         "description": "Delete a CRM step. IMPORTANT: ID must be passed in the body.",
         "input_schema": {
             "type": "object",
@@ -139,6 +142,11 @@ TOOLS: dict[str, dict[str, Any]] = {
     "add_conversation_to_step": {
         "method": "POST",
         "path": "/crm/step/conversation",
+        "invalidates": {
+            "list_crm_steps": {},
+            "list_crm_logs": {},
+            "get_conversation": {"conversationId": "conversationId"},
+        },
         "description": "Add an existing conversation to a specific CRM step within a scenario.",
         "input_schema": {
             "type": "object",
@@ -157,6 +165,11 @@ TOOLS: dict[str, dict[str, Any]] = {
     "move_conversation_to_step": {
         "method": "POST",
         "path": "/crm/step/move",
+        "invalidates": {
+            "list_crm_steps": {},
+            "list_crm_logs": {},
+            "get_conversation": {"conversationId": "conversationId"},
+        },
         "description": "Move a conversation to another CRM step within a scenario.",
         "input_schema": {
             "type": "object",
@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_crm_scenario": {
         "method": "POST",
         "path": "/crm/scenario",
+        "invalidates": {"list_crm_scenarios": {}},
         "description": "Create a new CRM scenario (workflow blueprint).",
         "input_schema": {
             "type": "object",
@@ -31,6 +32,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_crm_scenario": {
         "method": "PATCH",
         "path": "/crm/scenario/{id}",
+        "invalidates": {"get_crm_scenario": {"id": "id"}, "list_crm_scenarios": {}},
         "description": "Update an existing CRM scenario.",
         "input_schema": {
             "type": "object",
@@ -47,6 +49,11 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_crm_scenario": {
         "method": "DELETE",
         "path": "/crm/scenario/{id}",
+        "invalidates": {
+            "get_crm_scenario": {"id": "id"},
+            "list_crm_scenarios": {},
+            "list_crm_steps": {"scenarioId": "id"},
+        },
         "description": "Delete a CRM scenario. This action is irreversible.",
         "input_schema": {
             "type": "object",
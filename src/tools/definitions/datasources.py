@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_datasource": {
         "method": "PATCH",
         "path": "/datasources/{id}",
+        "invalidates": {"get_datasource": {"id": "id"}, "list_datasources": {}, "get_datasource_status": {"id": "id"}},
         "description": "Update a datasource configuration.",
         "input_schema": {
             "type": "object",
@@ -18,6 +19,12 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_datasource": {
         "method": "DELETE",
         "path": "/datasources/{id}",
+        "invalidates": {
+            "get_datasource": {"id": "id"},
+            "list_datasources": {},
+            "get_datasource_status": {"id": "id"},
+            "query_datastore": {},
+        },
         "description": "Delete a datasource. This action is irreversible.",
         "input_schema": {
             "type": "object",
@@ -30,6 +37,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "sync_datasource": {
         "method": "POST",
         "path": "/datasources/{id}/sync",
+        "invalidates": {"get_datasource": {"id": "id"}, "get_datasource_status": {"id": "id"}, "query_datastore": {}},
         "description": "Trigger a manual sync of the datasource.",
         "input_schema": {
             "type": "object",
@@ -42,6 +50,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "get_datasource_status": {
         "method": "GET",
         "path": "/datasources/{id}/status",
+        "cache_ttl": 0,
         "description": "Get the sync status and health of a datasource.",
         "input_schema": {
             "type": "object",
@@ -16,6 +16,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "query_datastore": {
         "method": "POST",
         "path": "/datastores/{id}/query",
+        "circuit_breaker": "/datastores/*/query",
         "description": "Query a specific datastore for information.",
         "input_schema": {
             "type": "object",
@@ -63,6 +64,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_datastore": {
         "method": "POST",
         "path": "/datastores",
+        "invalidates": {"list_datastores": {}},
         "description": "Create a new datastore with the provided configurations.",
         "input_schema": {
             "type": "object",
@@ -83,6 +85,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_datastore": {
         "method": "PATCH",
         "path": "/datastores/{id}",
+        "invalidates": {"get_datastore": {"id": "id"}, "list_datastores": {}},
         "description": "Update an existing datastore's configuration.",
         "input_schema": {
             "type": "object",
@@ -104,6 +107,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_datastore": {
         "method": "DELETE",
         "path": "/datastores/{id}",
+        "invalidates": {"get_datastore": {"id": "id"}, "list_datastores": {}, "query_datastore": {"id": "id"}},
         "description": "Permanently delete a datastore and all its associated data.",
         "input_schema": {
             "type": "object",
@@ -141,6 +145,13 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_datasource": {
         "method": "POST",
         "path": "/datasources",
+        "file_upload": {"type": "file"},
+        "invalidates": {
+            "list_datasources": {"datastoreId": "datastoreId"},
+            "get_datastore": {"id": "datastoreId"},
+            "query_datastore": {"id": "datastoreId"},
+        },
+        "timeout": {"read": 60},
         "description": "Create a new datasource. Supports 'file' upload (multipart/form-data) or 'web_page', 'web_site', 'qa' (JSON).",
         "input_schema": {
             "type": "object",
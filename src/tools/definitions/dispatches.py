@@ -34,6 +34,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_dispatch": {
         "method": "POST",
         "path": "/dispatches",
+        "invalidates": {"list_dispatches": {}},
         "description": "Create a new dispatch (broadcast campaign) to send messages to a list of contacts.",
         "input_schema": {
             "type": "object",
@@ -70,6 +71,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_dispatch": {
         "method": "PATCH",
         "path": "/dispatches/{id}",
+        "invalidates": {"get_dispatch": {"id": "id"}, "list_dispatches": {}},
         "description": "Update an existing dispatch configuration.",
         "input_schema": {
             "type": "object",
@@ -88,6 +90,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_dispatch": {
         "method": "DELETE",
         "path": "/dispatches/{id}",
+        "invalidates": {"get_dispatch": {"id": "id"}, "list_dispatches": {}},
         "description": "Delete a dispatch. Only pending dispatches can be deleted.",
         "input_schema": {
             "type": "object",
@@ -100,6 +103,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "populate_dispatch_queue": {
         "method": "POST",
         "path": "/dispatches/{id}/populate-queue",
+        "invalidates": {"get_dispatch": {"id": "id"}, "list_dispatches": {}},
         "description": "Populate the dispatch queue for a given dispatch. Clears existing queue and repopulates based on contact lists. Respects inclusion and exclusion rules.",
         "input_schema": {
             "type": "object",
@@ -137,6 +141,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "create_contact_list": {
         "method": "POST",
         "path": "/dispatches/contacts/lists",
+        "invalidates": {"list_contact_lists": {}},
         "description": "Create a new contact list for dispatches.",
         "input_schema": {
             "type": "object",
@@ -150,6 +155,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_contact_list": {
         "method": "PUT",
         "path": "/dispatches/contacts/lists/{id}",
+        "invalidates": {"get_contact_list": {"id": "id"}, "list_contact_lists": {}},
         "description": "Update an existing contact list.",
         "input_schema": {
             "type": "object",
@@ -164,6 +170,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_contact_list": {
         "method": "DELETE",
         "path": "/dispatches/contacts/lists/{id}",
+        "invalidates": {"get_contact_list": {"id": "id"}, "list_contact_lists": {}},
         "description": "Delete a contact list.",
         "input_schema": {
             "type": "object",
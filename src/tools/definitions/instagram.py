@@ -13,6 +13,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "instagram_connect": {
         "method": "POST",
         "path": "/instagram/connect",
+        "invalidates": {"instagram_list_agents": {}},
         "description": "Connect an Instagram Business Account to an agent.",
         "input_schema": {
             "type": "object",
@@ -37,6 +38,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "instagram_disconnect": {
         "method": "POST",
         "path": "/instagram/disconnect",
+        "invalidates": {"instagram_list_agents": {}},
         "description": "Disconnect an Instagram Business Account from an agent.",
         "input_schema": {
             "type": "object",
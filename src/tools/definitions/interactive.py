@@ -4,6 +4,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_interactive_buttons": {
         "method": "POST",
         "path": "/messages/interactive/send-buttons",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Send a message with up to 3 reply buttons. Supported on WhatsApp, Z-API, and ZapperAPI.",
         "input_schema": {
             "type": "object",
@@ -26,6 +27,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_interactive_list": {
         "method": "POST",
         "path": "/messages/interactive/send-lists",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Send an interactive list message with sections and rows.",
         "input_schema": {
             "type": "object",
@@ -64,6 +66,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_cta_url": {
         "method": "POST",
         "path": "/messages/interactive/send-cta",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Send a call-to-action message with a clickable URL button.",
         "input_schema": {
             "type": "object",
@@ -82,6 +85,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_location": {
         "method": "POST",
         "path": "/messages/interactive/send-location",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Send a location message with latitude and longitude coordinates.",
         "input_schema": {
             "type": "object",
@@ -99,6 +103,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "request_location": {
         "method": "POST",
         "path": "/messages/interactive/location-request",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Request the user to share their location.",
         "input_schema": {
             "type": "object",
@@ -113,6 +118,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "send_contact": {
         "method": "POST",
         "path": "/messages/interactive/send-contact",
+        "invalidates": {"get_conversation_messages": {"conversationId": "conversationId"}},
         "description": "Send a contact card to the conversation.",
         "input_schema": {
             "type": "object",
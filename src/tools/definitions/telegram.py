@@ -13,6 +13,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "telegram_connect": {
         "method": "POST",
         "path": "/telegram/connect",
+        "invalidates": {"telegram_list_agents": {}},
         "description": "Connect a Telegram bot to an agent using the bot token from @BotFather.",
         "input_schema": {
             "type": "object",
@@ -26,6 +27,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "telegram_disconnect": {
         "method": "POST",
         "path": "/telegram/disconnect",
+        "invalidates": {"telegram_list_agents": {}},
         "description": "Disconnect a Telegram bot from an agent.",
         "input_schema": {
             "type": "object",
@@ -53,6 +53,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "whatsapp_create_template": {
         "method": "POST",
         "path": "/whatsapp/templates",
+        "invalidates": {"whatsapp_list_templates": {}},
         "description": "Create a new message template in the associated WhatsApp Business Account (WABA).",
         "input_schema": {
             "type": "object",
@@ -16,6 +16,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "add_whitelist_number": {
         "method": "POST",
         "path": "/agent-whitelist-whatsapp",
+        "invalidates": {"get_whitelist_numbers": {"id": "agentId"}},
         "description": "Add a WhatsApp number to the whitelist for an agent.",
         "input_schema": {
             "type": "object",
@@ -29,6 +30,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "update_whitelist_number": {
         "method": "PATCH",
         "path": "/agent-whitelist-whatsapp/{id}",
+        "invalidates": {"get_whitelist_numbers": {"id": "id"}},
         "description": "Update a WhatsApp number in the whitelist (replace old with new).",
         "input_schema": {
             "type": "object",
@@ -43,6 +45,7 @@ TOOLS: dict[str, dict[str, Any]] = {
     "delete_whitelist_number": {
         "method": "DELETE",
         "path": "/agent-whitelist-whatsapp/{id}",
+        "invalidates": {"get_whitelist_numbers": {"id": "id"}},
         "description": "Remove a WhatsApp number from the whitelist.",
         "input_schema": {
             "type": "object",
@@ -0,0 +1,179 @@
+import asyncio
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.config import EXPORT_DIR, get_auth_token
+from src.tools.local_files import resolve_file, safe_name, token_directory
+from src.tools.pagination import iter_pages
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+DEFAULT_EXPORT_CONCURRENCY = 8
+DEFAULT_MAX_MESSAGES = 1000
+# Export files are served back to clients as resources under this URI prefix, each auth token seeing only its own
+EXPORT_URI_PREFIX = "chatvolt://exports/"
+
+
+def export_directory() -> str:
+    """The subdirectory of EXPORT_DIR owned by the current request's auth token."""
+    return token_directory(EXPORT_DIR, get_auth_token())
+
+
+def export_path(name: str) -> str:
+    """
+    The path of export file `name` in the current auth token's export directory; raises ValueError for
+    anything but a bare file name.
+    """
+    return resolve_file(export_directory(), name)
+
+
+def _open(path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return open(path, "w", encoding="utf-8")
+
+
+async def export_conversations(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Write an agent's conversations with their messages to a JSONL file, one conversation per line.
+
+    Conversation pages are walked with prefetching while up to `max_concurrency` message fetches run
+    ahead of the writer. Lines are written in conversation order as soon as they are ready, so memory
+    stays bounded by the number of fetches in flight rather than by the size of the export.
+    """
+    agent_id = arguments["agentId"]
+    concurrency = max(1, arguments.get("max_concurrency", DEFAULT_EXPORT_CONCURRENCY))
+    max_messages = arguments.get("max_messages", DEFAULT_MAX_MESSAGES)
+    list_args = {key: arguments[key] for key in ("agentId", "status", "createdAt") if key in arguments}
+    name = arguments.get("file_name") or f"conversations-{safe_name(agent_id)}-{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+    try:
+        os.makedirs(export_directory(), exist_ok=True)
+        path = export_path(name)
+    except (OSError, ValueError) as e:
+        return False, error_text(400, f"Invalid export file name: {e}")
+
+    async def fetch_messages(conversation: dict[str, Any]) -> tuple[str, int, bool]:
+        result = await registry.call_tool(
+            "get_conversation_messages", {"conversationId": conversation.get("id"), "count": max_messages}
+        )
+        text = result[0].text
+        if is_error(text):
+            return json.dumps({"conversation": conversation, "messages": None, "error": parse_text(text)}), 0, False
+        messages = parse_text(text)
+        if isinstance(messages, dict):
+            messages = next((value for value in messages.values() if isinstance(value, list)), messages)
+        count = len(messages) if isinstance(messages, list) else 0
+        return json.dumps({"conversation": conversation, "messages": messages}), count, True
+
+    # In-order queue of fetches; the walker takes a slot per conversation and the writer frees it,
+    # so at most `concurrency` conversations are fetched or waiting to be written at any time
+    queue: asyncio.Queue[asyncio.Future | None] = asyncio.Queue()
+    slots = asyncio.Semaphore(concurrency)
+    walk_error: Any = None
+
+    async def walk() -> None:
+        nonlocal walk_error
+        try:
+            async for _, text, items, _ in iter_pages(registry, "list_conversations", list_args):
+                if is_error(text):
+                    walk_error = parse_text(text)
+                    break
+                for conversation in items:
+                    if isinstance(conversation, dict):
+                        await slots.acquire()
+                        queue.put_nowait(asyncio.ensure_future(fetch_messages(conversation)))
+        except Exception as e:
+            walk_error = {"error": True, "status": 500, "message": str(e)}
+        queue.put_nowait(None)
+
+    started = time.monotonic()
+    conversations = messages = errors = size = 0
+    try:
+        f = await asyncio.to_thread(_open, path)
+    except OSError as e:
+        return False, error_text(400, f"Cannot write export {name}: {e}")
+    walker = asyncio.ensure_future(walk())
+    try:
+        while (fetch := await queue.get()) is not None:
+            line, count, ok = await fetch
+            slots.release()
+            await asyncio.to_thread(f.write, line + "\n")
+            conversations += 1
+            messages += count
+            errors += 0 if ok else 1
+            size += len(line.encode()) + 1
+            if progress is not None:
+                await progress(f"Exported {conversations} conversations ({messages} messages)", conversations, None)
+        await walker
+    finally:
+        walker.cancel()
+        while not queue.empty():
+            pending = queue.get_nowait()
+            if pending is not None:
+                pending.cancel()
+        await asyncio.to_thread(f.close)
+
+    if walk_error is not None and conversations == 0:
+        return False, json.dumps(walk_error)
+    summary = {
+        "uri": EXPORT_URI_PREFIX + name,
+        "name": name,
+        "conversations": conversations,
+        "messages": messages,
+        "errors": errors,
+        "bytes": size,
+        "seconds": round(time.monotonic() - started, 3),
+        "complete": walk_error is None,
+    }
+    if walk_error is not None:
+        summary["error"] = walk_error
+    return True, json.dumps(summary)
+
+
+TOOLS = {
+    "export_conversations": {
+        "handler": export_conversations,
+        "requires": ["list_conversations", "get_conversation_messages"],
+        "description": (
+            "Export all conversations of an agent, each with its messages, to a JSONL file on the server "
+            "(one conversation per line). Returns the chatvolt://exports/ resource URI to read the file from, "
+            "with summary counts instead of the data."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "agentId": {"type": "string", "description": "ID of the agent whose conversations are exported"},
+                "status": {
+                    "type": "string",
+                    "enum": ["RESOLVED", "UNRESOLVED", "HUMAN_REQUESTED"],
+                    "description": "Only export conversations with this status",
+                },
+                "createdAt": {"type": "string", "description": "Filter by creation date (e.g., 'YYYY-MM-DD HH:mm:ss')"},
+                "file_name": {
+                    "type": "string",
+                    "description": (
+                        "Name of the file to write in the server's export directory (no directories); "
+                        "defaults to a timestamped name"
+                    ),
+                },
+                "max_messages": {
+                    "type": "integer",
+                    "default": DEFAULT_MAX_MESSAGES,
+                    "description": "Most recent messages exported per conversation",
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "default": DEFAULT_EXPORT_CONCURRENCY,
+                    "description": "Message fetches running ahead of the writer",
+                },
+            },
+            "required": ["agentId"],
+        },
+    },
+}
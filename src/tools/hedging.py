@@ -0,0 +1,76 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class Hedger:
+    """
+    Hedged requests for idempotent reads.
+
+    Latencies are tracked per key (tool name). Once enough samples exist, a request that has not
+    finished within the key's `percentile` latency gets a second, identical request; whichever
+    succeeds first wins and the other one is cancelled.
+    """
+
+    def __init__(self, percentile: float = 95.0, min_delay: float = 0.05, min_samples: int = 20, window: int = 200):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.fired = 0
+        self.won = 0
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, latency: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def delay(self, key: str) -> float | None:
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    async def _timed(self, key: str, request: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await request()
+        self.record(key, time.monotonic() - started)
+        return result
+
+    async def run(self, key: str, request: Callable[[], Awaitable[T]]) -> T:
+        delay = self.delay(key)
+        primary = asyncio.ensure_future(self._timed(key, request))
+        if delay is None:
+            return await primary
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            self.fired += 1
+            hedge = asyncio.ensure_future(self._timed(key, request))
+            pending.add(hedge)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.won += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {"fired": self.fired, "won": self.won, "tracked_tools": len(self._samples)}
@@ -0,0 +1,85 @@
+import importlib.util
+import logging
+from typing import Any
+
+import httpx
+
+from src.config import HTTP2_ENABLED, HTTP_KEEPALIVE_EXPIRY, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS
+
+logger = logging.getLogger("chatvolt-mcp")
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class UpstreamClient:
+    """
+    Process-wide pooled httpx client for the Chatvolt API.
+    Opened and closed by the server lifespan; created lazily when used outside of it (tests, scripts).
+
+    With `http2=True` concurrent requests are multiplexed over a few connections. HTTP/1.1 is still
+    offered during TLS negotiation, so servers without HTTP/2 keep working, and the mode is dropped
+    entirely when the `h2` package is missing. `http1=False` forces HTTP/2 with prior knowledge
+    (cleartext h2c), which is only useful against local servers.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        http2: bool = HTTP2_ENABLED,
+        http1: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 and not _h2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; falling back to HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.http1 = http1 or not http2
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._transport = httpx.AsyncHTTPTransport(limits=self.limits, http1=self.http1, http2=self.http2)
+            self._client = httpx.AsyncClient(transport=self._transport)
+        return self._client
+
+    async def open(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._transport = None
+
+    async def __aenter__(self) -> "UpstreamClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection pool statistics (active/idle connections and configured limits)."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "open": self._client is not None and not self._client.is_closed,
+            "http2": self.http2,
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+        }
@@ -2,19 +2,75 @@ import asyncio
 import json
 import os
 import random
-import re
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
 from mcp import types
 
-from src.config import CHATVOLT_BASE_URL, get_auth_token
-from src.tools.definitions import TOOLS_DEFINITION
+from src.config import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RECOVERY_TIMEOUT,
+    CACHE_DEFAULT_TTL,
+    CACHE_MAX_BYTES,
+    CHATVOLT_BASE_URL,
+    CONCURRENCY_INITIAL_LIMIT,
+    CONCURRENCY_MAX_LIMIT,
+    CONCURRENCY_MIN_LIMIT,
+    CONCURRENCY_QUEUE_TIMEOUT,
+    HEDGE_MIN_DELAY,
+    HEDGE_PERCENTILE,
+    HEDGING_ENABLED,
+    HTTP_POOL_TIMEOUT,
+    MEDIA_DEDUP_ENABLED,
+    MEDIA_INDEX_FILE,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_TOKEN,
+    TOOL_PROFILE,
+    TOOL_SEARCH,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_JOURNAL_DIR,
+    UPLOAD_JOURNAL_TTL,
+    ZAPI_SEND_RATE,
+    get_auth_token,
+    get_request_tool_profile,
+)
+from src.tools.breaker import CircuitBreakers, breaker_key
+from src.tools.cache import ResponseCache, make_cache_key
+from src.tools.catalog import ToolCatalog
+from src.tools.concurrency import AdaptiveLimiter, LimiterTimeout
+from src.tools.definitions import load_definitions
+from src.tools.hedging import Hedger
+from src.tools.http_client import UpstreamClient
+from src.tools.local_tools import LOCAL_TOOLS
+from src.tools.media_index import MediaIndex, hash_file
+from src.tools.pagination import page_items
+from src.tools.plans import compile_plan
+from src.tools.profiles import resolve_profile
+from src.tools.rate_limit import RateLimiter, parse_retry_after
+from src.tools.results import error_text, is_error
+from src.tools.singleflight import SingleFlight
+from src.tools.streaming import SSE_DONE, ProgressCallback, StreamStats, split_sse
+from src.tools.tool_search import CORE_TOOLS, ToolIndex
+from src.tools.upload_journal import COMPLETE, UploadJournal, journal_key
+from src.tools.uploads import FileChangedError, MultipartUpload, UploadStats, stat_file
+from src.tools.validation import SchemaValidator
 
 MAX_RETRIES = 3
 BASE_DELAY = 1.0
 MAX_DELAY = 30.0
+# 429s with Retry-After pause the token's bucket instead of consuming a retry attempt, up to this many times
+MAX_RATE_LIMIT_WAITS = 5
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Per-attempt connect/read/pool-wait timeouts and the overall call budget (None = unbounded), in seconds
+DEFAULT_TIMEOUT = {"connect": 10.0, "read": 30.0, "pool": HTTP_POOL_TIMEOUT, "total": None}
+# Pages of list_artifact_media searched when confirming a deduplicated media item still exists
+MAX_MEDIA_PAGES = 20
+# Marks the response of a stream that failed after chunks were forwarded
+STREAM_INTERRUPTED = "chatvolt.stream_interrupted"
+# Request profiles whose tool views and tools/list answers are kept
+MAX_PROFILE_VIEWS = 64
 
 TOOL_ANNOTATIONS = {
     "query_agent": {
@@ -878,6 +934,55 @@ TOOL_ANNOTATIONS = {
         "idempotentHint": True,
         "openWorldHint": True,
     },
+    "batch_call": {
+        "title": "Batch Tool Calls",
+        "readOnlyHint": False,
+        "destructiveHint": True,
+        "idempotentHint": False,
+        "openWorldHint": True,
+    },
+    "paginate": {
+        "title": "Paginate List Tool",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True,
+    },
+    "export_conversations": {
+        "title": "Export Conversations",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True,
+    },
+    "import_contacts": {
+        "title": "Import Contacts",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True,
+    },
+    "query_datastores": {
+        "title": "Query Multiple Datastores",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True,
+    },
+    "search_tools": {
+        "title": "Search Tools",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+    "zapi_bulk_send": {
+        "title": "Bulk Send Z-API Messages",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True,
+    },
 }
 
 
@@ -894,37 +999,34 @@ def _make_annotations(name: str) -> types.ToolAnnotations | None:
     )
 
 
-def _validate_arguments(schema: dict, arguments: dict) -> list[str] | None:
-    """Validate arguments against the tool's inputSchema."""
-    if not schema:
-        return None
-
-    errors = []
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
-
-    for req_field in required:
-        if req_field not in arguments:
-            errors.append(f"Missing required field: {req_field}")
-
-    for field, value in arguments.items():
-        if field not in properties:
-            continue
-        field_schema = properties[field]
-        field_type = field_schema.get("type")
+def _request_profile(tool_info: dict[str, Any]) -> dict[str, Any]:
+    """
+    Resolve a tool's timeout and retry profile. Definitions may declare:
+      "timeout": {"connect": s, "read": s, "pool": s, "total": s}  (total bounds the whole call, retries included)
+      "max_retries": retries after the first attempt
+      "retry_statuses": HTTP statuses worth retrying
+    """
+    timeout = {**DEFAULT_TIMEOUT, **tool_info.get("timeout", {})}
+    return {
+        "timeout": httpx.Timeout(
+            connect=timeout["connect"], read=timeout["read"], write=timeout["read"], pool=timeout["pool"]
+        ),
+        "total": timeout["total"],
+        "max_retries": tool_info.get("max_retries", MAX_RETRIES - 1),
+        "retry_statuses": set(tool_info.get("retry_statuses", RETRYABLE_STATUS_CODES)),
+    }
 
-        if field_type == "string" and not isinstance(value, str):
-            errors.append(f"Field '{field}' must be a string")
-        elif field_type == "integer" and not isinstance(value, int):
-            errors.append(f"Field '{field}' must be an integer")
-        elif field_type == "number" and not isinstance(value, (int, float)):
-            errors.append(f"Field '{field}' must be a number")
-        elif field_type == "boolean" and not isinstance(value, bool):
-            errors.append(f"Field '{field}' must be a boolean")
-        elif field_type == "array" and not isinstance(value, list):
-            errors.append(f"Field '{field}' must be an array")
 
-    return errors if errors else None
+def _media_id(text: str) -> str | None:
+    """The ID of an uploaded media item, from either `{"id": ...}` or `{"media": {"id": ...}}`."""
+    try:
+        body = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(body, dict) and isinstance(body.get("media"), dict):
+        body = body["media"]
+    media_id = body.get("id") if isinstance(body, dict) else None
+    return media_id if isinstance(media_id, str) else None
 
 
 def _structured_result(text: str, is_error: bool = False) -> list[types.TextContent | types.EmbeddedResource]:
@@ -933,114 +1035,293 @@ def _structured_result(text: str, is_error: bool = False) -> list[types.TextCont
 
 
 class ToolRegistry:
-    def __init__(self):
-        self.tools = TOOLS_DEFINITION
+    def __init__(self, profile: str = TOOL_PROFILE):
+        # Only the definition modules of the profile are imported
+        self.profile = profile
+        self.modules = load_definitions(resolve_profile(profile))
+        self.tools = {name: info for tools in self.modules.values() for name, info in tools.items()}
+        # Local tools built on upstream tools are only offered when those tools are loaded
+        self.local_tools = {
+            name: info
+            for name, info in LOCAL_TOOLS.items()
+            if all(required in self.tools for required in info.get("requires", ()))
+        }
+        self.http = UpstreamClient()
+        self.cache = ResponseCache(CACHE_MAX_BYTES)
+        self.inflight = SingleFlight()
+        # Over HTTP/1.1 each request holds a connection, so admitting more than the pool holds only moves
+        # the queue into the pool; HTTP/2 multiplexes requests over its connections
+        max_limit = CONCURRENCY_MAX_LIMIT
+        if not self.http.http2:
+            max_limit = min(max_limit, self.http.limits.max_connections)
+        self.limiter = AdaptiveLimiter(
+            initial_limit=min(CONCURRENCY_INITIAL_LIMIT, max_limit),
+            min_limit=min(CONCURRENCY_MIN_LIMIT, max_limit),
+            max_limit=max_limit,
+            queue_timeout=CONCURRENCY_QUEUE_TIMEOUT,
+        )
+        self.rate_limits = RateLimiter(rate=RATE_LIMIT_PER_TOKEN, burst=RATE_LIMIT_BURST)
+        # Per-instance buckets keep zapi_bulk_send at an even pace across every bulk send on that instance
+        self.send_rates = RateLimiter(rate=ZAPI_SEND_RATE, burst=1)
+        self.breakers = CircuitBreakers(BREAKER_FAILURE_THRESHOLD, BREAKER_RECOVERY_TIMEOUT)
+        self.breaker_keys = {name: breaker_key(info) for name, info in self.tools.items()}
+        self.profiles = {name: _request_profile(info) for name, info in self.tools.items()}
+        self.plans = {name: compile_plan(info) for name, info in self.tools.items()}
+        self.validators = {
+            name: SchemaValidator(info.get("input_schema", {}))
+            for name, info in (self.tools | self.local_tools).items()
+        }
+        self.hedger = Hedger(percentile=HEDGE_PERCENTILE, min_delay=HEDGE_MIN_DELAY)
+        self.hedged_tools = (
+            {name for name in self.tools if TOOL_ANNOTATIONS.get(name, {}).get("readOnlyHint")}
+            if HEDGING_ENABLED
+            else set()
+        )
+        self.streams = StreamStats()
+        self.uploads = UploadStats()
+        self.upload_journal = UploadJournal(UPLOAD_JOURNAL_DIR, UPLOAD_JOURNAL_TTL) if UPLOAD_JOURNAL_DIR else None
+        self.media_index = MediaIndex(MEDIA_INDEX_FILE) if MEDIA_DEDUP_ENABLED else None
+        # Tool names and tools/list answers per request profile (None = everything loaded)
+        self._views: dict[str, frozenset[str]] = {}
+        self._catalogs: dict[str | None, tuple[tuple[int, ...], ToolCatalog]] = {}
+        self.catalog_builds = 0
+        # With tool search on, tools/list only carries CORE_TOOLS; the rest stay callable
+        self.tool_search = TOOL_SEARCH
+        self._index: ToolIndex | None = None
+        self._index_key: tuple[int, ...] | None = None
+        # Read-only, idempotent tools are cached; definitions may override the TTL with "cache_ttl"
+        self.cache_ttls = {
+            name: info.get("cache_ttl", CACHE_DEFAULT_TTL)
+            for name, info in self.tools.items()
+            if TOOL_ANNOTATIONS.get(name, {}).get("readOnlyHint") and TOOL_ANNOTATIONS[name].get("idempotentHint")
+        }
+
+    def _invalidate(self, dependencies: dict[str, dict[str, str]], arguments: dict[str, Any]) -> None:
+        """
+        Evict cached reads affected by a successful mutation.
+        `dependencies` maps a read tool to {read argument: mutation argument}; an empty mapping, or a
+        mutation argument that was not supplied, evicts every cached entry of that read tool.
+        """
+        for read_tool, id_args in dependencies.items():
+            if all(arg in arguments for arg in id_args.values()):
+                match = {read_arg: arguments[arg] for read_arg, arg in id_args.items()}
+            else:
+                match = None
+            self.cache.invalidate(read_tool, match)
+
+    def validate(self, name: str, arguments: dict[str, Any]) -> list[str] | None:
+        """Validate arguments against a tool's input schema; returns the errors, or None if they are valid."""
+        return self.validators[name].errors(arguments)
+
+    def stats(self) -> dict[str, Any]:
+        """Runtime metrics for the upstream transport, cache, request coalescing, limiters and breakers."""
+        return {
+            "pool": self.http.stats(),
+            "cache": self.cache.stats(),
+            "inflight": self.inflight.stats(),
+            "concurrency": self.limiter.stats(),
+            "rate_limits": self.rate_limits.stats(),
+            "zapi_send_rates": self.send_rates.stats(),
+            "circuit_breakers": self.breakers.stats(),
+            "hedging": {"enabled": bool(self.hedged_tools), **self.hedger.stats()},
+            "streaming": self.streams.stats(),
+            "uploads": self.uploads.stats(),
+            "media_dedup": self.media_index.stats() if self.media_index is not None else {"enabled": False},
+            "tool_list": {
+                "profile": self.profile,
+                "search": self.tool_search,
+                **self.tool_catalog(None).stats(),
+                "builds": self.catalog_builds,
+                "request_profiles": {
+                    profile: catalog.stats() for profile, (_, catalog) in self._catalogs.items() if profile
+                },
+            },
+        }
+
+    def visible_tools(self, profile: str | None) -> frozenset[str] | None:
+        """
+        Names of the tools a request profile exposes: the loaded tools of its definition modules plus the
+        local tools they support. None means no narrowing. Raises ValueError for an unknown profile.
+        """
+        if profile is None:
+            return None
+        view = self._views.get(profile)
+        if view is None:
+            modules = resolve_profile(profile)
+            names = {name for module in modules for name in self.modules.get(module, {})}
+            names.update(
+                name
+                for name, info in self.local_tools.items()
+                if all(required in names for required in info.get("requires", ()))
+            )
+            if len(self._views) >= MAX_PROFILE_VIEWS:
+                self._views.clear()
+            view = self._views[profile] = frozenset(names)
+        return view
+
+    def tool_catalog(self, profile: str | None = None) -> ToolCatalog:
+        """
+        The tools/list answer for a request profile (by default the current request's), built on first use
+        and rebuilt only when the set of tools changes.
+        """
+        profile = profile or get_request_tool_profile()
+        key = (*self._tools_key(), self.tool_search)
+        cached = self._catalogs.get(profile)
+        if cached is None or cached[0] != key:
+            view = self.visible_tools(profile)
+            if self.tool_search:
+                view = frozenset(name for name in CORE_TOOLS if view is None or name in view)
+            if len(self._catalogs) >= MAX_PROFILE_VIEWS:
+                self._catalogs.clear()
+            cached = self._catalogs[profile] = (key, ToolCatalog(self._build_tool_list(view)))
+            self.catalog_builds += 1
+        return cached[1]
+
+    def tool_index(self) -> ToolIndex:
+        """The search_tools index over every loaded tool, rebuilt only when the set of tools changes."""
+        key = self._tools_key()
+        if self._index is None or self._index_key != key:
+            self._index = ToolIndex(self.tools | self.local_tools)
+            self._index_key = key
+        return self._index
+
+    def _tools_key(self) -> tuple[int, ...]:
+        return (id(self.tools), len(self.tools), id(self.local_tools), len(self.local_tools))
+
+    def refresh_tool_catalog(self) -> None:
+        """Drop the cached tools/list answers and search index, e.g. after editing a definition in place."""
+        self._views.clear()
+        self._catalogs.clear()
+        self._index = None
 
     def get_tool_list(self) -> list[types.Tool]:
+        return list(self.tool_catalog().tools)
+
+    def _build_tool_list(self, view: frozenset[str] | None = None) -> list[types.Tool]:
         result = []
-        for name, info in self.tools.items():
-            result.append(
-                types.Tool(
-                    name=name,
-                    description=info["description"],
-                    inputSchema=info["input_schema"],
-                    annotations=_make_annotations(name),
+        for name, info in (self.tools | self.local_tools).items():
+            if view is None or name in view:
+                result.append(
+                    types.Tool(
+                        name=name,
+                        description=info["description"],
+                        inputSchema=info["input_schema"],
+                        annotations=_make_annotations(name),
+                    )
                 )
-            )
         return result
 
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[types.TextContent | types.EmbeddedResource]:
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any], progress: ProgressCallback | None = None
+    ) -> list[types.TextContent | types.EmbeddedResource]:
+        view = self.visible_tools(get_request_tool_profile())
+        if view is not None and name not in view:
+            return _structured_result(error_text(404, f"Tool {name} not found"), is_error=True)
+        if name in self.local_tools:
+            return await self._call_local_tool(name, arguments, progress)
         if name not in self.tools:
             return _structured_result(
                 json.dumps({"error": True, "status": 404, "message": f"Tool {name} not found"}), is_error=True
             )
 
         tool_info = self.tools[name]
-        method = tool_info["method"]
-        path = tool_info["path"]
-        input_schema = tool_info.get("input_schema", {})
+        plan = self.plans[name]
+        method = plan.method
 
-        validation_errors = _validate_arguments(input_schema, arguments or {})
+        arguments = arguments or {}
+        validation_errors = self.validate(name, arguments)
         if validation_errors:
             return _structured_result(
                 json.dumps({"error": True, "status": 400, "message": validation_errors}), is_error=True
             )
 
-        args_copy = arguments.copy()
-
-        # Replace path variables {id}
-        path_vars = re.findall(r"\{(\w+)\}", path)
-        for var in path_vars:
-            if var in args_copy:
-                path = path.replace(f"{{{var}}}", str(args_copy.pop(var)))
-
-        query_params = {}
-        json_body = {}
-
-        # Special case for toggle_webhook query parameters
-        if name == "toggle_webhook":
-            if "type" in args_copy:
-                query_params["type"] = args_copy.pop("type")
-            if "enabled" in args_copy:
-                query_params["enabled"] = str(args_copy.pop("enabled")).lower()
-
-        # Special case for search_artifacts: convert lists to comma-separated strings
-        if name == "search_artifacts":
-            for key in ["ids", "categoryIds", "mediaTypes"]:
-                if key in args_copy and isinstance(args_copy[key], list):
-                    args_copy[key] = ",".join(map(str, args_copy[key]))
-
-        if method == "GET":
-            query_params.update(args_copy)
-        else:
-            json_body.update(args_copy)
+        cache_ttl = self.cache_ttls.get(name, 0) if self.cache.enabled else 0
+        cache_key = None
+        cache_generation = self.cache.generation(name)
+        if cache_ttl > 0:
+            cache_key = make_cache_key(get_auth_token(), name, arguments)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return _structured_result(cached)
 
+        path, query_params, json_body = plan.fill(arguments)
         url = f"{CHATVOLT_BASE_URL}{path}"
 
+        profile = self.profiles[name]
         headers = {"Content-Type": "application/json"}
-        # get_models doesn't need auth according to the request
-        if name != "get_models":
+        if plan.auth:
             headers["Authorization"] = f"Bearer {get_auth_token()}"
 
+        upload = None
+        journal = None
+        if plan.is_upload(arguments):
+            file_path = arguments.get("file_path")
+            file_info = await stat_file(file_path) if file_path else None
+            if file_info is None:
+                return _structured_result(
+                    json.dumps({"error": True, "status": 400, "message": f"File not found: {file_path}"}),
+                    is_error=True,
+                )
+            if name == "upload_artifact_media":
+                data = {
+                    "artifact_id": arguments.get("artifact_id"),
+                    "name": arguments.get("name"),
+                    "alt_description": arguments.get("alt_description", ""),
+                }
+            else:
+                data = {
+                    "type": "file",
+                    "datastoreId": arguments.get("datastoreId"),
+                    "fileName": arguments.get("fileName") or os.path.basename(file_path),
+                    "custom_id": arguments.get("custom_id", ""),
+                }
+            checksums = None
+            media_digest = None
+            if name == "upload_artifact_media" and self.media_index is not None:
+                artifact_id = arguments["artifact_id"]
+                media_digest = await hash_file(file_path, UPLOAD_CHUNK_SIZE)
+                media_id = await self.media_index.get(artifact_id, media_digest)
+                if media_id is not None:
+                    existing = await self._find_artifact_media(artifact_id, media_id)
+                    if existing is not None:
+                        self.media_index.hits += 1
+                        self.media_index.bytes_saved += file_info.st_size
+                        return _structured_result(json.dumps(existing))
+                    # Deleted upstream since it was indexed
+                    await self.media_index.forget(artifact_id, media_digest)
+            if name == "create_datasource" and self.upload_journal is not None:
+                # Resumable mode: a transfer that already completed is not sent again after a restart
+                key = journal_key(
+                    json.dumps([name, data], sort_keys=True),
+                    get_auth_token(),
+                    file_path,
+                    file_info.st_size,
+                    file_info.st_mtime_ns,
+                )
+                entry = await self.upload_journal.load(key, UPLOAD_CHUNK_SIZE)
+                if entry["state"] == COMPLETE:
+                    # Returned once: a later call of the same file is a new upload (e.g. after a delete)
+                    await self.upload_journal.discard(key)
+                    return _structured_result(entry["result"])
+                journal = (key, entry)
+                checksums = entry["checksums"]
+            upload = MultipartUpload(
+                data,
+                file_path,
+                file_info.st_size,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                progress=progress,
+                stats=self.uploads,
+                checksums=checksums,
+            )
+            headers.pop("Content-Type", None)
+            headers.update(upload.headers)
+
         async def make_request(
             client: httpx.AsyncClient,
         ) -> httpx.Response:
-            if name == "upload_artifact_media" or (name == "create_datasource" and arguments.get("type") == "file"):
-                file_path = arguments.get("file_path")
-                if not file_path or not os.path.exists(file_path):
-                    return _structured_result(
-                        json.dumps({"error": True, "status": 400, "message": f"File not found: {file_path}"}),
-                        is_error=True,
-                    )
-
-                with open(file_path, "rb") as f:
-                    files = {
-                        "file": (os.path.basename(file_path), f),
-                    }
-
-                    if name == "upload_artifact_media":
-                        data = {
-                            "artifact_id": arguments.get("artifact_id"),
-                            "name": arguments.get("name"),
-                            "alt_description": arguments.get("alt_description", ""),
-                        }
-                    else:
-                        data = {
-                            "type": "file",
-                            "datastoreId": arguments.get("datastoreId"),
-                            "fileName": arguments.get("fileName") or os.path.basename(file_path),
-                            "custom_id": arguments.get("custom_id", ""),
-                        }
-
-                    headers.pop("Content-Type", None)
-
-                    return await client.post(
-                        url,
-                        headers=headers,
-                        data=data,
-                        files=files,
-                        timeout=60.0,
-                    )
+            if upload is not None:
+                return await client.post(url, headers=headers, content=upload, timeout=profile["timeout"])
             else:
                 return await client.request(
                     method=method,
@@ -1048,46 +1329,238 @@ class ToolRegistry:
                     headers=headers,
                     params=query_params,
                     json=json_body if json_body else None,
-                    timeout=30.0,
+                    timeout=profile["timeout"],
                 )
 
+        async def make_stream_request(client: httpx.AsyncClient) -> httpx.Response:
+            started = time.monotonic()
+            async with client.stream(
+                method,
+                url,
+                headers=headers,
+                params=query_params,
+                json=json_body if json_body else None,
+                timeout=profile["timeout"],
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    return response
+                return await self._relay(response, started, progress)
+
+        if upload is not None:
+            try:
+                ok, text = await self._send(name, make_request)
+            except FileChangedError as e:
+                # Checksums from earlier attempts no longer apply, so start the journal over
+                if journal is not None:
+                    await self.upload_journal.discard(journal[0])
+                    journal = None
+                ok, text = False, json.dumps({"error": True, "status": 409, "message": str(e)})
+            if ok and media_digest is not None:
+                media_id = _media_id(text)
+                if media_id is not None:
+                    await self.media_index.put(arguments["artifact_id"], media_digest, media_id)
+            if journal is not None:
+                key, entry = journal
+                if ok:
+                    entry.update(state=COMPLETE, result=text)
+                await self.upload_journal.save(key, entry)
+        elif arguments.get(tool_info.get("stream_argument", "")) is True:
+            ok, text = await self._send(name, make_stream_request)
+        elif method == "GET" and TOOL_ANNOTATIONS.get(name, {}).get("idempotentHint"):
+            # Identical concurrent GETs share a single upstream request; a call made after an invalidation
+            # does not join a request that started before it
+            flight_key = (
+                get_auth_token(),
+                url,
+                json.dumps(query_params, sort_keys=True, default=str),
+                cache_generation,
+            )
+            ok, text = await self.inflight.do(flight_key, lambda: self._send(name, make_request))
+        else:
+            ok, text = await self._send(name, make_request)
+
+        if ok:
+            if cache_key is not None:
+                self.cache.set(cache_key, text, cache_ttl, arguments, cache_generation)
+            elif "invalidates" in tool_info:
+                self._invalidate(tool_info["invalidates"], arguments)
+        return _structured_result(text, is_error=not ok)
+
+    async def _call_local_tool(
+        self, name: str, arguments: dict[str, Any], progress: ProgressCallback | None
+    ) -> list[types.TextContent | types.EmbeddedResource]:
+        tool_info = self.local_tools[name]
+        arguments = self.validators[name].with_defaults(arguments or {})
+        validation_errors = self.validate(name, arguments)
+        if validation_errors:
+            return _structured_result(error_text(400, validation_errors), is_error=True)
+        ok, text = await tool_info["handler"](self, arguments, progress)
+        return _structured_result(text, is_error=not ok)
+
+    async def _find_artifact_media(self, artifact_id: str, media_id: str) -> dict[str, Any] | None:
+        """Look up one media item by paging through `list_artifact_media`; None if it is gone or the listing fails."""
+        arguments = {"artifact_id": artifact_id, "limit": 100}
+        for _ in range(MAX_MEDIA_PAGES):
+            result = await self.call_tool("list_artifact_media", arguments)
+            if is_error(result[0].text):
+                return None
+            items, cursor = page_items(json.loads(result[0].text))
+            for item in items:
+                if isinstance(item, dict) and item.get("id") == media_id:
+                    return item
+            if cursor is None:
+                return None
+            arguments = {**arguments, "cursor": cursor}
+        return None
+
+    async def _relay(
+        self, response: httpx.Response, started: float, progress: ProgressCallback | None
+    ) -> httpx.Response:
+        """
+        Forward a streamed upstream body chunk by chunk (SSE `data:` payloads, or raw text otherwise)
+        while accumulating it. Returns a buffered response holding the full body.
+        """
+        is_sse = response.headers.get("content-type", "").startswith("text/event-stream")
+        body: list[str] = []
+        pending = ""
+        chunks = 0
+        try:
+            async for text in response.aiter_text():
+                if not body:
+                    self.streams.first_token(time.monotonic() - started)
+                body.append(text)
+                if is_sse:
+                    payloads, pending = split_sse(pending + text)
+                else:
+                    payloads = [text]
+                for payload in payloads:
+                    if not payload or payload == SSE_DONE:
+                        continue
+                    chunks += 1
+                    self.streams.chunks += 1
+                    if progress is not None:
+                        await progress(payload, chunks, None)
+        except httpx.RequestError as e:
+            # Chunks were already forwarded, so a mid-stream failure is reported instead of retried
+            self.streams.interrupted += 1
+            return httpx.Response(
+                502,
+                text=f"Upstream stream interrupted after {chunks} chunks: {e}",
+                request=response.request,
+                extensions={STREAM_INTERRUPTED: True},
+            )
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": response.headers.get("content-type", "text/plain")},
+            content="".join(body).encode(response.encoding or "utf-8"),
+            request=response.request,
+        )
+
+    async def _send(
+        self, name: str, make_request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+    ) -> tuple[bool, str]:
+        """Send an upstream request with retries. Returns (ok, text) where text is the body or a structured error."""
+        total = self.profiles[name]["total"]
+        try:
+            async with asyncio.timeout(total):
+                return await self._send_with_retries(name, make_request)
+        except TimeoutError:
+            return False, json.dumps({"error": True, "status": 504, "message": f"Tool {name} timed out after {total}s"})
+
+    async def _send_with_retries(
+        self, name: str, make_request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+    ) -> tuple[bool, str]:
+        profile = self.profiles[name]
+        max_attempts = profile["max_retries"] + 1
         last_exception = None
-        async with httpx.AsyncClient() as client:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    response = await make_request(client)
-                    response.raise_for_status()
-                    return _structured_result(response.text)
-                except httpx.HTTPStatusError as e:
-                    status_code = e.response.status_code
-                    if status_code in RETRYABLE_STATUS_CODES and attempt < MAX_RETRIES - 1:
-                        delay = min(BASE_DELAY * (2**attempt) + random.uniform(0, 1), MAX_DELAY)
-                        if status_code == 429:
-                            retry_after = e.response.headers.get("retry-after")
-                            if retry_after:
-                                delay = min(float(retry_after), MAX_DELAY)
-                        await asyncio.sleep(delay)
-                        last_exception = e
+        client = self.http.client
+        token = get_auth_token()
+        breaker_name = self.breaker_keys[name]
+        breaker = self.breakers.get(breaker_name)
+        attempt = 0
+        rate_limited = 0
+        while attempt < max_attempts:
+            if not breaker.allow():
+                message = f"Circuit open for {breaker_name} after repeated upstream failures; retry in {breaker.retry_in():.0f}s"
+                return False, json.dumps({"error": True, "status": 503, "message": message})
+            try:
+                await self.rate_limits.acquire(token)
+                if name in self.hedged_tools:
+                    response = await self.hedger.run(name, lambda: self._limited(name, make_request, client))
+                else:
+                    response = await self._limited(name, make_request, client)
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                response.raise_for_status()
+                return True, response.text
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                last_exception = e
+                if status_code == 429:
+                    retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+                    if retry_after is not None and rate_limited < MAX_RATE_LIMIT_WAITS:
+                        # Pause every call sharing this token; waiting on the bucket does not burn an attempt
+                        self.rate_limits.pause(token, min(retry_after, MAX_DELAY))
+                        rate_limited += 1
                         continue
-                    return _structured_result(
-                        json.dumps({"error": True, "status": e.response.status_code, "message": e.response.text}),
-                        is_error=True,
-                    )
-                except httpx.RequestError as e:
-                    if attempt < MAX_RETRIES - 1:
-                        delay = min(BASE_DELAY * (2**attempt) + random.uniform(0, 1), MAX_DELAY)
+                # Part of the stream already reached the client, so it is never sent again
+                retryable = status_code in profile["retry_statuses"] and not e.response.extensions.get(
+                    STREAM_INTERRUPTED
+                )
+                if retryable and attempt < max_attempts - 1:
+                    delay = min(BASE_DELAY * (2**attempt) + random.uniform(0, 1), MAX_DELAY)
+                    if status_code == 429:
+                        self.rate_limits.pause(token, delay)
+                    else:
                         await asyncio.sleep(delay)
-                        last_exception = e
-                        continue
-                    return _structured_result(
-                        json.dumps({"error": True, "status": 500, "message": str(e)}),
-                        is_error=True,
-                    )
+                    attempt += 1
+                    continue
+                return False, json.dumps({"error": True, "status": e.response.status_code, "message": e.response.text})
+            except httpx.RequestError as e:
+                # Waiting for a pooled connection is local saturation, not an upstream failure
+                if not isinstance(e, httpx.PoolTimeout):
+                    breaker.record_failure()
+                if attempt < max_attempts - 1:
+                    delay = min(BASE_DELAY * (2**attempt) + random.uniform(0, 1), MAX_DELAY)
+                    await asyncio.sleep(delay)
+                    last_exception = e
+                    attempt += 1
+                    continue
+                return False, json.dumps({"error": True, "status": 500, "message": str(e)})
+            except LimiterTimeout as e:
+                return False, json.dumps({"error": True, "status": 503, "message": str(e)})
 
-        return _structured_result(
-            json.dumps({"error": True, "status": 500, "message": str(last_exception)}),
-            is_error=True,
-        )
+        return False, json.dumps({"error": True, "status": 500, "message": str(last_exception)})
+
+    async def _limited(
+        self,
+        name: str,
+        make_request: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+        client: httpx.AsyncClient,
+    ) -> httpx.Response:
+        """Run one upstream attempt under the adaptive concurrency limit and feed its outcome back."""
+        await self.limiter.acquire()
+        started = time.monotonic()
+        overloaded = cancelled = False
+        try:
+            response = await make_request(client)
+            overloaded = response.status_code in RETRYABLE_STATUS_CODES
+            return response
+        except httpx.RequestError as e:
+            overloaded = isinstance(e, httpx.TimeoutException)
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            if cancelled:
+                # A hedge loser or a caller's deadline: neither a success nor a latency sample
+                self.limiter.abandon()
+            else:
+                self.limiter.release(time.monotonic() - started, overloaded, key=name)
 
 
 # Singleton instance
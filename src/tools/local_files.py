@@ -0,0 +1,30 @@
+import hashlib
+import os
+import re
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def safe_name(text: str) -> str:
+    """`text` reduced to characters that are safe in a file name, e.g. an ID used in a generated name."""
+    return _UNSAFE.sub("-", text).strip(".-") or "file"
+
+
+def token_directory(directory: str, token: str | None) -> str:
+    """The subdirectory of `directory` owned by an auth token, named after a hash of the token."""
+    return os.path.join(directory, hashlib.sha256((token or "").encode()).hexdigest()[:16])
+
+
+def resolve_file(directory: str, name: str) -> str:
+    """
+    The path of `name` inside the server-controlled `directory`. Only a bare file name is accepted:
+    absolute paths, separators, "..", and names that resolve (e.g. through a symlink) outside the
+    directory raise ValueError.
+    """
+    if not name or name in (".", "..") or "/" in name or "\\" in name or os.path.isabs(name):
+        raise ValueError(f"Expected a bare file name, got {name!r}")
+    root = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(root, name))
+    if os.path.dirname(path) != root:
+        raise ValueError(f"File name {name!r} resolves outside {directory}")
+    return path
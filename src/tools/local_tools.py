@@ -0,0 +1,22 @@
+from typing import Any
+
+from src.tools.batch import TOOLS as BATCH_TOOLS
+from src.tools.contacts_import import TOOLS as CONTACTS_IMPORT_TOOLS
+from src.tools.export import TOOLS as EXPORT_TOOLS
+from src.tools.multi_query import TOOLS as MULTI_QUERY_TOOLS
+from src.tools.pagination import TOOLS as PAGINATION_TOOLS
+from src.tools.tool_search import TOOLS as TOOL_SEARCH_TOOLS
+from src.tools.zapi_bulk import TOOLS as ZAPI_BULK_TOOLS
+
+# Tools implemented inside the server on top of the registry rather than by a single upstream endpoint.
+# Each entry has a description, an input_schema and a handler(registry, arguments, progress) -> (ok, text).
+# An optional "requires" lists the upstream tools it calls; the tool is only offered when they are loaded.
+LOCAL_TOOLS: dict[str, dict[str, Any]] = {
+    **BATCH_TOOLS,
+    **PAGINATION_TOOLS,
+    **EXPORT_TOOLS,
+    **CONTACTS_IMPORT_TOOLS,
+    **ZAPI_BULK_TOOLS,
+    **MULTI_QUERY_TOOLS,
+    **TOOL_SEARCH_TOOLS,
+}
@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+import json
+import os
+from typing import Any
+
+
+def _hash_file(path: str, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+async def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in chunks from a worker thread."""
+    return await asyncio.to_thread(_hash_file, path, chunk_size)
+
+
+class MediaIndex:
+    """
+    Content hash -> media ID, per artifact, for deduplicating `upload_artifact_media`.
+    Kept in memory and, when `path` is set, persisted as a JSON file loaded on first use.
+    """
+
+    def __init__(self, path: str = ""):
+        self.path = os.path.expanduser(path) if path else ""
+        self.hits = 0
+        self.bytes_saved = 0
+        self._entries: dict[str, dict[str, str]] | None = None
+
+    def _read(self) -> dict[str, dict[str, str]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, text: str) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, self.path)
+
+    async def _load(self) -> dict[str, dict[str, str]]:
+        if self._entries is None:
+            loaded = await asyncio.to_thread(self._read) if self.path else {}
+            if self._entries is None:
+                self._entries = loaded
+        return self._entries
+
+    async def _save(self) -> None:
+        if self.path:
+            await asyncio.to_thread(self._write, json.dumps(self._entries))
+
+    async def get(self, artifact_id: str, digest: str) -> str | None:
+        return (await self._load()).get(artifact_id, {}).get(digest)
+
+    async def put(self, artifact_id: str, digest: str, media_id: str) -> None:
+        (await self._load()).setdefault(artifact_id, {})[digest] = media_id
+        await self._save()
+
+    async def forget(self, artifact_id: str, digest: str) -> None:
+        if (await self._load()).get(artifact_id, {}).pop(digest, None) is not None:
+            await self._save()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": sum(len(hashes) for hashes in (self._entries or {}).values()),
+            "hits": self.hits,
+            "bytes_saved": self.bytes_saved,
+        }
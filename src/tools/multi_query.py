@@ -0,0 +1,116 @@
+import asyncio
+import heapq
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.tools.pagination import page_items
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+MAX_DATASTORES = 20
+DEFAULT_TOP_K = 10
+DEFAULT_DATASTORE_TIMEOUT = 5.0
+
+
+def _score(item: dict[str, Any]) -> float:
+    score = item.get("score")
+    return float(score) if isinstance(score, int | float) else float("-inf")
+
+
+async def query_datastores(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Run `query_datastore` against several datastores at once and merge the results by score.
+
+    Every datastore gets the same `timeout` budget; one that has not answered by then is cancelled and
+    reported as timed out, so the merged top-K is built from the datastores that did answer.
+    """
+    ids = list(dict.fromkeys(arguments["ids"]))
+    top_k = arguments.get("topK", DEFAULT_TOP_K)
+    timeout = arguments.get("timeout", DEFAULT_DATASTORE_TIMEOUT)
+    if not ids or len(ids) > MAX_DATASTORES:
+        return False, error_text(400, f"query_datastores needs between 1 and {MAX_DATASTORES} datastore IDs")
+    query_args = {key: arguments[key] for key in ("query", "filters") if key in arguments}
+    done = 0
+
+    async def query(datastore_id: str) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        nonlocal done
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(
+                registry.call_tool("query_datastore", {"id": datastore_id, **query_args, "topK": top_k}), timeout
+            )
+        except TimeoutError:
+            items, status = [], {"ok": False, "error": f"Timed out after {timeout}s"}
+        else:
+            text = result[0].text
+            if is_error(text):
+                items, status = [], {"ok": False, "error": parse_text(text)}
+            else:
+                items, _ = page_items(parse_text(text))
+                items = [{**item, "datastoreId": datastore_id} for item in items if isinstance(item, dict)]
+                status = {"ok": True, "results": len(items)}
+        status["ms"] = round((time.monotonic() - started) * 1000, 1)
+        done += 1
+        if progress is not None:
+            await progress(f"{done}/{len(ids)} datastores answered", done, len(ids))
+        return items, status
+
+    answers = await asyncio.gather(*(query(datastore_id) for datastore_id in ids))
+    if not any(status["ok"] for _, status in answers):
+        errors = {datastore_id: status["error"] for datastore_id, (_, status) in zip(ids, answers, strict=True)}
+        return False, error_text(502, f"No datastore answered: {json.dumps(errors)}")
+    merged = heapq.nlargest(top_k, (item for items, _ in answers for item in items), key=_score)
+    summary = {
+        "results": merged,
+        "datastores": {datastore_id: status for datastore_id, (_, status) in zip(ids, answers, strict=True)},
+        "complete": all(status["ok"] for _, status in answers),
+    }
+    return True, json.dumps(summary)
+
+
+TOOLS = {
+    "query_datastores": {
+        "handler": query_datastores,
+        "requires": ["query_datastore"],
+        "description": (
+            "Query several datastores concurrently with the same question and return a single top-K list "
+            "merged by score, each result tagged with its datastoreId. A datastore that fails or exceeds the "
+            "per-datastore timeout is reported in 'datastores' without holding back the others."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": f"IDs of the datastores to query (at most {MAX_DATASTORES})",
+                },
+                "query": {"type": "string", "description": "The question or query for the datastores"},
+                "topK": {
+                    "type": "integer",
+                    "default": DEFAULT_TOP_K,
+                    "description": "Number of merged results to return",
+                },
+                "filters": {
+                    "type": "object",
+                    "properties": {
+                        "custom_ids": {"type": "array", "items": {"type": "string"}},
+                        "datasource_ids": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+                "timeout": {
+                    "type": "number",
+                    "default": DEFAULT_DATASTORE_TIMEOUT,
+                    "description": "Seconds each datastore has to answer before it is left out",
+                },
+            },
+            "required": ["ids", "query"],
+        },
+    },
+}
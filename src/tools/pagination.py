@@ -0,0 +1,144 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
+
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+DEFAULT_MAX_ITEMS = 1000
+DEFAULT_MAX_BYTES = 512 * 1024
+
+
+def page_items(body: Any) -> tuple[list[Any], str | None]:
+    """
+    Split a list response into its items and the cursor of the next page.
+    Items are the body itself when it is a list, otherwise its first list value.
+    """
+    if isinstance(body, list):
+        return body, None
+    if not isinstance(body, dict):
+        return [], None
+    items = next((value for value in body.values() if isinstance(value, list)), [])
+    cursor = body.get("nextCursor") or body.get("next_cursor")
+    return items, cursor if isinstance(cursor, str) else None
+
+
+async def iter_pages(
+    registry: "ToolRegistry", name: str, arguments: dict[str, Any], cursor: str | None = None
+) -> AsyncIterator[tuple[str | None, str, list[Any], str | None]]:
+    """
+    Walk a cursor-paginated list tool, yielding (cursor, text, items, next_cursor) per page.
+    The next page is requested as soon as its cursor is known, so it downloads while the caller
+    processes the current one. An error page is yielded with no items and ends the walk.
+    """
+
+    def fetch(page_cursor: str | None) -> asyncio.Future:
+        page_args = {**arguments, "cursor": page_cursor} if page_cursor else arguments
+        return asyncio.ensure_future(registry.call_tool(name, page_args))
+
+    pending = fetch(cursor)
+    seen = {cursor}
+    try:
+        while pending is not None:
+            text = (await pending)[0].text
+            pending = None
+            items, next_cursor = ([], None) if is_error(text) else page_items(parse_text(text))
+            if next_cursor in seen:
+                next_cursor = None
+            if next_cursor is not None:
+                seen.add(next_cursor)
+                pending = fetch(next_cursor)
+            yield cursor, text, items, next_cursor
+            cursor = next_cursor
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def paginate(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Follow the cursors of a list tool until the collection ends or the item/byte budget is spent.
+    Pages are merged whole; when the budget stops the walk, `next_cursor` continues where it left off.
+    """
+    name = arguments["name"]
+    tool_info = registry.tools.get(name)
+    if tool_info is None or "cursor" not in tool_info["input_schema"].get("properties", {}):
+        return False, error_text(400, f"{name} is not a cursor-paginated list tool")
+    tool_args = dict(arguments.get("arguments") or {})
+    cursor = arguments.get("cursor") or tool_args.pop("cursor", None)
+    max_items = arguments.get("max_items", DEFAULT_MAX_ITEMS)
+    max_bytes = arguments.get("max_bytes", DEFAULT_MAX_BYTES)
+
+    items: list[Any] = []
+    size = 0
+    pages = 0
+    next_cursor = cursor
+    error = None
+    walk = iter_pages(registry, name, tool_args, cursor)
+    try:
+        async for _, text, page, following in walk:
+            if is_error(text):
+                if pages == 0:
+                    return False, text
+                error = parse_text(text)
+                break
+            page_size = len(text.encode())
+            if pages and (len(items) + len(page) > max_items or size + page_size > max_bytes):
+                break
+            items.extend(page)
+            size += page_size
+            pages += 1
+            next_cursor = following
+            if progress is not None:
+                await progress(f"Fetched page {pages} of {name} ({len(items)} items)", pages, None)
+            if len(items) >= max_items or size >= max_bytes:
+                break
+    finally:
+        await walk.aclose()
+    result = {
+        "items": items,
+        "pages": pages,
+        "bytes": size,
+        "next_cursor": next_cursor,
+        "complete": next_cursor is None,
+    }
+    if error is not None:
+        result["error"] = error
+    return True, json.dumps(result)
+
+
+TOOLS = {
+    "paginate": {
+        "handler": paginate,
+        "description": (
+            "Fetch every page of a cursor-paginated list tool (e.g. list_conversations, list_contacts, "
+            "list_dispatches, list_crm_logs) in one call. Stops at max_items or max_bytes and then returns "
+            "next_cursor, which can be passed back as cursor to continue."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the list tool to paginate"},
+                "arguments": {"type": "object", "description": "Arguments for the list tool (filters, limit)"},
+                "cursor": {"type": "string", "description": "Continuation cursor returned by a previous call"},
+                "max_items": {
+                    "type": "integer",
+                    "default": DEFAULT_MAX_ITEMS,
+                    "description": "Stop once this many items were collected",
+                },
+                "max_bytes": {
+                    "type": "integer",
+                    "default": DEFAULT_MAX_BYTES,
+                    "description": "Stop once the fetched pages reach this size",
+                },
+            },
+            "required": ["name"],
+        },
+    },
+}
@@ -0,0 +1,90 @@
+import re
+from dataclasses import dataclass
+from typing import Any
+
+PATH_VARIABLE = re.compile(r"\{(\w+)\}")
+
+
+def _csv(value: Any) -> Any:
+    return ",".join(map(str, value)) if isinstance(value, list) else value
+
+
+def _lower(value: Any) -> str:
+    return str(value).lower()
+
+
+@dataclass(frozen=True, slots=True)
+class ToolPlan:
+    """
+    Request layout of one upstream tool, compiled once from its definition so a call only fills it in.
+
+    The path is `prefix` followed by (variable, default, literal) triples in `path_parts`; a variable
+    that is neither supplied nor has a schema default keeps its placeholder. Arguments named in
+    `query_args` go to the query string whatever the method; the rest go to the query string for GET
+    and to the JSON body otherwise. `transforms` rewrite argument values before routing. `upload_when` lists the (argument, value) pairs that make a call a file upload.
+    """
+
+    method: str
+    prefix: str
+    path_parts: tuple[tuple[str, Any, str], ...]
+    query_args: frozenset[str]
+    args_in_query: bool
+    transforms: tuple[tuple[str, Any], ...]
+    auth: bool
+    upload_when: tuple[tuple[str, Any], ...] | None
+
+    def path(self, args: dict[str, Any]) -> str:
+        """The request path; path arguments are popped from `args`."""
+        path = self.prefix
+        for var, default, literal in self.path_parts:
+            path += f"{args.pop(var) if var in args else default}{literal}"
+        return path
+
+    def fill(self, arguments: dict[str, Any]) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        """Route call arguments into (path, query params, JSON body)."""
+        args = dict(arguments)
+        if self.transforms:
+            for arg, transform in self.transforms:
+                if arg in args:
+                    args[arg] = transform(args[arg])
+        path = self.path(args)
+        if self.args_in_query:
+            return path, args, {}
+        query = {arg: args.pop(arg) for arg in self.query_args if arg in args}
+        return path, query, args
+
+    def is_upload(self, arguments: dict[str, Any]) -> bool:
+        return self.upload_when is not None and all(arguments.get(arg) == value for arg, value in self.upload_when)
+
+
+def compile_plan(tool_info: dict[str, Any]) -> ToolPlan:
+    """
+    Compile a tool definition. Besides method and path, definitions may declare:
+      "query_args": arguments sent as query parameters even when the method has a body
+      "csv_args": list arguments sent as one comma-separated value
+      "auth": False for endpoints called without the bearer token
+      "file_upload": True, or {argument: value} conditions, for multipart file uploads
+    """
+    path = tool_info["path"]
+    method = tool_info["method"]
+    properties = tool_info["input_schema"].get("properties", {})
+    query_args = frozenset(tool_info.get("query_args", ()))
+    transforms = [(arg, _csv) for arg in tool_info.get("csv_args", ())]
+    if method != "GET":
+        # Booleans in the query string are spelled the way the API expects them
+        transforms += [(arg, _lower) for arg in sorted(query_args) if properties.get(arg, {}).get("type") == "boolean"]
+    file_upload = tool_info.get("file_upload")
+    segments = PATH_VARIABLE.split(path)
+    return ToolPlan(
+        method=method,
+        prefix=segments[0],
+        path_parts=tuple(
+            (var, properties.get(var, {}).get("default", f"{{{var}}}"), literal)
+            for var, literal in zip(segments[1::2], segments[2::2], strict=True)
+        ),
+        query_args=query_args,
+        args_in_query=method == "GET",
+        transforms=tuple(transforms),
+        auth=tool_info.get("auth", True),
+        upload_when=None if not file_upload else tuple(file_upload.items()) if isinstance(file_upload, dict) else (),
+    )
@@ -0,0 +1,41 @@
+from src.tools.definitions import DEFINITION_MODULES
+
+FULL_PROFILE = "full"
+
+# Named tool profiles: the definition modules each one loads and exposes
+PROFILES: dict[str, tuple[str, ...]] = {
+    FULL_PROFILE: DEFINITION_MODULES,
+    "core": ("agents", "conversations", "conversation_mgmt", "contacts", "datastores", "datasources"),
+    "crm": ("crm", "crm_scenarios", "crm_logs", "contacts", "conversations", "conversation_mgmt"),
+    "knowledge": ("agents", "datastores", "datasources"),
+    "messaging": (
+        "conversations",
+        "contacts",
+        "dispatches",
+        "blacklist",
+        "whitelist",
+        "zapi",
+        "whatsapp_official",
+        "interactive",
+        "twilio",
+        "telegram",
+        "instagram",
+    ),
+    "commerce": ("artifacts", "mercadolivre", "zapper"),
+}
+
+
+def resolve_profile(profile: str) -> tuple[str, ...]:
+    """
+    The definition modules of a profile: a name from PROFILES, or a comma-separated list of profile
+    and module names (e.g. "crm,zapi"). Raises ValueError for anything unknown.
+    """
+    modules: set[str] = set()
+    for part in (part.strip() for part in profile.split(",")):
+        if part in PROFILES:
+            modules.update(PROFILES[part])
+        elif part in DEFINITION_MODULES:
+            modules.add(part)
+        else:
+            raise ValueError(f"Unknown tool profile or definition module: {part!r}")
+    return tuple(module for module in DEFINITION_MODULES if module in modules)
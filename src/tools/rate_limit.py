@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either as delay seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `burst`. A rate of 0 disables the refill
+    limit, so only pauses apply. `pause()` blocks every caller until the given delay has passed.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(float(self.burst), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for a pause to expire or for a refill. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                delay = self.paused_until - now
+            elif self.rate <= 0:
+                return waited
+            else:
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    @property
+    def idle(self) -> bool:
+        now = time.monotonic()
+        return now >= self.paused_until and (
+            self.rate <= 0 or self.tokens + (now - self._updated) * self.rate >= self.burst
+        )
+
+
+class RateLimiter:
+    """Per-auth-token token buckets shared by every concurrent call made with that token."""
+
+    MAX_BUCKETS = 1024
+
+    def __init__(self, rate: float = 0.0, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.pauses = 0
+        self.waits = 0
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, token: str | None) -> TokenBucket:
+        key = hashlib.sha256((token or "").encode()).hexdigest()[:16]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_BUCKETS:
+                self._buckets = {k: b for k, b in self._buckets.items() if not b.idle}
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    async def acquire(self, token: str | None) -> None:
+        if await self.bucket(token).acquire():
+            self.waits += 1
+
+    def pause(self, token: str | None, seconds: float) -> None:
+        self.bucket(token).pause(seconds)
+        self.pauses += 1
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "buckets": len(self._buckets),
+            "paused_buckets": sum(1 for b in self._buckets.values() if b.paused_until > now),
+            "pauses": self.pauses,
+            "waits": self.waits,
+        }
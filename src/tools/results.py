@@ -0,0 +1,19 @@
+import json
+from typing import Any
+
+
+def error_text(status: int, message: Any) -> str:
+    """A tool error in the structured format returned by every tool."""
+    return json.dumps({"error": True, "status": status, "message": message})
+
+
+def is_error(text: str) -> bool:
+    return text.startswith('{"error": true')
+
+
+def parse_text(text: str) -> Any:
+    """Decode a tool result as JSON, falling back to the raw text."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
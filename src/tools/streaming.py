@@ -0,0 +1,56 @@
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Receives (message, progress, total) for every update sent while a tool call is still running
+ProgressCallback = Callable[[str, float, float | None], Awaitable[None]]
+
+SSE_DONE = "[DONE]"
+
+
+def split_sse(buffer: str) -> tuple[list[str], str]:
+    """
+    Extract the `data:` payloads of every complete line in `buffer`.
+    Returns the payloads and the trailing, not yet terminated line.
+    """
+    *lines, rest = buffer.split("\n")
+    payloads = []
+    for line in lines:
+        line = line.rstrip("\r")
+        if line.startswith("data:"):
+            payload = line[5:]
+            payloads.append(payload[1:] if payload.startswith(" ") else payload)
+    return payloads, rest
+
+
+class StreamStats:
+    """Counters and time-to-first-token samples for streamed upstream responses."""
+
+    def __init__(self, window: int = 200):
+        self.streams = 0
+        self.chunks = 0
+        self.interrupted = 0
+        self._ttft: deque[float] = deque(maxlen=window)
+
+    def first_token(self, seconds: float) -> None:
+        self.streams += 1
+        self._ttft.append(seconds)
+
+    def stats(self) -> dict[str, Any]:
+        ordered = sorted(self._ttft)
+
+        def percentile(p: float) -> float | None:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1000, 1)
+
+        return {
+            "streams": self.streams,
+            "chunks": self.chunks,
+            "interrupted": self.interrupted,
+            "ttft_ms": {
+                "last": round(self._ttft[-1] * 1000, 1) if self._ttft else None,
+                "p50": percentile(50),
+                "p95": percentile(95),
+            },
+        }
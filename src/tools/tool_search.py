@@ -0,0 +1,166 @@
+import bisect
+import json
+import math
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from src.config import get_request_tool_profile
+from src.tools.results import error_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+DEFAULT_SEARCH_LIMIT = 5
+MAX_SEARCH_LIMIT = 20
+
+# Tools listed next to search_tools when CHATVOLT_TOOL_SEARCH trims tools/list
+CORE_TOOLS = (
+    "list_agents",
+    "get_agent",
+    "query_agent",
+    "list_conversations",
+    "get_conversation_messages",
+    "list_contacts",
+    "query_datastore",
+    "batch_call",
+    "search_tools",
+)
+
+# Weight of a term by where it appears; a prefix match counts half
+NAME_WEIGHT = 3.0
+PARAMETER_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+STOP_WORDS = frozenset(
+    ("a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or", "the", "to")
+)
+
+
+def terms(text: str) -> list[str]:
+    """
+    Lower-case search terms of `text`, splitting snake_case and camelCase (customFields → custom, field),
+    with a plural "s" dropped so "messages" and "message" meet.
+    """
+    words = (match.lower() for match in _WORD.findall(text))
+    return [_singular(word) for word in words if word not in STOP_WORDS]
+
+
+def _singular(word: str) -> str:
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def _parameter_names(schema: dict[str, Any]) -> list[str]:
+    """Property names of a schema, nested objects and array items included."""
+    names = []
+    for name, prop in schema.get("properties", {}).items():
+        names.append(name)
+        if isinstance(prop, dict):
+            names.extend(_parameter_names(prop))
+            if isinstance(prop.get("items"), dict):
+                names.extend(_parameter_names(prop["items"]))
+    return names
+
+
+class ToolIndex:
+    """
+    An inverted index over tool names, descriptions and parameter names: term → {tool: weight}.
+    Terms are kept sorted as well, so a query term also matches the terms it is a prefix of.
+    Matches are scaled by inverse document frequency, so "telegram" outweighs "message".
+    """
+
+    def __init__(self, tools: dict[str, dict[str, Any]]):
+        postings: dict[str, dict[str, float]] = defaultdict(dict)
+        for name, info in tools.items():
+            fields = (
+                (terms(name), NAME_WEIGHT),
+                (terms(" ".join(_parameter_names(info.get("input_schema") or {}))), PARAMETER_WEIGHT),
+                (terms(info.get("description", "")), DESCRIPTION_WEIGHT),
+            )
+            for field_terms, weight in fields:
+                for term in field_terms:
+                    # A term scores once per tool, by the strongest field it appears in
+                    if postings[term].get(name, 0.0) < weight:
+                        postings[term][name] = weight
+        self.postings = dict(postings)
+        self.terms = sorted(self.postings)
+        self.idf = {term: math.log(1 + len(tools) / len(tools_with)) for term, tools_with in self.postings.items()}
+        # Results are returned as schemas, encoded once here instead of on every search
+        self.schemas = {
+            name: json.dumps(
+                {"name": name, "description": info["description"], "inputSchema": info["input_schema"]},
+                separators=(",", ":"),
+            )
+            for name, info in tools.items()
+        }
+
+    def _matches(self, term: str) -> dict[str, float]:
+        """Tools matching one query term: exact matches at full weight, prefix matches at half."""
+        idf = self.idf.get(term, 0.0)
+        scores = {name: weight * idf for name, weight in self.postings.get(term, {}).items()}
+        index = bisect.bisect_right(self.terms, term)
+        while index < len(self.terms) and self.terms[index].startswith(term):
+            prefixed = self.terms[index]
+            for name, weight in self.postings[prefixed].items():
+                scores[name] = max(scores.get(name, 0.0), weight * self.idf[prefixed] / 2)
+            index += 1
+        return scores
+
+    def search(
+        self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, allowed: frozenset[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """The best `limit` tools for `query` as (name, score), restricted to `allowed` when given."""
+        scores: dict[str, float] = defaultdict(float)
+        for term in dict.fromkeys(terms(query)):
+            for name, weight in self._matches(term).items():
+                if allowed is None or name in allowed:
+                    scores[name] += weight
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(name, round(score, 3)) for name, score in ranked[:limit]]
+
+
+async def search_tools(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """Find tools by keywords and return their schemas, so they can be called without being listed."""
+    limit = arguments.get("limit", DEFAULT_SEARCH_LIMIT)
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        return False, error_text(400, f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+    if not terms(arguments["query"]):
+        return False, error_text(400, "query needs at least one keyword")
+    index = registry.tool_index()
+    view = registry.visible_tools(get_request_tool_profile())
+    allowed = frozenset(name for name in index.schemas if name != "search_tools" and (view is None or name in view))
+    found = index.search(arguments["query"], limit, allowed)
+    # Each pre-encoded schema object gets its score spliced in front of its first key
+    tools = ",".join(f'{{"score":{score},{index.schemas[name][1:]}' for name, score in found)
+    return True, f'{{"query":{json.dumps(arguments["query"])},"tools":[{tools}]}}'
+
+
+TOOLS = {
+    "search_tools": {
+        "handler": search_tools,
+        "description": (
+            "Search the full tool catalogue by keywords (tool names, descriptions and parameter names) and "
+            "return the matching tools with their input schemas, best match first. Use it to find a tool that "
+            "is not in the tool list; the returned tools can be called directly."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Keywords describing the task, e.g. 'send whatsapp template' or 'crm deal stage'",
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": DEFAULT_SEARCH_LIMIT,
+                    "description": f"Maximum number of tools to return (at most {MAX_SEARCH_LIMIT})",
+                },
+            },
+            "required": ["query"],
+        },
+    },
+}
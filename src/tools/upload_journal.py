@@ -0,0 +1,94 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import time
+from typing import Any
+
+PENDING = "pending"
+COMPLETE = "complete"
+DEFAULT_JOURNAL_TTL = 3600.0
+# Minimum seconds between two sweeps of stale entries
+PRUNE_INTERVAL = 60.0
+
+
+def journal_key(target: str, token: str | None, path: str, size: int, mtime_ns: int) -> str:
+    """
+    Identify a transfer by its destination, the caller's auth token and the file's identity (path, size,
+    mtime). Only a hash of the whole is used, so the token never reaches the journal directory.
+    """
+    raw = json.dumps([target, token or "", os.path.abspath(path), size, mtime_ns])
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+class UploadJournal:
+    """
+    Local journal of file transfers, one JSON file per transfer in `directory`.
+
+    An entry records the chunk size, the checksum of every chunk read so far and, once the upstream
+    accepted the file, its response. Entries are written atomically so a crash never leaves a torn file.
+    Entries not updated for `ttl` seconds are ignored and swept away, pending or complete.
+    """
+
+    def __init__(self, directory: str, ttl: float = DEFAULT_JOURNAL_TTL):
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.pruned = 0
+        self._pruned_at = 0.0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                self._remove(key)
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _prune(self) -> None:
+        """Remove every entry (and leftover temporary file) older than the TTL."""
+        cutoff = time.time() - self.ttl
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            with contextlib.suppress(OSError):
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    self.pruned += 1
+
+    def _write(self, key: str, entry: dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self._path(key)}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._path(key))
+
+    def _remove(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._path(key))
+
+    async def load(self, key: str, chunk_size: int) -> dict[str, Any]:
+        """The journaled entry for `key`, or a fresh pending one if none exists for this chunk size."""
+        now = time.monotonic()
+        if now - self._pruned_at >= PRUNE_INTERVAL:
+            self._pruned_at = now
+            await asyncio.to_thread(self._prune)
+        entry = await asyncio.to_thread(self._read, key)
+        if entry is None or entry.get("chunk_size") != chunk_size:
+            entry = {"state": PENDING, "chunk_size": chunk_size, "checksums": [], "result": None}
+        return entry
+
+    async def save(self, key: str, entry: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, key, entry)
+
+    async def discard(self, key: str) -> None:
+        await asyncio.to_thread(self._remove, key)
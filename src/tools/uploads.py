@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import mimetypes
+import os
+import secrets
+import stat
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.tools.streaming import ProgressCallback
+
+CHUNK_READ_ATTEMPTS = 3
+
+
+class FileChangedError(Exception):
+    """The file no longer matches the chunk checksums recorded by an earlier attempt."""
+
+
+def _read_chunk(f, offset: int, size: int) -> tuple[bytes, str]:
+    """Read and checksum one chunk, retrying transient read errors (e.g. on network filesystems)."""
+    attempt = 1
+    while True:
+        try:
+            f.seek(offset)
+            chunk = f.read(size)
+            return chunk, hashlib.sha256(chunk).hexdigest()
+        except OSError:
+            if attempt >= CHUNK_READ_ATTEMPTS:
+                raise
+            attempt += 1
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+async def stat_file(path: str) -> os.stat_result | None:
+    """Stat a regular file off the event loop; None if it does not exist or is not a file."""
+    try:
+        info = await asyncio.to_thread(os.stat, path)
+    except OSError:
+        return None
+    return info if stat.S_ISREG(info.st_mode) else None
+
+
+class UploadStats:
+    """Totals and the most recent throughput of streamed uploads."""
+
+    def __init__(self):
+        self.uploads = 0
+        self.bytes = 0
+        self.last_bytes_per_second = 0.0
+
+    def record(self, size: int, seconds: float) -> None:
+        self.uploads += 1
+        self.bytes += size
+        self.last_bytes_per_second = size / seconds if seconds > 0 else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "uploads": self.uploads,
+            "bytes": self.bytes,
+            "last_bytes_per_second": round(self.last_bytes_per_second),
+        }
+
+
+class MultipartUpload:
+    """
+    A multipart/form-data body that reads the file in `chunk_size` pieces from a worker thread,
+    so memory stays bounded and the event loop never blocks on disk I/O. Each iteration re-reads
+    the file, which lets the retry loop send the same body again.
+
+    Every chunk is checksummed into `checksums`; when a later attempt reads a chunk whose checksum
+    differs from the recorded one, FileChangedError is raised instead of sending a mixed body.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        path: str,
+        size: int,
+        filename: str | None = None,
+        chunk_size: int = 1024 * 1024,
+        progress: ProgressCallback | None = None,
+        stats: UploadStats | None = None,
+        checksums: list[str] | None = None,
+    ):
+        self.path = path
+        self.size = size
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.stats = stats
+        self.checksums = checksums if checksums is not None else []
+        boundary = secrets.token_hex(16)
+        filename = filename or os.path.basename(path)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        parts = [
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{_quote(key)}"\r\n\r\n'
+            f"{'' if value is None else value}\r\n"
+            for key, value in fields.items()
+        ]
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = "".join(parts).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(self._head) + size + len(self._tail)),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        started = time.monotonic()
+        sent = 0
+        f = await asyncio.to_thread(open, self.path, "rb")
+        try:
+            index = 0
+            while True:
+                chunk, checksum = await asyncio.to_thread(_read_chunk, f, sent, self.chunk_size)
+                if not chunk:
+                    break
+                if index < len(self.checksums):
+                    if self.checksums[index] != checksum:
+                        raise FileChangedError(f"{self.path} changed during upload (chunk {index})")
+                else:
+                    self.checksums.append(checksum)
+                index += 1
+                yield chunk
+                sent += len(chunk)
+                if self.progress is not None:
+                    elapsed = time.monotonic() - started
+                    rate = sent / elapsed / 1e6 if elapsed > 0 else 0.0
+                    await self.progress(f"Uploaded {sent}/{self.size} bytes ({rate:.1f} MB/s)", sent, self.size)
+        finally:
+            await asyncio.to_thread(f.close)
+        if self.stats is not None:
+            self.stats.record(sent, time.monotonic() - started)
+        yield self._tail
@@ -0,0 +1,250 @@
+from collections.abc import Callable
+from typing import Any
+
+# valid(value) is the fast path: True when `value` matches, without building any messages
+Valid = Callable[[Any], bool]
+# check(value, field, errors) appends a message to `errors` for every problem found in `value`
+Check = Callable[[Any, str, list[str]], None]
+# fill(value) returns `value` with the defaults of missing object properties added, copying only what changes
+Fill = Callable[[Any], Any]
+
+# JSON Schema type -> (Python types, expected-type message); the fast path and the message path both use it
+JSON_TYPES: dict[str, tuple[tuple[type, ...], str]] = {
+    "string": ((str,), "a string"),
+    "integer": ((int,), "an integer"),
+    "number": ((int, float), "a number"),
+    "boolean": ((bool,), "a boolean"),
+    "array": ((list,), "an array"),
+    "object": ((dict,), "an object"),
+    "null": ((type(None),), "null"),
+}
+
+
+def _schema_types(schema: dict[str, Any]) -> tuple[tuple[type, ...], bool, str] | None:
+    """
+    The Python types allowed by a schema's "type", whether bools must be rejected among them, and the
+    expected-type message; None when there is no type to check.
+    """
+    types = schema.get("type")
+    types = [types] if isinstance(types, str) else types or []
+    # Types outside JSON Schema (e.g. "file") are not checked
+    if not types or any(name not in JSON_TYPES for name in types):
+        return None
+    python_types = tuple(t for name in types for t in JSON_TYPES[name][0])
+    # bool is a subclass of int, but JSON booleans are not numbers
+    reject_bool = "boolean" not in types and int in python_types
+    return python_types, reject_bool, " or ".join(JSON_TYPES[name][1] for name in types)
+
+
+NO_PARTS: tuple[None, bool, None] = (None, False, None)
+
+
+def _compile_valid_parts(schema: dict[str, Any]) -> tuple[tuple[type, ...] | None, bool, Valid | None]:
+    """
+    Split a schema into (python types, reject bool, rest): the type test is kept as data so parents can
+    run it inline, and `rest` checks enum, properties and items (None when there is nothing else to check).
+    """
+    schema_types = _schema_types(schema)
+    python_types, reject_bool = schema_types[:2] if schema_types is not None else (None, False)
+    allowed = tuple(schema["enum"]) if "enum" in schema else None
+    required = tuple(schema.get("required", ()))
+    properties = {
+        name: parts
+        for name, prop in schema.get("properties", {}).items()
+        if isinstance(prop, dict) and (parts := _compile_valid_parts(prop)) != NO_PARTS
+    }
+    items = schema.get("items")
+    item_types, item_rejects_bool, item_rest = _compile_valid_parts(items) if isinstance(items, dict) else NO_PARTS
+    check_items = (item_types, item_rest) != (None, None)
+    if allowed is None and not required and not properties and not check_items:
+        return python_types, reject_bool, None
+
+    def rest(value: Any) -> bool:
+        if allowed is not None and value not in allowed:
+            return False
+        if value.__class__ is dict:
+            for name in required:
+                if name not in value:
+                    return False
+            for name, prop_value in value.items():
+                parts = properties.get(name)
+                if parts is not None:
+                    prop_types, prop_rejects_bool, prop_rest = parts
+                    if prop_types is not None and (
+                        not isinstance(prop_value, prop_types) or (prop_rejects_bool and prop_value.__class__ is bool)
+                    ):
+                        return False
+                    if prop_rest is not None and not prop_rest(prop_value):
+                        return False
+        elif check_items and value.__class__ is list:
+            for item in value:
+                if item_types is not None and (
+                    not isinstance(item, item_types) or (item_rejects_bool and item.__class__ is bool)
+                ):
+                    return False
+                if item_rest is not None and not item_rest(item):
+                    return False
+        return True
+
+    return python_types, reject_bool, rest
+
+
+def compile_valid(schema: dict[str, Any]) -> Valid | None:
+    """Compile a schema into a predicate; None when the schema accepts any value."""
+    python_types, reject_bool, rest = _compile_valid_parts(schema)
+    if python_types is None:
+        return rest
+
+    def valid(value: Any) -> bool:
+        if not isinstance(value, python_types) or (reject_bool and value.__class__ is bool):
+            return False
+        return rest is None or rest(value)
+
+    return valid
+
+
+def _child(field: str, name: str) -> str:
+    return f"{field}.{name}" if field else name
+
+
+def compile_check(schema: dict[str, Any]) -> Check | None:
+    """Compile a schema into a check function; None when the schema accepts any value."""
+    schema_types = _schema_types(schema)
+    checks: list[Check] = []
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        listed = ", ".join(map(str, allowed))
+
+        def check_enum(value: Any, field: str, errors: list[str]) -> None:
+            if value not in allowed:
+                errors.append(f"Field '{field}' must be one of: {listed}")
+
+        checks.append(check_enum)
+
+    required = tuple(schema.get("required", ()))
+    properties = tuple(
+        (name, check)
+        for name, prop_schema in schema.get("properties", {}).items()
+        if isinstance(prop_schema, dict) and (check := compile_check(prop_schema)) is not None
+    )
+    if required or properties:
+
+        def check_object(value: Any, field: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(f"Missing required field: {_child(field, name)}")
+            for name, check in properties:
+                if name in value:
+                    check(value[name], _child(field, name), errors)
+
+        checks.append(check_object)
+
+    items = schema.get("items")
+    item_check = compile_check(items) if isinstance(items, dict) else None
+    if item_check is not None:
+
+        def check_items(value: Any, field: str, errors: list[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_check(item, f"{field}[{index}]", errors)
+
+        checks.append(check_items)
+
+    if schema_types is None:
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        python_types, reject_bool, expected = (object,), False, ""
+    else:
+        python_types, reject_bool, expected = schema_types
+
+    def check(value: Any, field: str, errors: list[str]) -> None:
+        if not isinstance(value, python_types) or (reject_bool and value.__class__ is bool):
+            # Nested checks assume the declared type, so a wrong type is reported alone
+            errors.append(f"Field '{field}' must be {expected}")
+            return
+        for nested in checks:
+            nested(value, field, errors)
+
+    return check
+
+
+def compile_fill(schema: dict[str, Any]) -> Fill | None:
+    """
+    Compile the defaults of a schema into a fill function; None when the schema declares no defaults.
+    A default that fails its own property schema raises ValueError, so a broken definition fails at startup.
+    """
+    properties = {name: prop for name, prop in schema.get("properties", {}).items() if isinstance(prop, dict)}
+    defaults = tuple((name, prop["default"]) for name, prop in properties.items() if "default" in prop)
+    for name, default in defaults:
+        check = compile_check(properties[name])
+        errors: list[str] = []
+        if check is not None:
+            check(default, name, errors)
+        if errors:
+            raise ValueError(f"Invalid default: {'; '.join(errors)}")
+    nested = tuple((name, fill) for name, prop in properties.items() if (fill := compile_fill(prop)) is not None)
+    items = schema.get("items")
+    item_fill = compile_fill(items) if isinstance(items, dict) else None
+
+    if item_fill is not None:
+
+        def fill_items(value: Any) -> Any:
+            if not isinstance(value, list):
+                return value
+            filled = [item_fill(item) for item in value]
+            return value if all(new is old for new, old in zip(filled, value, strict=True)) else filled
+
+        return fill_items
+    if not defaults and not nested:
+        return None
+
+    def fill_object(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        filled = None
+        for name, default in defaults:
+            if name not in value:
+                filled = dict(value) if filled is None else filled
+                # Mutable defaults are copied so callers never share (and modify) the schema's own value
+                filled[name] = default.copy() if isinstance(default, list | dict) else default
+        for name, fill in nested:
+            if name in value:
+                child = fill(value[name])
+                if child is not value[name]:
+                    filled = dict(value) if filled is None else filled
+                    filled[name] = child
+        return value if filled is None else filled
+
+    return fill_object
+
+
+class SchemaValidator:
+    """
+    A tool's input schema compiled once into closures: types (with bool kept apart from numbers), enums,
+    required fields, nested object properties and array items, plus the defaults of missing properties.
+    """
+
+    __slots__ = ("_valid", "_check", "_fill")
+
+    def __init__(self, schema: dict[str, Any]):
+        self._valid = compile_valid(schema or {})
+        self._check = compile_check(schema or {})
+        self._fill = compile_fill(schema or {})
+
+    def errors(self, arguments: dict[str, Any]) -> list[str] | None:
+        """Every problem with `arguments`, or None when they are valid."""
+        # Messages are only built once the fast path has found a problem
+        if self._valid is None or self._valid(arguments):
+            return None
+        errors: list[str] = []
+        self._check(arguments, "", errors)
+        return errors or None
+
+    def with_defaults(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """`arguments` plus the schema defaults of missing properties; the input is never modified."""
+        return arguments if self._fill is None else self._fill(arguments)
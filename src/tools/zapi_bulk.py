@@ -0,0 +1,163 @@
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+from src.tools.rate_limit import TokenBucket
+from src.tools.results import error_text, is_error, parse_text
+from src.tools.streaming import ProgressCallback
+
+if TYPE_CHECKING:
+    from src.tools.loader import ToolRegistry
+
+MAX_BULK_MESSAGES = 10000
+DEFAULT_RECIPIENT_CONCURRENCY = 10
+SEND_TOOLS = ("zapi_send_text", "zapi_send_media", "zapi_send_template")
+
+
+async def zapi_bulk_send(
+    registry: "ToolRegistry", arguments: dict[str, Any], progress: ProgressCallback | None = None
+) -> tuple[bool, str]:
+    """
+    Send many Z-API messages from one instance.
+
+    Messages are grouped by recipient: each recipient's messages are sent one after another in request
+    order, while different recipients are served concurrently. Every send first takes a token from the
+    instance's bucket (`registry.send_rates`), which every bulk send on that instance shares; a
+    `messages_per_second` override only slows this call down, through a bucket of its own. Each
+    delivery result is reported through `progress` as soon as it is known.
+    """
+    instance_id = arguments["instanceId"]
+    messages = arguments["messages"]
+    default_tool = arguments.get("tool", "zapi_send_text")
+    stop_on_error = arguments.get("stop_on_error", True)
+    if len(messages) > MAX_BULK_MESSAGES:
+        return False, error_text(400, f"zapi_bulk_send accepts at most {MAX_BULK_MESSAGES} messages")
+    call_rate = None
+    if "messages_per_second" in arguments:
+        rate = arguments["messages_per_second"]
+        if rate <= 0:
+            return False, error_text(400, "messages_per_second must be greater than 0")
+        # Capped at the configured instance rate, which keeps applying through the shared bucket
+        shared_rate = registry.send_rates.rate
+        call_rate = TokenBucket(min(rate, shared_rate) if shared_rate > 0 else rate, burst=1)
+
+    recipients: dict[str, list[int]] = {}
+    for index, message in enumerate(messages):
+        phone = message.get("phone") if isinstance(message, dict) else None
+        recipients.setdefault(str(phone), []).append(index)
+
+    semaphore = asyncio.Semaphore(max(1, arguments.get("max_concurrency", DEFAULT_RECIPIENT_CONCURRENCY)))
+    results: list[dict[str, Any] | None] = [None] * len(messages)
+    done = 0
+
+    async def report(index: int, phone: str, ok: bool, result: Any) -> None:
+        nonlocal done
+        results[index] = {"index": index, "phone": phone, "ok": ok, "result": result}
+        done += 1
+        if progress is not None:
+            status = "sent" if ok else "skipped" if result is None else "failed"
+            await progress(f"Message {index} to {phone} {status} ({done}/{len(messages)})", done, len(messages))
+
+    async def send(index: int) -> bool:
+        message = messages[index]
+        if not isinstance(message, dict):
+            text = error_text(400, "Each message must be an object")
+        else:
+            send_args = {key: value for key, value in message.items() if key != "tool"}
+            send_args["instanceId"] = instance_id
+            tool = message.get("tool", default_tool)
+            errors = registry.validate(tool, send_args) if tool in SEND_TOOLS else [f"Unsupported tool: {tool}"]
+            if errors:
+                text = error_text(400, errors)
+            else:
+                if call_rate is not None:
+                    await call_rate.acquire()
+                await registry.send_rates.acquire(instance_id)
+                text = (await registry.call_tool(tool, send_args))[0].text
+        ok = not is_error(text)
+        await report(index, str(message.get("phone") if isinstance(message, dict) else None), ok, parse_text(text))
+        return ok
+
+    async def deliver(phone: str, indexes: list[int]) -> None:
+        async with semaphore:
+            for position, index in enumerate(indexes):
+                if not await send(index) and stop_on_error:
+                    # Later messages would arrive out of order, so the rest of this recipient's queue is dropped
+                    for skipped in indexes[position + 1 :]:
+                        await report(skipped, phone, False, None)
+                    return
+
+    await asyncio.gather(*(deliver(phone, indexes) for phone, indexes in recipients.items()))
+    sent = sum(1 for item in results if item["ok"])
+    skipped = sum(1 for item in results if not item["ok"] and item["result"] is None)
+    summary = {
+        "instanceId": instance_id,
+        "results": results,
+        "sent": sent,
+        "failed": len(results) - sent - skipped,
+        "skipped": skipped,
+    }
+    return True, json.dumps(summary)
+
+
+TOOLS = {
+    "zapi_bulk_send": {
+        "handler": zapi_bulk_send,
+        "requires": list(SEND_TOOLS),
+        "description": (
+            "Send Z-API messages (text, media or template) to many recipients from one instance. "
+            "Messages to the same phone keep their order while different phones are sent in parallel, "
+            "all under the instance's messages/second limit. Each delivery result is reported as a "
+            "progress update and the full list is returned in message order."
+        ),
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "instanceId": {"type": "string", "description": "Z-API instance ID used for every message"},
+                "messages": {
+                    "type": "array",
+                    "description": (
+                        "Messages to send, each with the arguments of its send tool except instanceId "
+                        "(e.g. {'phone': '5511999999999', 'message': 'Hi'})"
+                    ),
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "phone": {"type": "string", "description": "Recipient phone number with country code"},
+                            "tool": {
+                                "type": "string",
+                                "enum": list(SEND_TOOLS),
+                                "description": "Send tool for this message; defaults to the top-level 'tool'",
+                            },
+                        },
+                        "required": ["phone"],
+                    },
+                },
+                "tool": {
+                    "type": "string",
+                    "enum": list(SEND_TOOLS),
+                    "default": "zapi_send_text",
+                    "description": "Send tool used for messages that do not name one",
+                },
+                "messages_per_second": {
+                    "type": "number",
+                    "description": (
+                        "Lower send rate for this call (greater than 0); the instance rate "
+                        "CHATVOLT_ZAPI_SEND_RATE always applies"
+                    ),
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "default": DEFAULT_RECIPIENT_CONCURRENCY,
+                    "description": "Recipients whose messages are being sent at the same time",
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Skip a recipient's remaining messages after one of them fails, keeping order",
+                },
+            },
+            "required": ["instanceId", "messages"],
+        },
+    },
+}
@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.batch import MAX_BATCH_CALLS
+from src.tools.loader import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+class TestBatchCall:
+    def test_is_listed(self, registry):
+        tools = {tool.name: tool for tool in registry.get_tool_list()}
+        assert "batch_call" in tools
+        assert tools["batch_call"].inputSchema["required"] == ["calls"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_results_keep_request_order(self, registry):
+        async def upstream(request):
+            conversation_id = request.url.path.rsplit("/", 1)[-1]
+            # Later calls finish first
+            await asyncio.sleep(0.05 if conversation_id == "c0" else 0)
+            return httpx.Response(200, json={"id": conversation_id})
+
+        respx.get(url__regex=r"https://api.chatvolt.ai/conversation/c\d").mock(side_effect=upstream)
+        calls = [{"name": "get_conversation", "arguments": {"conversationId": f"c{i}"}} for i in range(5)]
+        result = await registry.call_tool("batch_call", {"calls": calls})
+        parsed = json.loads(result[0].text)
+        assert [item["result"]["id"] for item in parsed["results"]] == ["c0", "c1", "c2", "c3", "c4"]
+        assert parsed["succeeded"] == 5
+        assert parsed["failed"] == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_per_item_errors(self, registry):
+        respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+        respx.get("https://api.chatvolt.ai/agents/2").respond(status_code=404, text="Not Found")
+        calls = [
+            {"name": "get_agent", "arguments": {"id": "1"}},
+            {"name": "get_agent", "arguments": {"id": "2"}},
+            {"name": "no_such_tool", "arguments": {}},
+            {"name": "get_agent"},
+            {"arguments": {}},
+            {"name": "batch_call", "arguments": {"calls": []}},
+        ]
+        parsed = json.loads((await registry.call_tool("batch_call", {"calls": calls}))[0].text)
+        results = parsed["results"]
+        assert results[0] == {"name": "get_agent", "ok": True, "result": {"id": "1"}}
+        assert results[1]["ok"] is False
+        assert results[1]["result"] == {"error": True, "status": 404, "message": "Not Found"}
+        assert results[2]["result"]["status"] == 404
+        assert results[3]["result"]["status"] == 400
+        assert results[4]["result"]["status"] == 400
+        assert "cannot be called" in results[5]["result"]["message"]
+        assert parsed["failed"] == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrency_is_bounded(self, registry):
+        running = 0
+        peak = 0
+
+        async def upstream(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={})
+
+        respx.get(url__regex=r"https://api.chatvolt.ai/agents/\d+").mock(side_effect=upstream)
+        calls = [{"name": "get_agent", "arguments": {"id": str(i)}} for i in range(12)]
+        await registry.call_tool("batch_call", {"calls": calls, "max_concurrency": 3})
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_limits(self, registry):
+        too_many = [{"name": "get_models"}] * (MAX_BATCH_CALLS + 1)
+        parsed = json.loads((await registry.call_tool("batch_call", {"calls": too_many}))[0].text)
+        assert parsed["status"] == 400
+        parsed = json.loads((await registry.call_tool("batch_call", {}))[0].text)
+        assert parsed["status"] == 400
+        assert "calls" in parsed["message"][0]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_progress(self, registry):
+        respx.get("https://api.chatvolt.ai/agents/models").respond(status_code=200, json=[])
+        updates = []
+
+        async def progress(message, value, total):
+            updates.append((value, total))
+
+        await registry.call_tool("batch_call", {"calls": [{"name": "get_models"}] * 3}, progress)
+        assert updates == [(1, 3), (2, 3), (3, 3)]
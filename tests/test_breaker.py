@@ -0,0 +1,136 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools import breaker as breaker_module
+from src.tools import loader
+from src.tools.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, breaker_key
+from src.tools.loader import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(loader, "BASE_DELAY", 0.0)
+    monkeypatch.setattr(loader.random, "uniform", lambda a, b: 0.0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestBreakerKey:
+    def test_first_path_segment(self, registry):
+        assert registry.breaker_keys["zapi_send_text"] == "/zapi"
+        assert registry.breaker_keys["get_agent"] == "/agents"
+
+    def test_api_namespace_keeps_two_segments(self, registry):
+        assert registry.breaker_keys["get_agent_tools"] == "/api/agents"
+
+    def test_definition_override(self, registry):
+        assert registry.breaker_keys["query_datastore"] == "/datastores/*/query"
+        assert registry.breaker_keys["get_datastore"] == "/datastores"
+
+    def test_plain_definition(self):
+        assert breaker_key({"path": "/crm/step/move"}) == "/crm"
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+        for _ in range(2):
+            breaker.record_failure()
+        breaker.record_success()
+        for _ in range(3):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_probe_closes(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock[0] += 10
+        assert breaker.allow()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow(), "only one probe at a time"
+        breaker.record_success()
+        assert breaker.state == CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock[0] += 10
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert breaker.retry_in() == 10
+
+    def test_stuck_probe_is_replaced(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock[0] += 10
+        assert breaker.allow()
+        clock[0] += 10
+        assert breaker.allow()
+
+
+class TestRegistryBreakers:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_open_circuit_fails_fast(self, registry, no_backoff):
+        registry.breakers = CircuitBreakers(failure_threshold=3, recovery_timeout=60)
+        route = respx.post("https://api.chatvolt.ai/zapi/i1/send-text").respond(status_code=502, text="Bad Gateway")
+        args = {"instanceId": "i1", "phone": "5511999999999", "message": "hi"}
+
+        first = json.loads((await registry.call_tool("zapi_send_text", args))[0].text)
+        assert first["status"] == 502
+        assert route.call_count == 3
+
+        result = json.loads((await registry.call_tool("zapi_send_text", args))[0].text)
+        assert result["error"] is True
+        assert result["status"] == 503
+        assert "/zapi" in result["message"]
+        assert route.call_count == 3
+        assert registry.stats()["circuit_breakers"]["/zapi"]["state"] == OPEN
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_other_families_are_unaffected(self, registry, no_backoff):
+        registry.breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+        respx.post("https://api.chatvolt.ai/zapi/i1/send-text").respond(status_code=500)
+        agents = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+
+        await registry.call_tool("zapi_send_text", {"instanceId": "i1", "phone": "1", "message": "hi"})
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        assert json.loads(result[0].text) == {"id": "1"}
+        assert agents.called
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_pool_timeouts_do_not_trip_breaker(self, registry, no_backoff):
+        registry.breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+        route = respx.get("https://api.chatvolt.ai/agents/1").mock(side_effect=httpx.PoolTimeout("pool exhausted"))
+        result = json.loads((await registry.call_tool("get_agent", {"id": "1"}))[0].text)
+        assert result["status"] == 500
+        assert route.call_count == loader.MAX_RETRIES
+        assert registry.breakers.get("/agents").state == CLOSED
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_errors_do_not_trip_breaker(self, registry):
+        registry.breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+        respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=404, text="Not Found")
+        await registry.call_tool("get_agent", {"id": "1"})
+        assert registry.breakers.get("/agents").state == CLOSED
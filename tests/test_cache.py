@@ -0,0 +1,225 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.config import set_request_auth_token
+from src.tools import cache as cache_module
+from src.tools.cache import ResponseCache, make_cache_key
+from src.tools.loader import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+class TestResponseCache:
+    def test_key_normalizes_argument_order(self):
+        assert make_cache_key("t", "get_agent", {"a": 1, "b": 2}) == make_cache_key("t", "get_agent", {"b": 2, "a": 1})
+        assert make_cache_key("t1", "get_agent", {}) != make_cache_key("t2", "get_agent", {})
+
+    def test_key_does_not_contain_raw_token(self):
+        key = make_cache_key("secret-token", "get_agent", {})
+        assert "secret-token" not in "".join(key)
+
+    def test_hit_and_miss_counters(self):
+        cache = ResponseCache(max_bytes=1024)
+        key = make_cache_key("t", "get_agent", {"id": "1"})
+        assert cache.get(key) is None
+        cache.set(key, "value", ttl=60)
+        assert cache.get(key) == "value"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 5
+
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = ResponseCache(max_bytes=1024)
+        key = make_cache_key("t", "get_agent", {})
+        cache.set(key, "value", ttl=10)
+        now[0] += 11
+        assert cache.get(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_is_bounded_by_bytes(self):
+        cache = ResponseCache(max_bytes=10)
+        k1, k2, k3 = (make_cache_key("t", "get_agent", {"id": i}) for i in range(3))
+        cache.set(k1, "aaaa", ttl=60)
+        cache.set(k2, "bbbb", ttl=60)
+        cache.get(k1)
+        cache.set(k3, "cccc", ttl=60)
+        assert cache.get(k2) is None
+        assert cache.get(k1) == "aaaa"
+        assert cache.stats()["bytes"] <= 10
+        assert cache.stats()["evictions"] == 1
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = ResponseCache(max_bytes=0)
+        key = make_cache_key("t", "get_agent", {})
+        cache.set(key, "value", ttl=60)
+        assert cache.get(key) is None
+
+
+class TestRegistryCache:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_read_only_tool_is_cached(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+        first = await registry.call_tool("get_agent", {"id": "1"})
+        second = await registry.call_tool("get_agent", {"id": "1"})
+        assert first[0].text == second[0].text
+        assert route.call_count == 1
+        assert registry.stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cache_is_scoped_by_token(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+        set_request_auth_token("token-a")
+        await registry.call_tool("get_agent", {"id": "1"})
+        set_request_auth_token("token-b")
+        await registry.call_tool("get_agent", {"id": "1"})
+        set_request_auth_token(None)
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_errors_are_not_cached(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=404, text="Not Found")
+        await registry.call_tool("get_agent", {"id": "1"})
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        assert json.loads(result[0].text)["status"] == 404
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_mutating_tool_is_not_cached(self, registry):
+        route = respx.post("https://api.chatvolt.ai/agents").respond(status_code=201, json={"id": "new"})
+        await registry.call_tool("create_agent", {"name": "A"})
+        await registry.call_tool("create_agent", {"name": "A"})
+        assert route.call_count == 2
+
+    def test_per_tool_ttl_overrides(self, registry):
+        assert registry.cache_ttls["get_models"] == 3600
+        assert registry.cache_ttls["get_datasource_status"] == 0
+        assert "query_agent" not in registry.cache_ttls
+
+
+class TestInvalidation:
+    def test_invalidate_by_argument(self):
+        cache = ResponseCache(max_bytes=1024)
+        k1 = make_cache_key("t", "get_agent", {"id": "1"})
+        k2 = make_cache_key("t", "get_agent", {"id": "2"})
+        cache.set(k1, "one", ttl=60, arguments={"id": "1"})
+        cache.set(k2, "two", ttl=60, arguments={"id": "2"})
+        assert cache.invalidate("get_agent", {"id": "1"}) == 1
+        assert cache.get(k1) is None
+        assert cache.get(k2) == "two"
+
+    def test_invalidate_whole_tool_across_tokens(self):
+        cache = ResponseCache(max_bytes=1024)
+        k1 = make_cache_key("a", "list_agents", {})
+        k2 = make_cache_key("b", "list_agents", {"limit": 5})
+        cache.set(k1, "x", ttl=60)
+        cache.set(k2, "y", ttl=60, arguments={"limit": 5})
+        assert cache.invalidate("list_agents") == 2
+        assert cache.stats()["bytes"] == 0
+
+    def test_set_drops_result_read_before_invalidation(self):
+        cache = ResponseCache(max_bytes=1024)
+        key = make_cache_key("t", "get_agent", {"id": "1"})
+        generation = cache.generation("get_agent")
+        cache.invalidate("get_agent", {"id": "1"})
+        cache.set(key, "stale", ttl=60, arguments={"id": "1"}, generation=generation)
+        assert cache.get(key) is None
+        cache.set(key, "fresh", ttl=60, arguments={"id": "1"}, generation=cache.generation("get_agent"))
+        assert cache.get(key) == "fresh"
+
+    def test_declared_dependencies_reference_cached_tools(self, registry):
+        for name, info in registry.tools.items():
+            for read_tool, id_args in info.get("invalidates", {}).items():
+                assert read_tool in registry.cache_ttls, f"{name} invalidates non-cached tool {read_tool}"
+                read_props = registry.tools[read_tool]["input_schema"].get("properties", {})
+                write_props = info["input_schema"].get("properties", {})
+                for read_arg, write_arg in id_args.items():
+                    assert read_arg in read_props, f"{name}: {read_tool} has no argument {read_arg}"
+                    assert write_arg in write_props, f"{name} has no argument {write_arg}"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_update_agent_evicts_agent_reads(self, registry):
+        get_1 = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+        get_2 = respx.get("https://api.chatvolt.ai/agents/2").respond(status_code=200, json={"id": "2"})
+        listing = respx.get("https://api.chatvolt.ai/agents").respond(status_code=200, json={"agents": []})
+        respx.patch("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+
+        for _ in range(2):
+            await registry.call_tool("get_agent", {"id": "1"})
+            await registry.call_tool("get_agent", {"id": "2"})
+            await registry.call_tool("list_agents", {})
+        await registry.call_tool("update_agent", {"id": "1", "name": "Renamed"})
+        await registry.call_tool("get_agent", {"id": "1"})
+        await registry.call_tool("get_agent", {"id": "2"})
+        await registry.call_tool("list_agents", {})
+
+        assert get_1.call_count == 2
+        assert get_2.call_count == 1
+        assert listing.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_upsert_variable_evicts_variables(self, registry):
+        url = "https://api.chatvolt.ai/conversation/c1/variables"
+        reads = respx.get(url).respond(status_code=200, json={"variables": []})
+        respx.post(url).respond(status_code=200, json={"key": "k"})
+
+        await registry.call_tool("get_conversation_variables", {"conversationId": "c1"})
+        await registry.call_tool("upsert_conversation_variable", {"conversationId": "c1", "key": "k", "value": "v"})
+        await registry.call_tool("get_conversation_variables", {"conversationId": "c1"})
+        assert reads.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_mutation_keeps_cache(self, registry):
+        reads = respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+        respx.patch("https://api.chatvolt.ai/agents/1").respond(status_code=400, text="Bad Request")
+
+        await registry.call_tool("get_agent", {"id": "1"})
+        await registry.call_tool("update_agent", {"id": "1", "name": "x"})
+        await registry.call_tool("get_agent", {"id": "1"})
+        assert reads.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_read_in_flight_during_mutation_is_not_cached(self, registry):
+        state = {"name": "old"}
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+
+        async def slow_get(request):
+            name = state["name"]
+            read_started.set()
+            await release_read.wait()
+            return httpx.Response(200, json={"id": "1", "name": name})
+
+        def patch(request):
+            state["name"] = "new"
+            return httpx.Response(200, json={"id": "1", "name": "new"})
+
+        reads = respx.get("https://api.chatvolt.ai/agents/1").mock(side_effect=slow_get)
+        respx.patch("https://api.chatvolt.ai/agents/1").mock(side_effect=patch)
+
+        slow = asyncio.create_task(registry.call_tool("get_agent", {"id": "1"}))
+        await read_started.wait()
+        await registry.call_tool("update_agent", {"id": "1", "name": "new"})
+        release_read.set()
+        assert json.loads((await slow)[0].text)["name"] == "old"
+
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        assert json.loads(result[0].text)["name"] == "new"
+        assert reads.call_count == 2
@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools import loader
+from src.tools.concurrency import AdaptiveLimiter, LimiterTimeout
+from src.tools.loader import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(loader, "BASE_DELAY", 0.0)
+    monkeypatch.setattr(loader.random, "uniform", lambda a, b: 0.0)
+
+
+class TestAdaptiveLimiter:
+    @pytest.mark.asyncio
+    async def test_limit_grows_on_success(self):
+        limiter = AdaptiveLimiter(initial_limit=4)
+        for _ in range(8):
+            await limiter.acquire()
+            limiter.release(0.01)
+        assert limiter.limit > 5
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_shrinks_on_overload(self):
+        limiter = AdaptiveLimiter(initial_limit=10, min_limit=2, decrease_factor=0.5)
+        await limiter.acquire()
+        limiter.release(0.01, overloaded=True)
+        assert int(limiter.limit) == 5
+
+    @pytest.mark.asyncio
+    async def test_limit_respects_minimum(self):
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, decrease_factor=0.5)
+        await limiter.acquire()
+        limiter.release(0.0, overloaded=True)
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_rising_latency_shrinks_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=10, latency_tolerance=2.0)
+        for _ in range(10):
+            await limiter.acquire()
+            limiter.release(0.01, key="get_agent")
+        before = limiter.limit
+        await limiter.acquire()
+        limiter.release(1.0, key="get_agent")
+        assert limiter.limit < before
+
+    @pytest.mark.asyncio
+    async def test_excess_calls_queue_in_order(self):
+        limiter = AdaptiveLimiter(initial_limit=1)
+        await limiter.acquire()
+        order = []
+
+        async def waiter(i):
+            await limiter.acquire()
+            order.append(i)
+
+        tasks = [asyncio.create_task(waiter(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.stats()["queue_depth"] == 3
+        for _ in range(3):
+            limiter.release(0.01)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline(self):
+        limiter = AdaptiveLimiter(initial_limit=1, queue_timeout=0.01)
+        await limiter.acquire()
+        with pytest.raises(LimiterTimeout):
+            await limiter.acquire()
+        stats = limiter.stats()
+        assert stats["rejected"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 1
+
+
+class TestRegistryLimiter:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retryable_status_shrinks_limit(self, registry, no_backoff):
+        respx.get("https://api.chatvolt.ai/agents/1").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"id": "1"})]
+        )
+        before = registry.limiter.limit
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        assert json.loads(result[0].text) == {"id": "1"}
+        assert registry.limiter.limit < before
+        assert registry.limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_attempt_leaves_limit_alone(self, registry):
+        async def slow(client):
+            await asyncio.sleep(1)
+            return httpx.Response(200)
+
+        before = registry.limiter.limit
+        # e.g. a hedge loser or a query_datastores deadline
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(registry._limited("get_agent", slow, None), 0.05)
+        assert registry.limiter.limit == before
+        assert registry.limiter.in_flight == 0
+        assert registry.limiter.cancelled == 1
+        assert "get_agent" not in registry.limiter._latency
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_returns_structured_error(self, registry):
+        registry.limiter = AdaptiveLimiter(initial_limit=1, queue_timeout=0.01)
+        await registry.limiter.acquire()
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        parsed = json.loads(result[0].text)
+        assert parsed["error"] is True
+        assert parsed["status"] == 503
+
+    @pytest.mark.asyncio
+    async def test_metrics_include_limiter(self, registry):
+        stats = registry.stats()["concurrency"]
+        assert {"limit", "in_flight", "queue_depth", "rejected", "cancelled"} <= stats.keys()
+
+    def test_limit_stays_within_connection_pool(self, monkeypatch):
+        monkeypatch.setattr(loader, "CONCURRENCY_MAX_LIMIT", 500)
+        registry = ToolRegistry()
+        assert not registry.http.http2
+        assert registry.limiter.max_limit == registry.http.limits.max_connections
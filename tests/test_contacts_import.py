@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from src.config import get_auth_token, set_request_auth_token
+from src.tools import contacts_import
+from src.tools.loader import ToolRegistry
+from src.tools.local_files import token_directory
+
+CONTACTS_URL = "https://api.chatvolt.ai/contacts"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(contacts_import, "IMPORT_LOG_DIR", str(tmp_path / "logs"))
+    # Logs of the current token
+    return Path(token_directory(str(tmp_path / "logs"), get_auth_token()))
+
+
+def _log(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestImportContacts:
+    def test_is_listed(self, registry):
+        tools = {tool.name: tool for tool in registry.get_tool_list()}
+        assert tools["import_contacts"].inputSchema["required"] == ["file_path"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_csv_rows(self, registry, tmp_path):
+        route = respx.post(CONTACTS_URL).respond(status_code=200, json={"id": "c1"})
+        source = tmp_path / "contacts.csv"
+        source.write_text("firstName,email,tags,customFields.plan\nAna,ana@x.io,vip; lead,pro\nBo,,,\n")
+
+        parsed = json.loads((await registry.call_tool("import_contacts", {"file_path": str(source)}))[0].text)
+
+        assert parsed["created"] == 2
+        info = source.stat()
+        assert parsed["result_log"] == contacts_import.default_log_name(str(source), info.st_size, info.st_mtime_ns)
+        bodies = sorted((json.loads(call.request.content) for call in route.calls), key=lambda b: b["firstName"])
+        assert bodies == [
+            {"firstName": "Ana", "email": "ana@x.io", "tags": ["vip", "lead"], "customFields": {"plan": "pro"}},
+            {"firstName": "Bo"},
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_invalid_and_failed_rows_are_logged(self, registry, tmp_path, log_dir):
+        respx.post(CONTACTS_URL).mock(
+            side_effect=lambda request: httpx.Response(
+                409 if json.loads(request.content)["email"] == "dup@x.io" else 200, json={"id": "c"}
+            )
+        )
+        source = tmp_path / "contacts.jsonl"
+        rows = ['{"email": "a@x.io"}', '{"email": "dup@x.io"}', '{"nickname": "x"}', '{"tags": "vip"}', "{bad", "{}"]
+        source.write_text("\n".join(rows) + "\n")
+
+        parsed = json.loads((await registry.call_tool("import_contacts", {"file_path": str(source)}))[0].text)
+
+        assert parsed["rows"] == 6
+        assert (parsed["created"], parsed["failed"], parsed["invalid"]) == (1, 1, 4)
+        log = {entry["row"]: entry for entry in _log(log_dir / parsed["result_log"])}
+        assert log[1]["ok"] is True
+        assert log[2]["error"]["status"] == 409
+        assert log[3]["error"]["message"] == ["Unknown field: nickname"]
+        assert log[4]["error"]["status"] == 400
+        assert log[5]["error"]["message"][0].startswith("Invalid JSON")
+        assert log[6]["error"]["message"] == ["Row is empty"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_resume_skips_created_rows(self, registry, tmp_path):
+        route = respx.post(CONTACTS_URL).mock(
+            side_effect=[httpx.Response(200, json={}), httpx.Response(400, text="bad"), httpx.Response(200, json={})]
+        )
+        source = tmp_path / "contacts.jsonl"
+        source.write_text('{"email": "a@x.io"}\n{"email": "b@x.io"}\n')
+        args = {"file_path": str(source), "max_concurrency": 1}
+
+        first = json.loads((await registry.call_tool("import_contacts", args))[0].text)
+        second = json.loads((await registry.call_tool("import_contacts", args))[0].text)
+
+        assert (first["created"], first["failed"]) == (1, 1)
+        assert (second["created"], second["skipped"]) == (1, 1)
+        assert json.loads(route.calls.last.request.content) == {"email": "b@x.io"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_concurrency_is_bounded(self, registry, tmp_path):
+        running = 0
+        peak = 0
+
+        async def upstream(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={})
+
+        respx.post(CONTACTS_URL).mock(side_effect=upstream)
+        source = tmp_path / "contacts.jsonl"
+        source.write_text("".join(f'{{"email": "{i}@x.io"}}\n' for i in range(12)))
+
+        await registry.call_tool("import_contacts", {"file_path": str(source), "max_concurrency": 3})
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_aborts_after_max_errors(self, registry, tmp_path):
+        source = tmp_path / "contacts.jsonl"
+        source.write_text('{"nickname": "x"}\n' * 10)
+        parsed = json.loads(
+            (await registry.call_tool("import_contacts", {"file_path": str(source), "max_errors": 3}))[0].text
+        )
+        assert parsed["aborted"] is True
+        assert parsed["invalid"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_file(self, registry, tmp_path):
+        result = await registry.call_tool("import_contacts", {"file_path": str(tmp_path / "missing.csv")})
+        assert json.loads(result[0].text)["status"] == 400
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_result_log_stays_in_log_dir(self, registry, tmp_path, log_dir):
+        route = respx.post(CONTACTS_URL).respond(status_code=200, json={})
+        source = tmp_path / "contacts.jsonl"
+        source.write_text('{"email": "a@x.io"}\n')
+        for name in (str(tmp_path / "log.jsonl"), "../log.jsonl", "sub/log.jsonl", ".."):
+            args = {"file_path": str(source), "result_log": name}
+            parsed = json.loads((await registry.call_tool("import_contacts", args))[0].text)
+            assert parsed["status"] == 400, name
+        assert not route.called
+
+        args = {"file_path": str(source), "result_log": "mine.jsonl"}
+        parsed = json.loads((await registry.call_tool("import_contacts", args))[0].text)
+        assert parsed["result_log"] == "mine.jsonl"
+        assert _log(log_dir / "mine.jsonl")[0]["ok"] is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_new_file_at_same_path_does_not_resume(self, registry, tmp_path):
+        route = respx.post(CONTACTS_URL).respond(status_code=200, json={})
+        source = tmp_path / "contacts.jsonl"
+        source.write_text('{"email": "a@x.io"}\n{"email": "b@x.io"}\n')
+        await registry.call_tool("import_contacts", {"file_path": str(source)})
+
+        source.write_text('{"email": "c@x.io"}\n{"email": "d@x.io"}\n{"email": "e@x.io"}\n')
+        later = source.stat().st_mtime_ns + 1_000_000_000
+        os.utime(source, ns=(later, later))
+        parsed = json.loads((await registry.call_tool("import_contacts", {"file_path": str(source)}))[0].text)
+
+        assert (parsed["created"], parsed["skipped"]) == (3, 0)
+        assert route.call_count == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_logs_are_per_token(self, registry, tmp_path):
+        route = respx.post(CONTACTS_URL).respond(status_code=200, json={})
+        source = tmp_path / "contacts.jsonl"
+        source.write_text('{"email": "a@x.io"}\n')
+        args = {"file_path": str(source), "result_log": "shared.jsonl"}
+        try:
+            for token in ("token-a", "token-b"):
+                set_request_auth_token(token)
+                parsed = json.loads((await registry.call_tool("import_contacts", args))[0].text)
+                # Another token's log with the same name is neither resumed nor appended to
+                assert (parsed["created"], parsed["skipped"]) == (1, 0)
+        finally:
+            set_request_auth_token(None)
+        assert route.call_count == 2
@@ -0,0 +1,176 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from src.config import set_request_auth_token
+from src.server import handle_list_resource_templates, handle_read_resource
+from src.tools import export
+from src.tools.loader import ToolRegistry
+
+LIST_URL = "https://api.chatvolt.ai/conversation"
+MESSAGES_URL = r"https://api.chatvolt.ai/conversation/(?P<cid>[^/]+)/messages/(?P<count>\d+)"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_DIR", str(tmp_path))
+    return Path(export.export_directory())
+
+
+def _list_upstream(pages: int = 2, per_page: int = 3):
+    def upstream(request):
+        cursor = request.url.params.get("cursor")
+        page = int(cursor[1:]) if cursor else 0
+        body = {"conversations": [{"id": f"c{page * per_page + i}"} for i in range(per_page)]}
+        if page < pages - 1:
+            body["nextCursor"] = f"p{page + 1}"
+        return httpx.Response(200, json=body)
+
+    return upstream
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestExportConversations:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_writes_jsonl_in_conversation_order(self, registry, export_dir):
+        async def messages(request, cid, count):
+            # Earlier conversations answer last, the file must still be in order
+            await asyncio.sleep(0.02 if cid == "c0" else 0)
+            return httpx.Response(200, json=[{"text": f"{cid}-1"}, {"text": f"{cid}-2"}])
+
+        listing = respx.get(LIST_URL).mock(side_effect=_list_upstream())
+        respx.get(url__regex=MESSAGES_URL).mock(side_effect=messages)
+        output = export_dir / "export.jsonl"
+
+        result = await registry.call_tool("export_conversations", {"agentId": "a1", "file_name": "export.jsonl"})
+        summary = json.loads(result[0].text)
+        assert summary["uri"] == "chatvolt://exports/export.jsonl"
+        assert summary["conversations"] == 6
+        assert summary["messages"] == 12
+        assert summary["errors"] == 0
+        assert summary["complete"] is True
+        assert summary["bytes"] == output.stat().st_size
+
+        lines = _read_lines(output)
+        assert [line["conversation"]["id"] for line in lines] == [f"c{i}" for i in range(6)]
+        assert lines[0]["messages"] == [{"text": "c0-1"}, {"text": "c0-2"}]
+        assert listing.calls[0].request.url.params["agentId"] == "a1"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_message_fetches_are_bounded(self, registry, tmp_path):
+        running = 0
+        peak = 0
+
+        async def messages(request, cid, count):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return httpx.Response(200, json={"messages": []})
+
+        respx.get(LIST_URL).mock(side_effect=_list_upstream(pages=3, per_page=5))
+        respx.get(url__regex=MESSAGES_URL).mock(side_effect=messages)
+        args = {"agentId": "a1", "file_name": "e.jsonl", "max_concurrency": 3}
+        summary = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+        assert summary["conversations"] == 15
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_message_fetch_is_recorded(self, registry, export_dir):
+        def messages(request, cid, count):
+            if cid == "c1":
+                return httpx.Response(404, text="Not Found")
+            return httpx.Response(200, json=[])
+
+        respx.get(LIST_URL).mock(side_effect=_list_upstream(pages=1))
+        respx.get(url__regex=MESSAGES_URL).mock(side_effect=messages)
+        output = export_dir / "e.jsonl"
+        summary = json.loads(
+            (await registry.call_tool("export_conversations", {"agentId": "a1", "file_name": "e.jsonl"}))[0].text
+        )
+        assert summary["errors"] == 1
+        assert _read_lines(output)[1]["error"]["status"] == 404
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_listing_error(self, registry, tmp_path):
+        respx.get(LIST_URL).respond(status_code=401, text="Unauthorized")
+        args = {"agentId": "a1", "file_name": "e.jsonl"}
+        parsed = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+        assert parsed["error"] is True
+        assert parsed["status"] == 401
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_default_name_is_in_export_dir(self, registry, export_dir):
+        respx.get(LIST_URL).respond(status_code=200, json={"conversations": []})
+        args = {"agentId": "../a1"}
+        summary = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+        assert summary["name"].startswith("conversations-a1-")
+        assert (export_dir / summary["name"]).exists()
+        assert summary["conversations"] == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rejects_paths_outside_export_dir(self, registry, export_dir, tmp_path):
+        listing = respx.get(LIST_URL).respond(status_code=200, json={"conversations": []})
+        export_dir.mkdir()
+        (export_dir / "link.jsonl").symlink_to(tmp_path.parent / "outside.jsonl")
+        for name in (str(export_dir / "e.jsonl"), "../e.jsonl", "sub/e.jsonl", "..", "link.jsonl"):
+            args = {"agentId": "a1", "file_name": name}
+            parsed = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+            assert parsed["status"] == 400, name
+        assert not listing.called
+        assert not (tmp_path.parent / "outside.jsonl").exists()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_export_is_readable_as_resource(self, registry):
+        respx.get(LIST_URL).mock(side_effect=_list_upstream(pages=1, per_page=1))
+        respx.get(url__regex=MESSAGES_URL).respond(status_code=200, json=[])
+        args = {"agentId": "a1", "file_name": "e.jsonl"}
+        summary = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+
+        content = await handle_read_resource(summary["uri"])
+        assert json.loads(content)["conversation"] == {"id": "c0"}
+        assert "chatvolt://exports/{name}" in [t.uriTemplate for t in await handle_list_resource_templates()]
+        for uri in ("chatvolt://exports/missing.jsonl", "chatvolt://exports/../secret"):
+            with pytest.raises(ValueError, match="Unknown resource"):
+                await handle_read_resource(uri)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_exports_are_per_token(self, registry):
+        respx.get(LIST_URL).mock(side_effect=_list_upstream(pages=1, per_page=1))
+        respx.get(url__regex=MESSAGES_URL).respond(status_code=200, json=[])
+        args = {"agentId": "a1", "file_name": "e.jsonl"}
+        try:
+            set_request_auth_token("token-a")
+            summary = json.loads((await registry.call_tool("export_conversations", args))[0].text)
+            set_request_auth_token("token-b")
+            with pytest.raises(ValueError, match="Unknown resource"):
+                await handle_read_resource(summary["uri"])
+            respx.get(LIST_URL).respond(status_code=200, json={"conversations": []})
+            await registry.call_tool("export_conversations", args)
+            assert await handle_read_resource(summary["uri"]) == ""
+            set_request_auth_token("token-a")
+            assert json.loads(await handle_read_resource(summary["uri"]))["conversation"] == {"id": "c0"}
+        finally:
+            set_request_auth_token(None)
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.hedging import Hedger
+from src.tools.loader import ToolRegistry
+
+
+def _primed_hedger(key: str, latency: float = 0.01) -> Hedger:
+    hedger = Hedger(percentile=95, min_delay=0.01, min_samples=5)
+    for _ in range(5):
+        hedger.record(key, latency)
+    return hedger
+
+
+class TestHedger:
+    def test_no_delay_without_enough_samples(self):
+        hedger = Hedger(min_samples=5)
+        hedger.record("get_agent", 0.1)
+        assert hedger.delay("get_agent") is None
+
+    def test_delay_uses_percentile_with_floor(self):
+        hedger = Hedger(percentile=90, min_delay=0.05, min_samples=10)
+        for i in range(10):
+            hedger.record("get_agent", i / 100)
+        assert hedger.delay("get_agent") == 0.09
+        for _ in range(10):
+            hedger.record("get_models", 0.001)
+        assert hedger.delay("get_models") == 0.05
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_hedge(self):
+        hedger = _primed_hedger("k")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            return "primary"
+
+        assert await hedger.run("k", request) == "primary"
+        assert calls == 1
+        assert hedger.stats()["fired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        hedger = _primed_hedger("k")
+        cancelled = asyncio.Event()
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return f"call-{calls}"
+
+        assert await hedger.run("k", request) == "call-2"
+        await asyncio.wait_for(cancelled.wait(), timeout=0.5)
+        assert hedger.stats()["fired"] == 1
+        assert hedger.stats()["won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_request_falls_back_to_the_other(self):
+        hedger = _primed_hedger("k")
+        calls = 0
+
+        async def request():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                raise httpx.ConnectError("boom")
+            await asyncio.sleep(0.1)
+            return "hedge"
+
+        assert await hedger.run("k", request) == "hedge"
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises(self):
+        hedger = _primed_hedger("k")
+
+        async def request():
+            await asyncio.sleep(0.02)
+            raise httpx.ConnectError("boom")
+
+        with pytest.raises(httpx.ConnectError):
+            await hedger.run("k", request)
+
+
+class TestRegistryHedging:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_read_only_tool_is_hedged(self):
+        registry = ToolRegistry()
+        registry.hedger = _primed_hedger("get_conversation")
+        registry.hedged_tools = {"get_conversation"}
+        calls = 0
+
+        async def upstream(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+            return httpx.Response(200, json={"id": "c1", "call": calls})
+
+        respx.get("https://api.chatvolt.ai/conversation/c1").mock(side_effect=upstream)
+        result = await asyncio.wait_for(registry.call_tool("get_conversation", {"conversationId": "c1"}), 0.5)
+        assert json.loads(result[0].text) == {"id": "c1", "call": 2}
+        assert registry.stats()["hedging"]["won"] == 1
+
+    def test_hedging_is_opt_in(self):
+        registry = ToolRegistry()
+        assert registry.hedged_tools == set()
+        assert registry.stats()["hedging"]["enabled"] is False
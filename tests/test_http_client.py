@@ -0,0 +1,68 @@
+import json
+
+import pytest
+import respx
+
+from src.server import handle_metrics
+from src.tools import http_client
+from src.tools.http_client import UpstreamClient
+from src.tools.loader import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_across_calls():
+    upstream = UpstreamClient()
+    first = upstream.client
+    assert upstream.client is first
+    await upstream.aclose()
+    assert upstream.stats()["open"] is False
+
+
+@pytest.mark.asyncio
+async def test_context_manager_opens_and_closes():
+    upstream = UpstreamClient(max_connections=5, max_keepalive_connections=2, keepalive_expiry=10.0)
+    async with upstream:
+        stats = upstream.stats()
+        assert stats["open"] is True
+        assert stats["max_connections"] == 5
+        assert stats["max_keepalive_connections"] == 2
+        assert stats["keepalive_expiry"] == 10.0
+    assert upstream.stats()["open"] is False
+
+
+def test_http2_mode_enabled_when_h2_available(monkeypatch):
+    monkeypatch.setattr(http_client, "_h2_available", lambda: True)
+    upstream = UpstreamClient(http2=True)
+    assert upstream.http2 is True
+    assert upstream.http1 is True
+    assert upstream.stats()["http2"] is True
+
+
+def test_http2_mode_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(http_client, "_h2_available", lambda: False)
+    upstream = UpstreamClient(http2=True, http1=False)
+    assert upstream.http2 is False
+    assert upstream.http1 is True
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_registry_uses_pooled_client(registry):
+    respx.get("https://api.chatvolt.ai/agents/1").respond(status_code=200, json={"id": "1"})
+    await registry.call_tool("get_agent", {"id": "1"})
+    client = registry.http.client
+    await registry.call_tool("get_agent", {"id": "1"})
+    assert registry.http.client is client
+    await registry.http.aclose()
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_pool_stats():
+    response = await handle_metrics(None)
+    payload = json.loads(response.body)
+    assert {"active", "idle", "connections", "max_connections"} <= payload["pool"].keys()
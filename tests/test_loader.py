@@ -77,3 +77,28 @@ async def test_call_tool_http_error(registry):
     assert parsed["status"] == 400
     assert parsed["message"] == "Bad Request"
     assert route.called
+
+
+def test_tool_catalog_is_cached(registry):
+    catalog = registry.tool_catalog()
+    assert registry.tool_catalog() is catalog
+    assert json.loads(catalog.response(5)) == {
+        "jsonrpc": "2.0",
+        "id": 5,
+        "result": json.loads(catalog.encoded_result),
+    }
+    assert registry.stats()["tool_list"]["builds"] == 1
+
+
+def test_tool_catalog_rebuilds_when_tools_change(registry):
+    catalog = registry.tool_catalog()
+    registry.local_tools = {
+        **registry.local_tools,
+        "probe": {"description": "Probe", "input_schema": {"type": "object", "properties": {}}},
+    }
+    rebuilt = registry.tool_catalog()
+    assert rebuilt is not catalog
+    assert rebuilt.hash != catalog.hash
+    assert "probe" in [tool.name for tool in registry.get_tool_list()]
+    registry.refresh_tool_catalog()
+    assert registry.tool_catalog().hash == rebuilt.hash
@@ -0,0 +1,106 @@
+import hashlib
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+from src.tools.media_index import MediaIndex, hash_file
+
+UPLOAD_URL = "https://api.chatvolt.ai/artifacts/media/upload"
+LIST_URL = "https://api.chatvolt.ai/artifacts/media"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "logo.png"
+    path.write_bytes(b"\x89PNG" + b"0" * 2048)
+    return path
+
+
+def _args(path, name="Logo"):
+    return {"artifact_id": "a1", "name": name, "file_path": str(path)}
+
+
+class TestMediaIndex:
+    @pytest.mark.asyncio
+    async def test_hash_file(self, image):
+        assert await hash_file(str(image), chunk_size=100) == hashlib.sha256(image.read_bytes()).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_per_artifact(self):
+        index = MediaIndex()
+        await index.put("a1", "h", "m1")
+        assert await index.get("a1", "h") == "m1"
+        assert await index.get("a2", "h") is None
+        await index.forget("a1", "h")
+        assert await index.get("a1", "h") is None
+
+    @pytest.mark.asyncio
+    async def test_persisted_index(self, tmp_path):
+        path = str(tmp_path / "index" / "media.json")
+        await MediaIndex(path).put("a1", "h", "m1")
+        assert await MediaIndex(path).get("a1", "h") == "m1"
+
+
+class TestUploadDedup:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_duplicate_returns_existing_entry(self, registry, image):
+        upload = respx.post(UPLOAD_URL).respond(status_code=200, json={"id": "m1", "name": "Logo"})
+        listing = respx.get(LIST_URL).respond(
+            status_code=200, json={"media": [{"id": "m0"}, {"id": "m1", "name": "Logo", "url": "https://cdn/m1"}]}
+        )
+
+        await registry.call_tool("upload_artifact_media", _args(image))
+        result = await registry.call_tool("upload_artifact_media", _args(image, name="Logo again"))
+
+        assert json.loads(result[0].text) == {"id": "m1", "name": "Logo", "url": "https://cdn/m1"}
+        assert upload.call_count == 1
+        assert listing.calls.last.request.url.params["artifact_id"] == "a1"
+        stats = registry.stats()["media_dedup"]
+        assert stats["hits"] == 1
+        assert stats["bytes_saved"] == image.stat().st_size
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_follows_list_cursor(self, registry, image):
+        respx.post(UPLOAD_URL).respond(status_code=200, json={"media": {"id": "m9"}})
+        respx.get(LIST_URL, params={"cursor": "c2"}).respond(status_code=200, json={"media": [{"id": "m9"}]})
+        respx.get(LIST_URL).respond(status_code=200, json={"media": [{"id": "m0"}], "nextCursor": "c2"})
+
+        await registry.call_tool("upload_artifact_media", _args(image))
+        result = await registry.call_tool("upload_artifact_media", _args(image))
+        assert json.loads(result[0].text) == {"id": "m9"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_deleted_media_is_uploaded_again(self, registry, image):
+        upload = respx.post(UPLOAD_URL).mock(
+            side_effect=[httpx.Response(200, json={"id": "m1"}), httpx.Response(200, json={"id": "m2"})]
+        )
+        respx.get(LIST_URL).respond(status_code=200, json={"media": []})
+
+        await registry.call_tool("upload_artifact_media", _args(image))
+        result = await registry.call_tool("upload_artifact_media", _args(image))
+        assert json.loads(result[0].text) == {"id": "m2"}
+        assert upload.call_count == 2
+        assert await registry.media_index.get("a1", await hash_file(str(image))) == "m2"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_different_content_or_artifact_is_uploaded(self, registry, image, tmp_path):
+        upload = respx.post(UPLOAD_URL).respond(status_code=200, json={"id": "m1"})
+        other = tmp_path / "other.png"
+        other.write_bytes(b"different")
+
+        await registry.call_tool("upload_artifact_media", _args(image))
+        await registry.call_tool("upload_artifact_media", _args(other))
+        await registry.call_tool("upload_artifact_media", {**_args(image), "artifact_id": "a2"})
+        assert upload.call_count == 3
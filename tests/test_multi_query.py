@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+
+QUERY_URL = r"https://api.chatvolt.ai/datastores/(?P<datastore_id>[^/]+)/query"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+def _hits(datastore_id, *scores):
+    return [{"text": f"{datastore_id}-{score}", "score": score} for score in scores]
+
+
+class TestQueryDatastores:
+    def test_is_listed(self, registry):
+        tools = {tool.name: tool for tool in registry.get_tool_list()}
+        assert tools["query_datastores"].inputSchema["required"] == ["ids", "query"]
+        assert tools["query_datastores"].annotations.readOnlyHint is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_merges_by_score(self, registry):
+        responses = {
+            "d1": _hits("d1", 0.9, 0.5, 0.1),
+            "d2": {"results": _hits("d2", 0.8, 0.7)},
+            "d3": [{"text": "unscored"}],
+        }
+        route = respx.post(url__regex=QUERY_URL).mock(
+            side_effect=lambda request, datastore_id: httpx.Response(200, json=responses[datastore_id])
+        )
+        result = await registry.call_tool(
+            "query_datastores", {"ids": ["d1", "d2", "d3"], "query": "refunds", "topK": 4}
+        )
+        parsed = json.loads(result[0].text)
+
+        assert [item["text"] for item in parsed["results"]] == ["d1-0.9", "d2-0.8", "d2-0.7", "d1-0.5"]
+        assert parsed["results"][1]["datastoreId"] == "d2"
+        assert parsed["datastores"]["d1"]["results"] == 3
+        assert parsed["complete"] is True
+        assert json.loads(route.calls[0].request.content) == {"query": "refunds", "topK": 4}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_slow_datastore_is_left_out(self, registry):
+        async def upstream(request, datastore_id):
+            if datastore_id == "slow":
+                await asyncio.sleep(1)
+            return httpx.Response(200, json=_hits(datastore_id, 0.5))
+
+        respx.post(url__regex=QUERY_URL).mock(side_effect=upstream)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await registry.call_tool("query_datastores", {"ids": ["fast", "slow"], "query": "q", "timeout": 0.05})
+        parsed = json.loads(result[0].text)
+
+        assert loop.time() - started < 0.5
+        assert [item["datastoreId"] for item in parsed["results"]] == ["fast"]
+        assert parsed["datastores"]["slow"]["ok"] is False
+        assert "Timed out" in parsed["datastores"]["slow"]["error"]
+        assert parsed["complete"] is False
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_errors(self, registry):
+        respx.post(url__regex=QUERY_URL).respond(status_code=404, text="Not Found")
+        parsed = json.loads((await registry.call_tool("query_datastores", {"ids": ["d1"], "query": "q"}))[0].text)
+        assert parsed["status"] == 502
+        assert "Not Found" in parsed["message"]
+        parsed = json.loads((await registry.call_tool("query_datastores", {"ids": [], "query": "q"}))[0].text)
+        assert parsed["status"] == 400
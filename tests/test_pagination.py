@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+from src.tools.pagination import page_items
+
+URL = "https://api.chatvolt.ai/conversation"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+def _pages(count: int, per_page: int = 2):
+    """Upstream serving `count` pages of conversations, cursor c1..c{count-1}."""
+
+    def upstream(request):
+        cursor = request.url.params.get("cursor")
+        page = int(cursor[1:]) if cursor else 0
+        body = {"conversations": [{"id": f"p{page}-{i}"} for i in range(per_page)]}
+        if page < count - 1:
+            body["nextCursor"] = f"c{page + 1}"
+        return httpx.Response(200, json=body)
+
+    return upstream
+
+
+def test_page_items():
+    assert page_items([1, 2]) == ([1, 2], None)
+    assert page_items({"media": [{"id": "m1"}], "nextCursor": "c2"}) == ([{"id": "m1"}], "c2")
+    assert page_items({"items": [], "nextCursor": None}) == ([], None)
+    assert page_items("oops") == ([], None)
+
+
+class TestPaginate:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_walks_every_page(self, registry):
+        route = respx.get(URL).mock(side_effect=_pages(3))
+        result = await registry.call_tool("paginate", {"name": "list_conversations", "arguments": {"agentId": "a1"}})
+        parsed = json.loads(result[0].text)
+        assert [item["id"] for item in parsed["items"]] == ["p0-0", "p0-1", "p1-0", "p1-1", "p2-0", "p2-1"]
+        assert parsed["pages"] == 3
+        assert parsed["complete"] is True
+        assert parsed["next_cursor"] is None
+        assert route.call_count == 3
+        assert all(call.request.url.params["agentId"] == "a1" for call in route.calls)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_item_budget_returns_continuation(self, registry):
+        respx.get(URL).mock(side_effect=_pages(5))
+        parsed = json.loads(
+            (await registry.call_tool("paginate", {"name": "list_conversations", "max_items": 3}))[0].text
+        )
+        # Pages are merged whole, so the budget stops before the page that would exceed it
+        assert len(parsed["items"]) == 2
+        assert parsed["next_cursor"] == "c1"
+        assert parsed["complete"] is False
+
+        parsed = json.loads(
+            (await registry.call_tool("paginate", {"name": "list_conversations", "cursor": "c1", "max_items": 4}))[
+                0
+            ].text
+        )
+        assert [item["id"] for item in parsed["items"]] == ["p1-0", "p1-1", "p2-0", "p2-1"]
+        assert parsed["next_cursor"] == "c3"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_byte_budget(self, registry):
+        respx.get(URL).mock(side_effect=_pages(5))
+        parsed = json.loads(
+            (await registry.call_tool("paginate", {"name": "list_conversations", "max_bytes": 1}))[0].text
+        )
+        assert parsed["pages"] == 1
+        assert parsed["next_cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_next_page_is_prefetched(self, registry):
+        requested = []
+
+        async def upstream(request):
+            requested.append(request.url.params.get("cursor"))
+            await asyncio.sleep(0.01)
+            return _pages(3)(request)
+
+        respx.get(URL).mock(side_effect=upstream)
+        updates = []
+
+        async def progress(message, value, total):
+            # While page N is being handled, page N+1 is already in flight
+            await asyncio.sleep(0.005)
+            updates.append((value, list(requested)))
+
+        await registry.call_tool("paginate", {"name": "list_conversations"}, progress)
+        assert updates[0] == (1, [None, "c1"])
+        assert updates[1] == (2, [None, "c1", "c2"])
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_error_after_first_page_keeps_partial_result(self, registry):
+        def upstream(request):
+            if request.url.params.get("cursor") == "c1":
+                return httpx.Response(404, text="Gone")
+            return _pages(3)(request)
+
+        respx.get(URL).mock(side_effect=upstream)
+        parsed = json.loads((await registry.call_tool("paginate", {"name": "list_conversations"}))[0].text)
+        assert len(parsed["items"]) == 2
+        assert parsed["next_cursor"] == "c1"
+        assert parsed["error"]["status"] == 404
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_first_page_error_is_returned(self, registry):
+        respx.get(URL).respond(status_code=401, text="Unauthorized")
+        parsed = json.loads((await registry.call_tool("paginate", {"name": "list_conversations"}))[0].text)
+        assert parsed["error"] is True
+        assert parsed["status"] == 401
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_repeated_cursor_stops(self, registry):
+        route = respx.get(URL).respond(status_code=200, json={"conversations": [{"id": 1}], "nextCursor": "same"})
+        parsed = json.loads((await registry.call_tool("paginate", {"name": "list_conversations"}))[0].text)
+        assert route.call_count == 2
+        assert parsed["complete"] is True
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_paginated_tools(self, registry):
+        for name in ("get_agent", "nope"):
+            parsed = json.loads((await registry.call_tool("paginate", {"name": name}))[0].text)
+            assert parsed["status"] == 400
@@ -0,0 +1,86 @@
+import dataclasses
+import json
+
+import pytest
+import respx
+
+from src.tools.definitions import TOOLS_DEFINITION
+from src.tools.loader import ToolRegistry
+from src.tools.plans import compile_plan
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+class TestCompilePlan:
+    def test_every_definition_compiles(self, registry):
+        assert set(registry.plans) == set(TOOLS_DEFINITION)
+
+    def test_path_segments(self):
+        plan = compile_plan({"method": "GET", "path": "/a/{x}/b/{y}", "input_schema": {}})
+        assert plan.prefix == "/a/"
+        assert plan.path_parts == (("x", "{x}", "/b/"), ("y", "{y}", ""))
+        assert plan.fill({"x": 1, "y": "two", "q": 3}) == ("/a/1/b/two", {"q": 3}, {})
+        # A missing path argument keeps its placeholder
+        assert plan.fill({"x": 1})[0] == "/a/1/b/{y}"
+
+    def test_path_defaults(self, registry):
+        plan = registry.plans["get_conversation_messages"]
+        assert plan.fill({"conversationId": "c1"})[0] == "/conversation/c1/messages/2"
+        assert plan.fill({"conversationId": "c1", "count": 10})[0] == "/conversation/c1/messages/10"
+
+    def test_body_routing(self):
+        plan = compile_plan({"method": "PATCH", "path": "/agents/{id}", "input_schema": {}})
+        assert plan.fill({"id": "a1", "name": "n"}) == ("/agents/a1", {}, {"name": "n"})
+
+    def test_plans_are_immutable(self, registry):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            registry.plans["get_agent"].method = "POST"
+
+    def test_arguments_are_not_modified(self, registry):
+        arguments = {"id": "a1", "type": "zapi", "enabled": True}
+        registry.plans["toggle_webhook"].fill(arguments)
+        assert arguments == {"id": "a1", "type": "zapi", "enabled": True}
+
+    def test_special_cases_come_from_definitions(self, registry):
+        assert registry.plans["toggle_webhook"].fill({"id": "a1", "type": "zapi", "enabled": False}) == (
+            "/agents/a1/webhook",
+            {"type": "zapi", "enabled": "false"},
+            {},
+        )
+        _, query, _ = registry.plans["search_artifacts"].fill({"q": "x", "ids": ["1", "2"], "mediaTypes": ["IMAGE"]})
+        assert query == {"q": "x", "ids": "1,2", "mediaTypes": "IMAGE"}
+        assert registry.plans["get_models"].auth is False
+        assert registry.plans["upload_artifact_media"].is_upload({})
+        assert registry.plans["create_datasource"].is_upload({"type": "file"})
+        assert not registry.plans["create_datasource"].is_upload({"type": "web_page"})
+        assert not registry.plans["create_contact"].is_upload({})
+
+
+class TestPlannedRequests:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_toggle_webhook_request(self, registry):
+        route = respx.patch("https://api.chatvolt.ai/agents/a1/webhook").respond(status_code=200, json={})
+        await registry.call_tool("toggle_webhook", {"id": "a1", "type": "zapi", "enabled": True})
+        request = route.calls.last.request
+        assert dict(request.url.params) == {"type": "zapi", "enabled": "true"}
+        assert request.content == b""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_models_has_no_auth(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/models").respond(status_code=200, json=[])
+        await registry.call_tool("get_models", {})
+        assert "authorization" not in route.calls.last.request.headers
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_body_request(self, registry):
+        route = respx.post("https://api.chatvolt.ai/contacts").respond(status_code=200, json={})
+        await registry.call_tool("create_contact", {"email": "a@x.io"})
+        request = route.calls.last.request
+        assert json.loads(request.content) == {"email": "a@x.io"}
+        assert request.headers["authorization"].startswith("Bearer ")
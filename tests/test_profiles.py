@@ -0,0 +1,102 @@
+import httpx
+import pytest
+import respx
+
+from src.config import set_request_tool_profile
+from src.server import mcp_app, registry
+from src.tools.definitions import DEFINITION_MODULES, TOOLS_DEFINITION, load_definitions
+from src.tools.loader import ToolRegistry
+from src.tools.profiles import PROFILES, resolve_profile
+
+
+@pytest.fixture(autouse=True)
+def no_request_profile():
+    set_request_tool_profile(None)
+    yield
+    set_request_tool_profile(None)
+
+
+def test_resolve_profile():
+    assert resolve_profile("full") == DEFINITION_MODULES
+    assert resolve_profile("knowledge") == ("agents", "datastores", "datasources")
+    # Profiles and modules combine, in listing order and without duplicates
+    assert resolve_profile("zapi, knowledge,agents") == ("agents", "datastores", "datasources", "zapi")
+    with pytest.raises(ValueError, match="nope"):
+        resolve_profile("crm,nope")
+
+
+def test_profiles_only_name_known_modules():
+    for modules in PROFILES.values():
+        assert set(modules) <= set(DEFINITION_MODULES)
+
+
+def test_load_definitions_matches_merged_definitions():
+    merged = {name: info for tools in load_definitions().values() for name, info in tools.items()}
+    assert merged == TOOLS_DEFINITION
+    assert list(load_definitions(("zapi", "agents"))) == ["agents", "zapi"]
+
+
+def test_registry_loads_only_profile_modules():
+    registry = ToolRegistry(profile="knowledge")
+    assert set(registry.modules) == {"agents", "datastores", "datasources"}
+    assert "query_agent" in registry.tools
+    assert "list_contacts" not in registry.tools
+    assert set(registry.plans) == set(registry.tools)
+    # Local tools are only offered when the upstream tools they call are loaded
+    assert "query_datastores" in registry.local_tools
+    assert "batch_call" in registry.local_tools
+    assert "import_contacts" not in registry.local_tools
+    assert "zapi_bulk_send" not in registry.local_tools
+    names = {tool.name for tool in registry.tool_catalog().tools}
+    assert names == set(registry.tools) | set(registry.local_tools)
+
+
+def test_unknown_profile_fails_at_startup():
+    with pytest.raises(ValueError):
+        ToolRegistry(profile="everything")
+
+
+def test_request_profile_narrows_catalog():
+    registry = ToolRegistry()
+    full = registry.tool_catalog()
+    zapi = registry.tool_catalog("zapi")
+    assert registry.tool_catalog("zapi") is zapi
+    names = {tool.name for tool in zapi.tools}
+    assert names == set(load_definitions(("zapi",))["zapi"]) | {
+        "batch_call",
+        "paginate",
+        "search_tools",
+        "zapi_bulk_send",
+    }
+    assert len(zapi.encoded_result) < len(full.encoded_result)
+    assert zapi.hash != full.hash
+
+    set_request_tool_profile("zapi")
+    assert registry.tool_catalog() is zapi
+    assert registry.stats()["tool_list"]["request_profiles"]["zapi"]["tools"] == len(names)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_call_outside_request_profile_is_not_found():
+    registry = ToolRegistry()
+    set_request_tool_profile("zapi")
+    result = await registry.call_tool("get_agent", {"id": "agent_1"})
+    assert "not found" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_tool_list_profile_from_path_and_header():
+    transport = httpx.ASGITransport(app=mcp_app)
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        by_path = await client.post("/mcp/crm", json=request)
+        by_header = await client.post("/mcp", json=request, headers={"X-Chatvolt-Profile": "crm"})
+        unknown_path = await client.post("/mcp/nope", json=request)
+        unknown_header = await client.post("/mcp", json=request, headers={"X-Chatvolt-Profile": "nope"})
+
+    expected = [tool.name for tool in registry.tool_catalog("crm").tools]
+    assert [tool["name"] for tool in by_path.json()["result"]["tools"]] == expected
+    assert by_header.json() == by_path.json()
+    assert unknown_path.status_code == 404
+    assert unknown_header.status_code == 400
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+import respx
+
+from src.config import set_request_auth_token
+from src.tools.loader import ToolRegistry
+from src.tools.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after("0.5") == 0.5
+
+    def test_http_date(self):
+        delay = parse_retry_after(formatdate(time.time() + 10, usegmt=True))
+        assert 8 <= delay <= 10
+
+    def test_invalid_or_missing(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_pause_blocks_callers(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        bucket.pause(0.05)
+        started = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_rate_refill(self):
+        bucket = TokenBucket(rate=100, burst=1)
+        await bucket.acquire()
+        started = time.monotonic()
+        waited = await bucket.acquire()
+        assert waited > 0
+        assert time.monotonic() - started >= 0.005
+
+    @pytest.mark.asyncio
+    async def test_buckets_are_per_token(self):
+        limiter = RateLimiter()
+        limiter.pause("token-a", 10)
+        await asyncio.wait_for(limiter.acquire("token-b"), timeout=0.1)
+        stats = limiter.stats()
+        assert stats["buckets"] == 2
+        assert stats["paused_buckets"] == 1
+
+
+class TestRegistryRateLimit:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_after_does_not_burn_attempts(self, registry):
+        throttled = httpx.Response(429, headers={"retry-after": "0.01"}, text="Too Many Requests")
+        route = respx.get("https://api.chatvolt.ai/agents/1").mock(
+            side_effect=[throttled, throttled, throttled, httpx.Response(200, json={"id": "1"})]
+        )
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        assert json.loads(result[0].text) == {"id": "1"}
+        assert route.call_count == 4
+        assert registry.rate_limits.stats()["pauses"] == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_429_pauses_other_calls_for_the_same_token(self, registry):
+        set_request_auth_token("shared-token")
+        try:
+            respx.get("https://api.chatvolt.ai/agents/1").mock(
+                side_effect=[
+                    httpx.Response(429, headers={"retry-after": "0.1"}),
+                    httpx.Response(200, json={"id": "1"}),
+                ]
+            )
+            contacts = respx.get("https://api.chatvolt.ai/contacts/c1").respond(status_code=200, json={"id": "c1"})
+
+            first = asyncio.create_task(registry.call_tool("get_agent", {"id": "1"}))
+            await asyncio.sleep(0.02)
+            started = time.monotonic()
+            await registry.call_tool("get_contact", {"id": "c1"})
+            assert time.monotonic() - started >= 0.05
+            assert contacts.call_count == 1
+            await first
+        finally:
+            set_request_auth_token(None)
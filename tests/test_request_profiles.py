@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools import loader
+from src.tools.loader import ToolRegistry, _request_profile
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(loader, "BASE_DELAY", 0.0)
+    monkeypatch.setattr(loader.random, "uniform", lambda a, b: 0.0)
+
+
+class TestProfileResolution:
+    def test_defaults(self):
+        profile = _request_profile({"path": "/agents"})
+        assert profile["timeout"].connect == 10.0
+        assert profile["timeout"].read == 30.0
+        assert profile["timeout"].pool == loader.HTTP_POOL_TIMEOUT
+        assert profile["total"] is None
+        assert profile["max_retries"] == loader.MAX_RETRIES - 1
+        assert profile["retry_statuses"] == loader.RETRYABLE_STATUS_CODES
+
+    def test_partial_override_keeps_defaults(self):
+        profile = _request_profile({"timeout": {"read": 60}})
+        assert profile["timeout"].connect == 10.0
+        assert profile["timeout"].read == 60
+
+    def test_declared_profiles(self, registry):
+        assert registry.profiles["query_agent"]["timeout"].read == 300
+        assert registry.profiles["query_agent"]["total"] == 600
+        assert registry.profiles["get_models"]["total"] == 2
+        assert registry.profiles["get_models"]["max_retries"] == 0
+
+
+class TestRegistryProfiles:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_timeouts_are_passed_to_httpx(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/models").respond(status_code=200, json={})
+        await registry.call_tool("get_models", {})
+        timeout = route.calls.last.request.extensions["timeout"]
+        assert timeout["connect"] == 2
+        assert timeout["read"] == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_max_retries_zero_makes_one_attempt(self, registry, no_backoff):
+        route = respx.get("https://api.chatvolt.ai/agents/models").respond(status_code=503, text="Unavailable")
+        result = await registry.call_tool("get_models", {})
+        assert json.loads(result[0].text)["status"] == 503
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_statuses_are_honored(self, registry, no_backoff):
+        route = respx.post("https://api.chatvolt.ai/agents/a1/query").respond(status_code=500, text="Error")
+        await registry.call_tool("query_agent", {"id": "a1", "query": "hi"})
+        assert route.call_count == 1
+
+        route = respx.post("https://api.chatvolt.ai/agents/a2/query").respond(status_code=503, text="Busy")
+        await registry.call_tool("query_agent", {"id": "a2", "query": "hi"})
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_total_timeout_bounds_the_call(self, registry):
+        registry.profiles["get_agent"] = {**registry.profiles["get_agent"], "total": 0.05}
+
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        respx.get("https://api.chatvolt.ai/agents/1").mock(side_effect=slow)
+        result = await registry.call_tool("get_agent", {"id": "1"})
+        parsed = json.loads(result[0].text)
+        assert parsed["error"] is True
+        assert parsed["status"] == 504
+        assert registry.limiter.in_flight == 0
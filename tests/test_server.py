@@ -1,8 +1,16 @@
+import json
+
+import httpx
 import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import RequestParams
 
 from src.server import (
     COMPLETION_VALUES,
     LOG_LEVELS,
+    _progress_notifier,
+    _serve_tool_list,
     app,
     handle_complete,
     handle_get_prompt,
@@ -12,6 +20,8 @@ from src.server import (
     handle_list_tools,
     handle_read_resource,
     handle_set_logging_level,
+    mcp_app,
+    registry,
 )
 
 
@@ -118,13 +128,14 @@ async def test_read_resource_unknown():
 async def test_list_resource_templates():
     """Test listing resource templates."""
     templates = await handle_list_resource_templates()
-    assert len(templates) == 5
+    assert len(templates) == 6
     template_names = [t.name for t in templates]
     assert "Agent Configuration" in template_names
     assert "Conversation Details" in template_names
     assert "Contact Profile" in template_names
     assert "Dispatch Details" in template_names
     assert "Datastore Configuration" in template_names
+    assert "Conversation Export" in template_names
 
 
 @pytest.mark.asyncio
@@ -226,3 +237,86 @@ def test_completion_values_defined():
     assert "channel" in COMPLETION_VALUES
     assert "type" in COMPLETION_VALUES
     assert "method" in COMPLETION_VALUES
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.sent = []
+
+    async def send_progress_notification(self, token, progress, total=None, message=None, related_request_id=None):
+        self.sent.append(("progress", token, progress, total, message, related_request_id))
+
+    async def send_log_message(self, level, data, logger=None, related_request_id=None):
+        self.sent.append(("log", level, data, related_request_id))
+
+
+def test_progress_notifier_outside_request():
+    assert _progress_notifier("query_agent") is None
+
+
+@pytest.mark.asyncio
+async def test_progress_notifier_uses_progress_token():
+    session = _RecordingSession()
+    meta = RequestParams.Meta(progressToken="tok")
+    reset = request_ctx.set(RequestContext(request_id=7, meta=meta, session=session, lifespan_context=None))
+    try:
+        notify = _progress_notifier("query_agent")
+    finally:
+        request_ctx.reset(reset)
+    await notify("Hello", 1, 10)
+    assert session.sent == [("progress", "tok", 1, 10, "Hello", 7)]
+
+
+@pytest.mark.asyncio
+async def test_progress_notifier_falls_back_to_log():
+    session = _RecordingSession()
+    reset = request_ctx.set(RequestContext(request_id=7, meta=None, session=session, lifespan_context=None))
+    try:
+        notify = _progress_notifier("query_agent")
+    finally:
+        request_ctx.reset(reset)
+    await notify("Hello", 1, None)
+    assert session.sent == [("log", "info", {"tool": "query_agent", "chunk": "Hello"}, 7)]
+
+
+def _receive(*bodies):
+    messages = [
+        {"type": "http.request", "body": body, "more_body": i < len(bodies) - 1} for i, body in enumerate(bodies)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    return receive
+
+
+@pytest.mark.asyncio
+async def test_tool_list_is_served_pre_encoded():
+    transport = httpx.ASGITransport(app=mcp_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/mcp", json={"jsonrpc": "2.0", "id": "req-1", "method": "tools/list"})
+    body = response.json()
+    catalog = registry.tool_catalog()
+    assert body["id"] == "req-1"
+    assert [tool["name"] for tool in body["result"]["tools"]] == [tool.name for tool in catalog.tools]
+    assert body["result"]["_meta"]["chatvolt/toolsHash"] == catalog.hash
+    assert response.headers["etag"] == f'"{catalog.hash}"'
+    assert response.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_other_requests_are_replayed():
+    calls = []
+
+    async def send(message):
+        calls.append(message)
+
+    request = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {"cursor": "c"}}).encode()
+    replay = await _serve_tool_list({"type": "http"}, _receive(request[:10], request[10:]), send)
+    assert calls == []
+    assert (await replay())["body"] == request[:10]
+    assert (await replay())["body"] == request[10:]
+
+    for other in (b'{"jsonrpc": "2.0", "id": 1, "method": "tools/call"}', b"not json", b'{"method": "tools/list"}'):
+        assert await _serve_tool_list({"type": "http"}, _receive(other), send) is not None
+    assert calls == []
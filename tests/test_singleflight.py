@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+from src.tools.singleflight import SingleFlight
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+async def _slow_response(request):
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"models": ["gpt-4o"]})
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        assert results == ["done"] * 5
+        assert calls == 1
+        assert flight.stats() == {"in_flight": 0, "calls": 1, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(flight.do("k", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "done"
+
+
+class TestRegistryCoalescing:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_identical_concurrent_gets_are_coalesced(self, registry):
+        route = respx.get("https://api.chatvolt.ai/agents/models").mock(side_effect=_slow_response)
+        results = await asyncio.gather(*(registry.call_tool("get_models", {}) for _ in range(10)))
+        assert route.call_count == 1
+        assert all(json.loads(r[0].text) == {"models": ["gpt-4o"]} for r in results)
+        assert registry.stats()["inflight"]["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_different_arguments_are_not_coalesced(self, registry):
+        route = respx.get("https://api.chatvolt.ai/conversation").mock(side_effect=_slow_response)
+        await asyncio.gather(
+            registry.call_tool("list_conversations", {"agentId": "a1"}),
+            registry.call_tool("list_conversations", {"agentId": "a2"}),
+        )
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_mutations_are_not_coalesced(self, registry):
+        route = respx.post("https://api.chatvolt.ai/contacts").mock(
+            side_effect=lambda request: httpx.Response(201, json={"id": "c1"})
+        )
+        await asyncio.gather(*(registry.call_tool("create_contact", {"firstName": "A"}) for _ in range(3)))
+        assert route.call_count == 3
@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import RETRYABLE_STATUS_CODES, ToolRegistry
+from src.tools.plans import compile_plan
+from src.tools.streaming import split_sse
+
+URL = "https://api.chatvolt.ai/agents/a1/query"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+def _sse_response(events: list[str], delay: float = 0.0) -> httpx.Response:
+    async def body():
+        for event in events:
+            if delay:
+                await asyncio.sleep(delay)
+            yield event.encode()
+
+    return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body())
+
+
+class TestSplitSse:
+    def test_complete_lines(self):
+        payloads, rest = split_sse("data: Hel\n\ndata: lo\r\n\n")
+        assert payloads == ["Hel", "lo"]
+        assert rest == ""
+
+    def test_keeps_partial_line(self):
+        payloads, rest = split_sse("event: message\ndata: a\ndata: b")
+        assert payloads == ["a"]
+        assert rest == "data: b"
+
+
+class TestStreamingQuery:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_chunks_are_forwarded_in_order(self, registry):
+        events = ["data: Hel", "lo\n\n", "data: world\n\n", "data: [DONE]\n\n"]
+        respx.post(URL).mock(return_value=_sse_response(events))
+        received = []
+
+        async def progress(message, value, total):
+            received.append((message, value))
+
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True}, progress)
+        assert received == [("Hello", 1), ("world", 2)]
+        assert result[0].text == "".join(events)
+        assert not result[0].text.startswith('{"error"')
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_first_chunk_arrives_before_the_stream_ends(self, registry):
+        respx.post(URL).mock(return_value=_sse_response([f"data: {i}\n\n" for i in range(5)], delay=0.05))
+        loop = asyncio.get_running_loop()
+        first = None
+
+        async def progress(message, value, total):
+            nonlocal first
+            if first is None:
+                first = loop.time()
+
+        started = loop.time()
+        await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True}, progress)
+        finished = loop.time()
+        assert first - started < (finished - started) / 2
+        stats = registry.stats()["streaming"]
+        assert stats["streams"] == 1
+        assert stats["chunks"] == 5
+        assert stats["ttft_ms"]["last"] < 150
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_non_sse_body_is_relayed_raw(self, registry):
+        async def body():
+            yield b'{"answer": '
+            yield b'"hi"}'
+
+        respx.post(URL).mock(return_value=httpx.Response(200, content=body()))
+        received = []
+
+        async def progress(message, value, total):
+            received.append(message)
+
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True}, progress)
+        assert received == ['{"answer": ', '"hi"}']
+        assert json.loads(result[0].text) == {"answer": "hi"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_upstream_error_is_not_streamed(self, registry):
+        respx.post(URL).respond(status_code=400, text="Bad query")
+        received = []
+
+        async def progress(message, value, total):
+            received.append(message)
+
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True}, progress)
+        parsed = json.loads(result[0].text)
+        assert parsed["status"] == 400
+        assert parsed["message"] == "Bad query"
+        assert received == []
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_interrupted_stream_is_reported(self, registry):
+        async def body():
+            yield b"data: partial\n\n"
+            raise httpx.ReadError("connection reset")
+
+        route = respx.post(URL).mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body())
+        )
+        received = []
+
+        async def progress(message, value, total):
+            received.append(message)
+
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True}, progress)
+        parsed = json.loads(result[0].text)
+        assert parsed["status"] == 502
+        assert "after 1 chunks" in parsed["message"]
+        assert received == ["partial"]
+        assert route.call_count == 1
+        assert registry.stats()["streaming"]["interrupted"] == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_interrupted_stream_is_never_retried(self, registry):
+        async def body():
+            yield b"data: partial\n\n"
+            raise httpx.ReadError("connection reset")
+
+        route = respx.post(URL).mock(
+            side_effect=lambda request: httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=body()
+            )
+        )
+        # Even a retry profile that includes 502 must not send a partly delivered stream again
+        registry.profiles["query_agent"]["retry_statuses"] = frozenset(RETRYABLE_STATUS_CODES)
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "streaming": True})
+        assert json.loads(result[0].text)["status"] == 502
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stream_keeps_query_params(self, registry):
+        route = respx.post(URL).mock(return_value=_sse_response(["data: done\n\n"]))
+        registry.plans["query_agent"] = compile_plan({**registry.tools["query_agent"], "query_args": ["visitorId"]})
+        await registry.call_tool("query_agent", {"id": "a1", "query": "hi", "visitorId": "v1", "streaming": True})
+        request = route.calls.last.request
+        assert request.url.params["visitorId"] == "v1"
+        assert "visitorId" not in json.loads(request.content)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_non_streaming_query_is_buffered(self, registry):
+        respx.post(URL).respond(status_code=200, json={"answer": "hi"})
+        received = []
+
+        async def progress(message, value, total):
+            received.append(message)
+
+        result = await registry.call_tool("query_agent", {"id": "a1", "query": "hi"}, progress)
+        assert json.loads(result[0].text) == {"answer": "hi"}
+        assert received == []
+        assert registry.stats()["streaming"]["streams"] == 0
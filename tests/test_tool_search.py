@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from src.config import set_request_tool_profile
+from src.tools.loader import ToolRegistry
+from src.tools.tool_search import CORE_TOOLS, ToolIndex, terms
+
+
+@pytest.fixture
+def registry():
+    set_request_tool_profile(None)
+    return ToolRegistry()
+
+
+def test_terms_split_names_and_plurals():
+    assert terms("get_conversation_messages") == ["get", "conversation", "message"]
+    assert terms("customFields of a contact") == ["custom", "field", "contact"]
+    assert terms("HTTP address") == ["http", "address"]
+
+
+def test_index_ranks_names_above_descriptions():
+    index = ToolIndex(
+        {
+            "send_invoice": {"description": "Send an invoice.", "input_schema": {}},
+            "get_order": {"description": "Get an order and its invoice.", "input_schema": {}},
+            "list_orders": {
+                "description": "List orders.",
+                "input_schema": {"properties": {"invoiceId": {"type": "string"}}},
+            },
+        }
+    )
+    assert [name for name, _ in index.search("invoice")] == ["send_invoice", "list_orders", "get_order"]
+    # Prefixes match too, at half weight
+    assert [name for name, _ in index.search("invo")] == ["send_invoice", "list_orders", "get_order"]
+    assert index.search("invoice", allowed=frozenset({"get_order"}))[0][0] == "get_order"
+    assert index.search("refund") == []
+
+
+@pytest.mark.asyncio
+async def test_search_tools_returns_schemas(registry):
+    result = await registry.call_tool("search_tools", {"query": "blacklist", "limit": 3})
+    body = json.loads(result[0].text)
+    assert body["query"] == "blacklist"
+    assert len(body["tools"]) == 3
+    assert {tool["name"] for tool in body["tools"]} <= {"add_to_blacklist", "list_blacklist", "remove_from_blacklist"}
+    first = body["tools"][0]
+    assert first["inputSchema"] == registry.tools[first["name"]]["input_schema"]
+    assert first["score"] > 0
+
+
+@pytest.mark.asyncio
+async def test_search_tools_follows_request_profile(registry):
+    set_request_tool_profile("knowledge")
+    try:
+        result = await registry.call_tool("search_tools", {"query": "contact", "limit": 20})
+    finally:
+        set_request_tool_profile(None)
+    names = {tool["name"] for tool in json.loads(result[0].text)["tools"]}
+    assert names
+    assert names <= registry.visible_tools("knowledge")
+    assert "search_tools" not in names
+
+
+@pytest.mark.asyncio
+async def test_search_tools_rejects_bad_arguments(registry):
+    for arguments in ({"query": "contact", "limit": 0}, {"query": "the of"}):
+        result = await registry.call_tool("search_tools", arguments)
+        assert json.loads(result[0].text)["status"] == 400
+
+
+def test_tool_search_mode_lists_core_tools(registry):
+    full = registry.tool_catalog()
+    registry.tool_search = True
+    lazy = registry.tool_catalog()
+    assert [tool.name for tool in lazy.tools] == [
+        name for name in registry.tools | registry.local_tools if name in CORE_TOOLS
+    ]
+    assert "search_tools" in {tool.name for tool in lazy.tools}
+    assert len(lazy.encoded_result) < len(full.encoded_result) / 5
+    # Unlisted tools stay callable and searchable
+    assert registry.visible_tools(None) is None
+    assert registry.tool_index().search("zapi send text", 1)[0][0] == "zapi_send_text"
+
+
+def test_tool_index_is_cached(registry):
+    index = registry.tool_index()
+    assert registry.tool_index() is index
+    registry.refresh_tool_catalog()
+    assert registry.tool_index() is not index
@@ -0,0 +1,176 @@
+import io
+import json
+import os
+import time
+
+import httpx
+import pytest
+import respx
+
+from src.config import set_request_auth_token
+from src.tools import loader
+from src.tools.loader import ToolRegistry
+from src.tools.upload_journal import COMPLETE, PENDING, UploadJournal, journal_key
+from src.tools.uploads import _read_chunk
+
+URL = "https://api.chatvolt.ai/datasources"
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(loader, "BASE_DELAY", 0.0)
+    monkeypatch.setattr(loader.random, "uniform", lambda a, b: 0.0)
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return str(tmp_path / "journal")
+
+
+@pytest.fixture
+def document(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "UPLOAD_CHUNK_SIZE", 1024)
+    path = tmp_path / "manual.pdf"
+    path.write_bytes(b"x" * 4000)
+    return path
+
+
+def _registry(journal_dir: str) -> ToolRegistry:
+    registry = ToolRegistry()
+    registry.upload_journal = UploadJournal(journal_dir)
+    return registry
+
+
+def _entries(journal_dir: str) -> list[dict]:
+    journal = UploadJournal(journal_dir)
+    if not os.path.isdir(journal_dir):
+        return []
+    return [journal._read(name[:-5]) for name in sorted(os.listdir(journal_dir))]
+
+
+class TestUploadJournal:
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, journal_dir):
+        journal = UploadJournal(journal_dir)
+        entry = await journal.load("k", 1024)
+        assert entry["state"] == PENDING
+        entry["checksums"].append("abc")
+        await journal.save("k", entry)
+        assert (await journal.load("k", 1024))["checksums"] == ["abc"]
+        assert (await journal.load("k", 2048))["checksums"] == [], "a different chunk size starts over"
+        await journal.discard("k")
+        await journal.discard("k")
+        assert (await journal.load("k", 1024))["checksums"] == []
+
+    def test_key_depends_on_file_identity_and_token(self):
+        assert journal_key("t", "k", "/a", 1, 1) == journal_key("t", "k", "/a", 1, 1)
+        assert journal_key("t", "k", "/a", 1, 1) != journal_key("t", "k", "/a", 1, 2)
+        assert journal_key("t", "k", "/a", 1, 1) != journal_key("u", "k", "/a", 1, 1)
+        assert journal_key("t", "k", "/a", 1, 1) != journal_key("t", "other", "/a", 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_expire(self, journal_dir):
+        journal = UploadJournal(journal_dir, ttl=60)
+        for key in ("old", "new"):
+            entry = await journal.load(key, 1024)
+            entry["checksums"].append(key)
+            await journal.save(key, entry)
+        stale = time.time() - 120
+        os.utime(os.path.join(journal_dir, "old.json"), (stale, stale))
+        assert (await journal.load("old", 1024))["checksums"] == []
+        assert (await journal.load("new", 1024))["checksums"] == ["new"]
+
+        os.utime(os.path.join(journal_dir, "new.json"), (stale, stale))
+        # Sweeps run at most once per PRUNE_INTERVAL, on the next load
+        journal._pruned_at = 0.0
+        await journal.load("other", 1024)
+        assert os.listdir(journal_dir) == []
+        assert journal.pruned == 1
+
+    def test_chunk_reads_are_retried(self):
+        class Flaky(io.BytesIO):
+            failures = 2
+
+            def read(self, size=-1):
+                if self.failures:
+                    self.failures -= 1
+                    raise OSError("EIO")
+                return super().read(size)
+
+        chunk, checksum = _read_chunk(Flaky(b"abcdef"), 2, 3)
+        assert chunk == b"cde"
+        assert len(checksum) == 64
+
+
+class TestResumableDatasourceUpload:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_completed_transfer_is_not_sent_again(self, journal_dir, document, no_backoff):
+        route = respx.post(URL).mock(
+            side_effect=[
+                httpx.Response(500),
+                httpx.Response(500),
+                httpx.Response(500),
+                httpx.Response(200, json={"id": "ds1"}),
+            ]
+        )
+        args = {"datastoreId": "s1", "type": "file", "file_path": str(document)}
+
+        failed = await _registry(journal_dir).call_tool("create_datasource", args)
+        assert json.loads(failed[0].text)["status"] == 500
+        [entry] = _entries(journal_dir)
+        assert entry["state"] == PENDING
+        assert len(entry["checksums"]) == 4
+
+        done = await _registry(journal_dir).call_tool("create_datasource", args)
+        assert json.loads(done[0].text) == {"id": "ds1"}
+        assert _entries(journal_dir)[0]["state"] == COMPLETE
+        assert route.call_count == 4
+
+        # A restarted server finds the transfer in the journal, once
+        again = await _registry(journal_dir).call_tool("create_datasource", args)
+        assert json.loads(again[0].text) == {"id": "ds1"}
+        assert route.call_count == 4
+        assert _entries(journal_dir) == []
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_completed_transfer_is_scoped_to_token(self, journal_dir, document):
+        route = respx.post(URL).respond(status_code=200, json={"id": "ds1"})
+        args = {"datastoreId": "s1", "type": "file", "file_path": str(document)}
+        set_request_auth_token("token-a")
+        try:
+            await _registry(journal_dir).call_tool("create_datasource", args)
+            set_request_auth_token("token-b")
+            await _registry(journal_dir).call_tool("create_datasource", args)
+        finally:
+            set_request_auth_token(None)
+        assert route.call_count == 2
+        assert all("token" not in name for name in os.listdir(journal_dir))
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_file_changed_between_attempts(self, journal_dir, document, no_backoff):
+        def upstream(request):
+            document.write_bytes(b"y" * 4000)
+            return httpx.Response(503)
+
+        route = respx.post(URL).mock(side_effect=upstream)
+        args = {"datastoreId": "s1", "type": "file", "file_path": str(document)}
+        result = await _registry(journal_dir).call_tool("create_datasource", args)
+        parsed = json.loads(result[0].text)
+        assert parsed["status"] == 409
+        assert "changed during upload" in parsed["message"]
+        assert route.call_count == 1
+        assert _entries(journal_dir) == []
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_journal_is_off_by_default(self, document):
+        route = respx.post(URL).respond(status_code=200, json={"id": "ds1"})
+        registry = ToolRegistry()
+        assert registry.upload_journal is None
+        args = {"datastoreId": "s1", "type": "file", "file_path": str(document)}
+        await registry.call_tool("create_datasource", args)
+        await registry.call_tool("create_datasource", args)
+        assert route.call_count == 2
@@ -0,0 +1,112 @@
+import json
+
+import httpx
+import pytest
+import respx
+
+from src.tools import loader
+from src.tools.loader import ToolRegistry
+from src.tools.uploads import MultipartUpload, stat_file
+
+MEDIA_URL = "https://api.chatvolt.ai/artifacts/media/upload"
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(loader, "BASE_DELAY", 0.0)
+    monkeypatch.setattr(loader.random, "uniform", lambda a, b: 0.0)
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "logo.png"
+    path.write_bytes(bytes(range(256)) * 40)
+    return path
+
+
+class TestMultipartUpload:
+    @pytest.mark.asyncio
+    async def test_stat_file(self, image, tmp_path):
+        assert (await stat_file(str(image))).st_size == 10240
+        assert await stat_file(str(tmp_path / "missing")) is None
+        assert await stat_file(str(tmp_path)) is None
+
+    @pytest.mark.asyncio
+    async def test_body_matches_content_length_and_is_chunked(self, image):
+        upload = MultipartUpload({"name": 'a "b"', "empty": None}, str(image), 10240, chunk_size=4096)
+        chunks = [chunk async for chunk in upload]
+        body = b"".join(chunks)
+        assert len(body) == int(upload.headers["Content-Length"])
+        assert max(len(c) for c in chunks) == 4096
+        assert b'name="name"\r\n\r\na "b"\r\n' in body
+        assert b'name="empty"\r\n\r\n\r\n' in body
+        assert b'filename="logo.png"\r\nContent-Type: image/png\r\n\r\n' in body
+        assert image.read_bytes() in body
+
+    @pytest.mark.asyncio
+    async def test_can_be_iterated_again(self, image):
+        upload = MultipartUpload({}, str(image), 10240)
+        first = b"".join([chunk async for chunk in upload])
+        second = b"".join([chunk async for chunk in upload])
+        assert first == second
+
+
+class TestRegistryUploads:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_upload_streams_multipart_and_reports_progress(self, registry, image, monkeypatch):
+        monkeypatch.setattr(loader, "UPLOAD_CHUNK_SIZE", 4096)
+        route = respx.post(MEDIA_URL).respond(status_code=200, json={"id": "m1"})
+        updates = []
+
+        async def progress(message, value, total):
+            updates.append((value, total))
+
+        args = {"artifact_id": "a1", "name": "Logo", "file_path": str(image)}
+        result = await registry.call_tool("upload_artifact_media", args, progress)
+        assert json.loads(result[0].text) == {"id": "m1"}
+
+        request = route.calls.last.request
+        assert request.headers["content-type"].startswith("multipart/form-data; boundary=")
+        assert int(request.headers["content-length"]) == len(request.content)
+        assert request.headers["authorization"].startswith("Bearer ")
+        assert b'name="artifact_id"\r\n\r\na1\r\n' in request.content
+        assert image.read_bytes() in request.content
+        assert updates == [(4096, 10240), (8192, 10240), (10240, 10240)]
+        assert registry.stats()["uploads"]["bytes"] == 10240
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_datasource_file_upload(self, registry, image):
+        route = respx.post("https://api.chatvolt.ai/datasources").respond(status_code=200, json={"id": "ds1"})
+        args = {"datastoreId": "s1", "type": "file", "file_path": str(image)}
+        await registry.call_tool("create_datasource", args)
+        content = route.calls.last.request.content
+        assert b'name="datastoreId"\r\n\r\ns1\r\n' in content
+        assert b'name="fileName"\r\n\r\nlogo.png\r\n' in content
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_resends_the_whole_body(self, registry, image, no_backoff):
+        route = respx.post(MEDIA_URL).mock(side_effect=[httpx.Response(503), httpx.Response(200, json={"id": "m1"})])
+        args = {"artifact_id": "a1", "name": "Logo", "file_path": str(image)}
+        result = await registry.call_tool("upload_artifact_media", args)
+        assert json.loads(result[0].text) == {"id": "m1"}
+        assert route.call_count == 2
+        assert route.calls[0].request.content == route.calls[1].request.content
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_missing_file_is_a_structured_error(self, registry, tmp_path):
+        route = respx.post(MEDIA_URL).respond(status_code=200)
+        args = {"artifact_id": "a1", "name": "Logo", "file_path": str(tmp_path / "missing.png")}
+        result = await registry.call_tool("upload_artifact_media", args)
+        parsed = json.loads(result[0].text)
+        assert parsed["status"] == 400
+        assert "File not found" in parsed["message"]
+        assert not route.called
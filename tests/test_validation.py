@@ -0,0 +1,170 @@
+import json
+
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+from src.tools.validation import SchemaValidator, compile_check, compile_valid
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry()
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "limit": {"type": "integer", "default": 50},
+        "status": {"type": "string", "enum": ["OPEN", "CLOSED"]},
+        "filters": {
+            "type": "object",
+            "properties": {
+                "ids": {"type": "array", "items": {"type": "string"}},
+                "strict": {"type": "boolean", "default": False},
+            },
+            "required": ["ids"],
+        },
+        "rows": {"type": "array", "items": {"type": "object", "properties": {"n": {"type": "number", "default": 1}}}},
+    },
+    "required": ["id"],
+}
+
+# Values of every JSON type, plus booleans and integers that pass for each other in Python
+WRONG_VALUES = (None, True, 0, 1.5, "x", [], [1], {}, {"a": 1})
+SAMPLES = {"string": "s", "integer": 1, "number": 1.5, "boolean": True, "array": [], "object": {}, "null": None}
+
+
+def _sample(schema: dict) -> object:
+    """A value that matches `schema`, with every declared property present."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "default" in schema:
+        return schema["default"]
+    types = schema.get("type")
+    kind = types[0] if isinstance(types, list) else types
+    if kind == "object":
+        return {name: _sample(prop) for name, prop in schema.get("properties", {}).items()}
+    if kind == "array" and isinstance(schema.get("items"), dict):
+        return [_sample(schema["items"])]
+    return SAMPLES.get(kind, "s")
+
+
+def _variants(schema: dict, depth: int = 3):
+    """The sample value of `schema`, plus copies with one part replaced, removed or of the wrong type."""
+    sample = _sample(schema)
+    yield sample
+    yield from WRONG_VALUES
+    if "enum" in schema:
+        yield "not-in-enum"
+    if depth == 0:
+        return
+    if isinstance(sample, dict):
+        for name in schema.get("required", ()):
+            yield {key: value for key, value in sample.items() if key != name}
+        for name, prop in schema.get("properties", {}).items():
+            for value in _variants(prop, depth - 1):
+                yield {**sample, name: value}
+    elif isinstance(schema.get("items"), dict):
+        for value in _variants(schema["items"], depth - 1):
+            yield [value]
+
+
+class TestSchemaValidator:
+    def test_valid(self):
+        assert SchemaValidator(SCHEMA).errors({"id": "a", "filters": {"ids": ["x"]}, "rows": [{"n": 2.5}]}) is None
+
+    def test_top_level(self):
+        errors = SchemaValidator(SCHEMA).errors({"limit": "10", "status": "DONE"})
+        assert errors == [
+            "Missing required field: id",
+            "Field 'limit' must be an integer",
+            "Field 'status' must be one of: OPEN, CLOSED",
+        ]
+
+    def test_nested(self):
+        validator = SchemaValidator(SCHEMA)
+        assert validator.errors({"id": "a", "filters": {"ids": ["x", 2]}}) == [
+            "Field 'filters.ids[1]' must be a string"
+        ]
+        assert validator.errors({"id": "a", "filters": {}}) == ["Missing required field: filters.ids"]
+        assert validator.errors({"id": "a", "filters": []}) == ["Field 'filters' must be an object"]
+        assert validator.errors({"id": "a", "rows": [{"n": "1"}]}) == ["Field 'rows[0].n' must be a number"]
+
+    def test_booleans_are_not_numbers(self):
+        assert SchemaValidator(SCHEMA).errors({"id": "a", "limit": True}) == ["Field 'limit' must be an integer"]
+
+    def test_defaults(self):
+        validator = SchemaValidator(SCHEMA)
+        arguments = {"id": "a", "filters": {"ids": []}, "rows": [{}, {"n": 3}]}
+        filled = validator.with_defaults(arguments)
+        assert filled == {
+            "id": "a",
+            "limit": 50,
+            "filters": {"ids": [], "strict": False},
+            "rows": [{"n": 1}, {"n": 3}],
+        }
+        assert arguments == {"id": "a", "filters": {"ids": []}, "rows": [{}, {"n": 3}]}
+        complete = {"id": "a", "limit": 1}
+        assert validator.with_defaults(complete) is complete
+
+    def test_schema_without_constraints(self):
+        validator = SchemaValidator({"type": "object", "properties": {"data": {"type": "file"}}})
+        assert validator.errors({"data": 1}) is None
+        assert validator.with_defaults({}) == {}
+
+    def test_invalid_default_fails_at_compile_time(self):
+        with pytest.raises(ValueError, match="limit"):
+            SchemaValidator({"type": "object", "properties": {"limit": {"type": "integer", "default": "50"}}})
+
+
+class TestRegistryValidation:
+    def test_every_schema_compiles(self, registry):
+        assert set(registry.validators) == set(registry.tools) | set(registry.local_tools)
+
+    def test_fast_path_agrees_with_messages(self, registry):
+        for name, info in (registry.tools | registry.local_tools).items():
+            schema = info.get("input_schema", {})
+            valid, check = compile_valid(schema), compile_check(schema)
+            assert (valid is None) == (check is None), name
+            for value in _variants(schema):
+                errors: list[str] = []
+                if check is not None:
+                    check(value, "", errors)
+                assert (valid is None or valid(value)) == (not errors), (name, value, errors)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_bad_nested_input_is_rejected_locally(self, registry):
+        route = respx.post("https://api.chatvolt.ai/agents/a1/query").respond(status_code=200, json={})
+        result = await registry.call_tool(
+            "query_agent", {"id": "a1", "query": "hi", "filters": {"custom_ids": "c1"}, "contact": {"email": 5}}
+        )
+        parsed = json.loads(result[0].text)
+        assert parsed["status"] == 400
+        assert parsed["message"] == [
+            "Field 'contact.email' must be a string",
+            "Field 'filters.custom_ids' must be an array",
+        ]
+        assert not route.called
+
+    @pytest.mark.asyncio
+    async def test_enum_is_rejected_locally(self, registry):
+        result = await registry.call_tool("toggle_webhook", {"id": "a1", "type": "sms", "enabled": True})
+        assert "must be one of" in json.loads(result[0].text)["message"][0]
+
+    @pytest.mark.asyncio
+    async def test_local_tools_get_defaults(self, registry):
+        seen = {}
+
+        async def handler(registry, arguments, progress):
+            seen.update(arguments)
+            return True, "{}"
+
+        registry.local_tools = {**registry.local_tools, "probe": {"handler": handler}}
+        registry.validators["probe"] = SchemaValidator(
+            {"type": "object", "properties": {"size": {"type": "integer", "default": 3}}}
+        )
+        await registry.call_tool("probe", {})
+        assert seen == {"size": 3}
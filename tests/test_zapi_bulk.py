@@ -0,0 +1,151 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import respx
+
+from src.tools.loader import ToolRegistry
+
+SEND_URL = r"https://api.chatvolt.ai/zapi/i1/send-(?P<kind>text|media|template)"
+
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry()
+    registry.send_rates.rate = 0
+    return registry
+
+
+def _texts(*pairs):
+    return [{"phone": phone, "message": message} for phone, message in pairs]
+
+
+class TestZapiBulkSend:
+    def test_is_listed(self, registry):
+        tools = {tool.name: tool for tool in registry.get_tool_list()}
+        assert tools["zapi_bulk_send"].inputSchema["required"] == ["instanceId", "messages"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_order_per_recipient(self, registry):
+        sent = []
+
+        async def upstream(request, kind):
+            body = json.loads(request.content)
+            # The first recipient is slow, so the other one finishes first
+            await asyncio.sleep(0.02 if body["phone"] == "1" else 0)
+            sent.append((body["phone"], body["message"]))
+            return httpx.Response(200, json={"messageId": body["message"]})
+
+        respx.post(url__regex=SEND_URL).mock(side_effect=upstream)
+        messages = _texts(("1", "a1"), ("2", "b1"), ("1", "a2"), ("2", "b2"), ("1", "a3"))
+        parsed = json.loads(
+            (await registry.call_tool("zapi_bulk_send", {"instanceId": "i1", "messages": messages}))[0].text
+        )
+
+        assert [message for phone, message in sent if phone == "1"] == ["a1", "a2", "a3"]
+        assert [message for phone, message in sent if phone == "2"] == ["b1", "b2"]
+        assert sent.index(("2", "b2")) < sent.index(("1", "a2"))
+        assert [item["result"]["messageId"] for item in parsed["results"]] == ["a1", "b1", "a2", "b2", "a3"]
+        assert parsed["sent"] == 5
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_mixed_tools(self, registry):
+        route = respx.post(url__regex=SEND_URL).mock(
+            side_effect=lambda request, kind: httpx.Response(200, json={"kind": kind})
+        )
+        messages = [
+            {"phone": "1", "message": "hi"},
+            {"phone": "1", "tool": "zapi_send_media", "mediaUrl": "https://x/y.png", "mediaType": "image"},
+            {"phone": "2", "tool": "zapi_send_template", "templateName": "welcome"},
+        ]
+        parsed = json.loads(
+            (await registry.call_tool("zapi_bulk_send", {"instanceId": "i1", "messages": messages}))[0].text
+        )
+        assert [item["result"]["kind"] for item in parsed["results"]] == ["text", "media", "template"]
+        assert "tool" not in json.loads(route.calls[1].request.content)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failure_skips_rest_of_recipient(self, registry):
+        respx.post(url__regex=SEND_URL).mock(
+            side_effect=lambda request, kind: httpx.Response(
+                400 if json.loads(request.content)["message"] == "bad" else 200, json={}
+            )
+        )
+        messages = _texts(("1", "bad"), ("1", "never"), ("2", "ok")) + [{"phone": "3"}]
+        parsed = json.loads(
+            (await registry.call_tool("zapi_bulk_send", {"instanceId": "i1", "messages": messages}))[0].text
+        )
+        results = parsed["results"]
+        assert results[0]["result"]["status"] == 400
+        assert results[1] == {"index": 1, "phone": "1", "ok": False, "result": None}
+        assert results[2]["ok"] is True
+        assert "message" in results[3]["result"]["message"][0]
+        assert (parsed["sent"], parsed["failed"], parsed["skipped"]) == (1, 2, 1)
+
+        parsed = json.loads(
+            (
+                await registry.call_tool(
+                    "zapi_bulk_send", {"instanceId": "i1", "messages": messages[:2], "stop_on_error": False}
+                )
+            )[0].text
+        )
+        assert parsed["results"][1]["ok"] is True
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_instance_rate(self, registry):
+        respx.post(url__regex=SEND_URL).respond(status_code=200, json={})
+        messages = _texts(*((str(i), "hi") for i in range(6)))
+        started = time.monotonic()
+        await registry.call_tool(
+            "zapi_bulk_send", {"instanceId": "i1", "messages": messages, "messages_per_second": 50}
+        )
+        # One token up front, then five refills at 50/s
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rate_override_is_per_call_and_capped(self, registry):
+        respx.post(url__regex=SEND_URL).respond(status_code=200, json={})
+        registry.send_rates.rate = 20
+        await registry.call_tool(
+            "zapi_bulk_send", {"instanceId": "i1", "messages": _texts(("1", "a")), "messages_per_second": 1000}
+        )
+        # The shared instance bucket keeps the configured rate
+        assert registry.send_rates.bucket("i1").rate == 20
+
+        started = time.monotonic()
+        await registry.call_tool(
+            "zapi_bulk_send",
+            {"instanceId": "i1", "messages": _texts(*((str(i), "hi") for i in range(3))), "messages_per_second": 1000},
+        )
+        # A higher override is capped at 20/s: two refills after the first token
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_rate(self, registry):
+        for rate in (0, -1):
+            result = await registry.call_tool(
+                "zapi_bulk_send", {"instanceId": "i1", "messages": _texts(("1", "a")), "messages_per_second": rate}
+            )
+            assert json.loads(result[0].text)["status"] == 400
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_progress_per_delivery(self, registry):
+        respx.post(url__regex=SEND_URL).respond(status_code=200, json={})
+        updates = []
+
+        async def progress(message, value, total):
+            updates.append((message, value, total))
+
+        await registry.call_tool(
+            "zapi_bulk_send", {"instanceId": "i1", "messages": _texts(("1", "a"), ("2", "b"))}, progress
+        )
+        assert [(value, total) for _, value, total in updates] == [(1, 2), (2, 2)]
+        assert "sent" in updates[0][0]